@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Attribute the size of an exported Godot build to the resources inside it.
+
+Reads the `.pck` directory straight out of a memory-mapped file (standalone
+`.pck`, or a PCK embedded at the end of an executable). For Web exports,
+point it at the output directory to also break down the `.wasm` sections
+and the other bundle files.
+
+Usage:
+    python analyze_pck.py ./build/index.pck
+    python analyze_pck.py ./build --top 30
+    python analyze_pck.py ./build --save size-report.json
+    python analyze_pck.py ./build --compare previous-size-report.json
+"""
+
+import argparse
+import json
+import mmap
+import re
+import struct
+import sys
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PCK_MAGIC = 0x43504447  # "GDPC"
+PACK_DIR_ENCRYPTED = 1
+PACK_REL_FILEBASE = 2
+PACK_FILE_ENCRYPTED = 1
+PACK_FILE_REMOVAL = 2
+
+# First bytes of a packed file -> what it is and how it is stored
+RESOURCE_COMPRESSION = {0: "fastlz", 1: "deflate", 2: "zstd", 3: "gzip", 4: "brotli"}
+TEXTURE_FORMATS = {0: "image", 1: "png", 2: "webp", 3: "basisu"}
+TEXT_SUFFIXES = (".tscn", ".tres", ".gd", ".gdshader", ".cfg", ".import", ".remap", ".json", ".txt")
+
+WASM_SECTIONS = {
+    0: "custom", 1: "type", 2: "import", 3: "function", 4: "table",
+    5: "memory", 6: "global", 7: "export", 8: "start", 9: "element",
+    10: "code", 11: "data", 12: "datacount",
+}
+
+# .godot/imported/<source name>-<md5>.<ext>
+IMPORTED_NAME = re.compile(r"^(?P<source>.+)-[0-9a-f]{32}\.(?P<ext>[^.]+)$")
+IMPORT_DEST = re.compile(r'^(?:path|path\.\w+)="(res://[^"]+)"', re.MULTILINE)
+IMPORT_SOURCE = re.compile(r'^source_file="(res://[^"]+)"', re.MULTILINE)
+
+
+@dataclass
+class PackedFile:
+    path: str
+    size: int
+    storage: str
+    source: str
+    type: str
+
+
+@dataclass
+class PackInfo:
+    format_version: int
+    godot_version: str
+    offset: int
+    size: int
+    files: List[PackedFile]
+
+
+def _read_string(buf, offset: int) -> tuple[str, int]:
+    (length,) = struct.unpack_from("<I", buf, offset)
+    offset += 4
+    raw = bytes(buf[offset:offset + length])
+    return raw.rstrip(b"\0").decode("utf-8", errors="replace"), offset + length
+
+
+def find_pack_start(buf) -> int:
+    """Offset of the PCK header: 0 for a .pck, or the embedded pack in an executable."""
+    if len(buf) >= 4 and struct.unpack_from("<I", buf, 0)[0] == PCK_MAGIC:
+        return 0
+    # Embedded packs end with <u64 pack size><"GDPC">
+    if len(buf) >= 12 and struct.unpack_from("<I", buf, len(buf) - 4)[0] == PCK_MAGIC:
+        (pack_size,) = struct.unpack_from("<Q", buf, len(buf) - 12)
+        start = len(buf) - 12 - pack_size
+        if start >= 0 and struct.unpack_from("<I", buf, start)[0] == PCK_MAGIC:
+            return start
+    raise ValueError("no Godot PCK header found")
+
+
+def describe_storage(path: str, head: bytes, flags: int) -> str:
+    """Classify how a packed file is stored from its first bytes."""
+    if flags & PACK_FILE_ENCRYPTED:
+        return "encrypted"
+    if head[:4] == b"RSCC" and len(head) >= 8:
+        mode = struct.unpack_from("<I", head, 4)[0]
+        return f"resource/{RESOURCE_COMPRESSION.get(mode, mode)}"
+    if head[:4] == b"RSRC":
+        return "resource/uncompressed"
+    if head[:4] == b"GST2" and len(head) >= 40:
+        data_format = struct.unpack_from("<I", head, 36)[0]
+        return f"texture/{TEXTURE_FORMATS.get(data_format, data_format)}"
+    if head[:4] in (b"GDST", b"GDS3"):
+        return "texture/v3"
+    if head[:4] == b"OggS":
+        return "ogg"
+    if head[:4] == b"GDSC":
+        return "gdscript/binary"
+    if path.endswith(TEXT_SUFFIXES):
+        return "text"
+    return "raw"
+
+
+def attribute_sources(entries: List[tuple], buf) -> Dict[str, str]:
+    """
+    Map imported artifacts (.godot/imported/...) back to their source assets.
+
+    Uses the `.import` remap files shipped in the pack, falling back to the
+    `<source>-<md5>.<ext>` naming convention.
+    """
+    sources = {}
+    for path, offset, size, _ in entries:
+        if path.endswith(".import") and size < 65536:
+            text = bytes(buf[offset:offset + size]).decode("utf-8", errors="replace")
+            source = IMPORT_SOURCE.search(text)
+            source_path = source.group(1)[6:] if source else path[:-len(".import")]
+            for dest in IMPORT_DEST.findall(text):
+                sources[dest[6:]] = source_path
+    return sources
+
+
+def read_pack(path: Path) -> PackInfo:
+    """Parse the PCK directory of a .pck or executable via mmap."""
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        start = find_pack_start(buf)
+        _, version, major, minor, patch = struct.unpack_from("<5I", buf, start)
+        offset = start + 20
+        pack_flags, file_base, dir_offset = 0, 0, 0
+        if version >= 2:
+            pack_flags, file_base = struct.unpack_from("<IQ", buf, offset)
+            offset += 12
+        if version >= 3:
+            # Godot 4.4+ writes the directory after the file data
+            (dir_offset,) = struct.unpack_from("<Q", buf, offset)
+            offset += 8
+        if pack_flags & PACK_REL_FILEBASE:
+            file_base += start
+            dir_offset += start
+        offset += 16 * 4  # reserved
+        if version >= 3:
+            offset = dir_offset
+        if pack_flags & PACK_DIR_ENCRYPTED:
+            raise ValueError("pack directory is encrypted")
+
+        (file_count,) = struct.unpack_from("<I", buf, offset)
+        offset += 4
+        entries = []
+        for _ in range(file_count):
+            name, offset = _read_string(buf, offset)
+            file_offset, size = struct.unpack_from("<QQ", buf, offset)
+            offset += 16 + 16  # offset, size, md5
+            flags = 0
+            if version >= 2:
+                (flags,) = struct.unpack_from("<I", buf, offset)
+                offset += 4
+            if flags & PACK_FILE_REMOVAL:
+                continue
+            name = name[6:] if name.startswith("res://") else name
+            entries.append((name, file_base + file_offset, size, flags))
+
+        sources = attribute_sources(entries, buf)
+        files = []
+        for name, file_offset, size, flags in entries:
+            head = bytes(buf[file_offset:file_offset + 40])
+            source = sources.get(name)
+            if source is None:
+                match = IMPORTED_NAME.match(name.rsplit("/", 1)[-1])
+                source = match.group("source") if match and name.startswith(".godot/") else name
+            suffix = Path(source).suffix.lstrip(".").lower() or "(none)"
+            files.append(PackedFile(name, size, describe_storage(name, head, flags), source, suffix))
+
+        pack_size = len(buf) - start
+    return PackInfo(version, f"{major}.{minor}.{patch}", start, pack_size, files)
+
+
+def wasm_sections(path: Path) -> Dict[str, int]:
+    """Byte size per WebAssembly section (custom sections by name)."""
+    sizes = defaultdict(int)
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        if buf[:4] != b"\0asm":
+            raise ValueError(f"not a WebAssembly module: {path}")
+        offset = 8
+        while offset < len(buf):
+            section_id = buf[offset]
+            length, offset = _read_leb128(buf, offset + 1)
+            name = WASM_SECTIONS.get(section_id, str(section_id))
+            if section_id == 0:
+                name_len, name_offset = _read_leb128(buf, offset)
+                name = "custom:" + bytes(buf[name_offset:name_offset + name_len]).decode(errors="replace")
+            sizes[name] += length
+            offset += length
+    return dict(sizes)
+
+
+def _read_leb128(buf, offset: int) -> tuple[int, int]:
+    result, shift = 0, 0
+    while True:
+        byte = buf[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
+
+def gzip_size(path: Path) -> int:
+    """Approximate transfer size with HTTP gzip (deflate level 6)."""
+    compressor = zlib.compressobj(6)
+    total = 0
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            total += len(compressor.compress(chunk))
+    return total + len(compressor.flush())
+
+
+def analyze(path: Path, transfer: bool = False) -> dict:
+    """
+    Build a size report for a .pck, an executable, or a Web export directory.
+
+    Args:
+        path: Pack file, executable with embedded pack, or export directory
+        transfer: Also estimate gzip transfer size of each bundle file
+
+    Returns:
+        Report dict (bundle files, pack resources, wasm sections)
+    """
+    report = {"bundle": {}, "pack": None, "resources": {}, "wasm": {}}
+    if path.is_dir():
+        candidates = sorted(p for p in path.iterdir() if p.is_file())
+    else:
+        candidates = [path]
+
+    for candidate in candidates:
+        entry = {"size": candidate.stat().st_size}
+        if transfer:
+            entry["gzip"] = gzip_size(candidate)
+        report["bundle"][candidate.name] = entry
+
+        if candidate.suffix == ".wasm":
+            report["wasm"] = wasm_sections(candidate)
+            continue
+        if report["pack"] is not None or (path.is_dir() and candidate.suffix != ".pck"):
+            continue
+        try:
+            pack = read_pack(candidate)
+        except ValueError:
+            continue
+        report["pack"] = {
+            "file": candidate.name,
+            "format_version": pack.format_version,
+            "godot_version": pack.godot_version,
+            "offset": pack.offset,
+            "size": pack.size,
+        }
+        report["resources"] = {f.path: asdict(f) for f in pack.files}
+
+    return report
+
+
+def group_sizes(resources: dict, key: str, depth: int = 2) -> List[tuple]:
+    """Total size and count per directory (first `depth` levels of the source) or type."""
+    totals = defaultdict(lambda: [0, 0])
+    for entry in resources.values():
+        if key == "directory":
+            parts = entry["source"].split("/")[:-1]
+            group = "/".join(parts[:depth]) or "."
+        else:
+            group = entry[key]
+        totals[group][0] += entry["size"]
+        totals[group][1] += 1
+    return sorted(((g, s, c) for g, (s, c) in totals.items()), key=lambda t: -t[1])
+
+
+def diff_reports(old: dict, new: dict) -> dict:
+    """Per-resource and per-bundle-file size changes between two reports."""
+    def changes(before: dict, after: dict) -> List[tuple]:
+        rows = []
+        for name in before.keys() | after.keys():
+            old_size = before.get(name, {}).get("size", 0)
+            new_size = after.get(name, {}).get("size", 0)
+            if old_size != new_size:
+                status = "added" if name not in before else "removed" if name not in after else "changed"
+                rows.append((name, old_size, new_size, status))
+        return sorted(rows, key=lambda r: -abs(r[2] - r[1]))
+
+    return {
+        "bundle": changes(old.get("bundle", {}), new.get("bundle", {})),
+        "resources": changes(old.get("resources", {}), new.get("resources", {})),
+    }
+
+
+def _mb(size: int) -> str:
+    if abs(size) >= 1024 * 1024:
+        return f"{size / 1024 / 1024:8.2f} MB"
+    return f"{size / 1024:8.1f} KB"
+
+
+def format_report(report: dict, top: int = 20, depth: int = 2, diff: Optional[dict] = None) -> str:
+    """Format bundle, pack, per-resource and grouped sizes (and a diff) as text."""
+    lines = []
+    lines.append("=" * 60)
+    lines.append("BUILD SIZE REPORT")
+    lines.append("=" * 60)
+
+    for name, entry in sorted(report["bundle"].items(), key=lambda kv: -kv[1]["size"]):
+        gzip_note = f"  (gzip {_mb(entry['gzip']).strip()})" if "gzip" in entry else ""
+        lines.append(f"{_mb(entry['size'])}  {name}{gzip_note}")
+
+    if report["wasm"]:
+        lines.append("")
+        lines.append("WASM SECTIONS:")
+        for name, size in sorted(report["wasm"].items(), key=lambda kv: -kv[1]):
+            lines.append(f"  {_mb(size)}  {name}")
+
+    resources = report["resources"]
+    if report["pack"]:
+        pack = report["pack"]
+        lines.append("")
+        lines.append(
+            f"PACK {pack['file']}: {len(resources)} files, {_mb(pack['size']).strip()} "
+            f"(format v{pack['format_version']}, Godot {pack['godot_version']})"
+        )
+        lines.append("")
+        lines.append(f"LARGEST RESOURCES (top {top}):")
+        for entry in sorted(resources.values(), key=lambda e: -e["size"])[:top]:
+            source = f"  <- {entry['source']}" if entry["source"] != entry["path"] else ""
+            lines.append(f"  {_mb(entry['size'])}  {entry['storage']:22} {entry['path']}{source}")
+        for title, key in (("BY DIRECTORY", "directory"), ("BY TYPE", "type"), ("BY STORAGE", "storage")):
+            lines.append("")
+            lines.append(f"{title}:")
+            for group, size, count in group_sizes(resources, key, depth)[:top]:
+                lines.append(f"  {_mb(size)}  {count:6d}  {group}")
+
+    if diff is not None:
+        lines.append("")
+        lines.append("CHANGES VS PREVIOUS BUILD:")
+        for title in ("bundle", "resources"):
+            rows = diff[title]
+            delta = sum(new - old for _, old, new, _ in rows)
+            lines.append(f"  {title}: {len(rows)} changed, {'+' if delta >= 0 else '-'}{_mb(abs(delta)).strip()}")
+            for name, old, new, status in rows[:top]:
+                sign = "+" if new >= old else "-"
+                lines.append(f"    {sign}{_mb(abs(new - old)).strip():>11}  {status:8} {name}")
+
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Attribute exported build size to packed resources",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s ./build/index.pck
+  %(prog)s ./build --transfer
+  %(prog)s ./dist/game.x86_64 --top 50 --depth 3
+  %(prog)s ./build --save size-report.json
+  %(prog)s ./build --compare previous-size-report.json
+  %(prog)s ./build --compare ./previous-build
+        """
+    )
+
+    parser.add_argument(
+        "build",
+        help=".pck file, executable with embedded pack, or Web export directory"
+    )
+    parser.add_argument(
+        "--top", "-n",
+        type=int,
+        default=20,
+        help="Rows per table (default: 20)"
+    )
+    parser.add_argument(
+        "--depth", "-d",
+        type=int,
+        default=2,
+        help="Directory levels used for grouping (default: 2)"
+    )
+    parser.add_argument(
+        "--transfer",
+        action="store_true",
+        help="Estimate gzip transfer size of each bundle file"
+    )
+    parser.add_argument(
+        "--compare", "-c",
+        help="Previous report JSON (from --save) or previous build to diff against"
+    )
+    parser.add_argument(
+        "--save", "-s",
+        help="Write this report as JSON for later --compare"
+    )
+    parser.add_argument(
+        "--format", "-f",
+        choices=["summary", "json"],
+        default="summary",
+        help="Output format (default: summary)"
+    )
+
+    args = parser.parse_args()
+
+    build_path = Path(args.build)
+    if not build_path.exists():
+        print(f"ERROR: Build not found: {build_path}")
+        sys.exit(1)
+
+    try:
+        report = analyze(build_path, args.transfer)
+    except ValueError as exc:
+        print(f"ERROR: {exc}")
+        sys.exit(1)
+
+    if report["pack"] is None and not report["wasm"]:
+        print(f"ERROR: No Godot pack found in: {build_path}")
+        sys.exit(1)
+
+    diff = None
+    if args.compare:
+        compare_path = Path(args.compare)
+        if not compare_path.exists():
+            print(f"ERROR: Previous build not found: {compare_path}")
+            sys.exit(1)
+        if compare_path.suffix == ".json":
+            previous = json.loads(compare_path.read_text())
+        else:
+            previous = analyze(compare_path, args.transfer)
+        diff = diff_reports(previous, report)
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+        print(f"Report saved to {args.save}")
+
+    if args.format == "json":
+        print(json.dumps({**report, "diff": diff}, indent=2))
+    else:
+        print(format_report(report, args.top, args.depth, diff))
+
+
+if __name__ == "__main__":
+    main()
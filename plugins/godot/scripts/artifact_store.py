@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Content-addressed local store for exported builds.
+
+Each file of a build is stored once under its SHA-256 (as a reflink or copy),
+and every build gets a small JSON manifest. Identical `.wasm`,
+template and asset files shared by presets, branches and nightlies take disk
+space only once, and any stored build can be materialized again in seconds.
+
+Usage:
+    python artifact_store.py add ./build --store ~/.godot-builds --label web-main
+    python artifact_store.py list --store ~/.godot-builds
+    python artifact_store.py materialize web-main-20250101-120000 ./restored --store ~/.godot-builds
+    python artifact_store.py gc --store ~/.godot-builds --keep 5 --max-age-days 30
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import stat
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from project_index import scan_tree
+
+FICLONE = 0x40049409  # linux/fs.h _IOW(0x94, 9, int)
+CHUNK_SIZE = 1 << 20
+# Characters kept in build ids, which name the manifest file
+UNSAFE_ID_CHARS = re.compile(r"[^\w.-]+")
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file, read in 1 MB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def reflink(src: Path, dst: Path):
+    """Copy-on-write clone (btrfs, XFS, bcachefs); raises OSError if unsupported."""
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        raise OSError("reflink is not supported on this platform")
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            dst.unlink()
+            raise
+
+
+def safe_build_id(name: str) -> str:
+    """Turn a label or id into a manifest file name ("Linux/X11" -> "Linux_X11")."""
+    return UNSAFE_ID_CHARS.sub("_", name).strip(".") or "build"
+
+
+def place(src: Path, dst: Path, mode: str, hardlink: bool = True) -> str:
+    """
+    Put src's content at dst without rewriting it if possible.
+
+    Args:
+        src: Existing file
+        dst: New path (must not exist)
+        mode: "auto" (reflink, then hardlink, then copy), "reflink", "hardlink" or "copy"
+        hardlink: Allow hardlinks; when False they are replaced by copies
+
+    Returns:
+        The method that was used
+    """
+    order = {"auto": ["reflink", "hardlink", "copy"]}.get(mode, [mode])
+    if not hardlink:
+        order = [method for method in order if method != "hardlink"] or ["copy"]
+    for method in order:
+        try:
+            if method == "reflink":
+                reflink(src, dst)
+            elif method == "hardlink":
+                os.link(src, dst)
+            else:
+                shutil.copyfile(src, dst)
+            return method
+        except OSError:
+            if method == order[-1]:
+                raise
+    return order[-1]
+
+
+class ArtifactStore:
+    """Objects under objects/<2>/<62>, one manifest per build under builds/."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root).expanduser().resolve()
+        self.objects = self.root / "objects"
+        self.builds = self.root / "builds"
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest[2:]
+
+    def _write_json(self, path: Path, data: dict):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+        os.replace(tmp, path)
+
+    def _ingest(self, path: Path, digest: str, mode: str) -> bool:
+        """Store path's content under digest; returns True if it was new."""
+        target = self.object_path(digest)
+        if target.exists():
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        # Never hardlinked: a later in-place rewrite of the build output would
+        # silently change the stored object for every build that uses it
+        place(path, tmp, mode, hardlink=False)
+        os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        os.replace(tmp, target)
+        return True
+
+    def add(
+        self,
+        build_dir: Path,
+        label: str,
+        build_id: Optional[str] = None,
+        mode: str = "auto",
+        jobs: int = 0,
+        metadata: Optional[dict] = None,
+    ) -> dict:
+        """
+        Hash and store every file of a build; write its manifest.
+
+        Args:
+            build_dir: Export output directory (or a single exported file)
+            label: Build family used for retention, e.g. preset or branch
+            build_id: Manifest name (default: <label>-<UTC timestamp>), made
+                file-name safe like the label
+            mode: Object placement mode (see place()); hardlinks become copies
+            jobs: Hashing threads (default: CPU count)
+            metadata: Extra fields recorded in the manifest
+
+        Returns:
+            The manifest, plus "new_objects"/"new_bytes" stats
+        """
+        build_dir = Path(build_dir).resolve()
+        if build_dir.is_file():
+            entries = {build_dir.name: (build_dir.stat().st_size, 0)}
+            build_dir = build_dir.parent
+        else:
+            entries = scan_tree(build_dir, ignored_dirs=(), honor_gdignore=False)
+
+        rel_paths = sorted(entries)
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            digests = list(pool.map(lambda rel: hash_file(build_dir / rel), rel_paths))
+
+        files = {}
+        new_objects = new_bytes = 0
+        for rel, digest in zip(rel_paths, digests):
+            path = build_dir / rel
+            executable = bool(path.stat().st_mode & stat.S_IXUSR)
+            if self._ingest(path, digest, mode):
+                new_objects += 1
+                new_bytes += entries[rel][0]
+            files[rel] = {
+                "sha256": digest,
+                "size": entries[rel][0],
+                "executable": executable,
+            }
+
+        build_id = safe_build_id(
+            build_id or f"{label}-{time.strftime('%Y%m%d-%H%M%S', time.gmtime())}"
+        )
+        manifest = {
+            "id": build_id,
+            "label": label,
+            "created": time.time(),
+            "files": files,
+            **(metadata or {}),
+        }
+        self._write_json(self.builds / f"{build_id}.json", manifest)
+        return {**manifest, "new_objects": new_objects, "new_bytes": new_bytes}
+
+    def manifests(self) -> List[dict]:
+        """All build manifests, newest first."""
+        found = []
+        for path in self.builds.glob("*.json"):
+            try:
+                found.append(json.loads(path.read_text()))
+            except ValueError:
+                continue
+        return sorted(found, key=lambda m: -m["created"])
+
+    def load(self, build_id: str) -> dict:
+        path = self.builds / f"{build_id}.json"
+        if not path.exists():
+            raise KeyError(build_id)
+        return json.loads(path.read_text())
+
+    def materialize(self, build_id: str, dest: Path, mode: str = "auto") -> int:
+        """
+        Recreate a stored build at dest; returns the number of files placed.
+
+        Files are linked or cloned from the store, so this costs metadata
+        operations rather than copying bytes whenever the filesystem allows.
+        """
+        manifest = self.load(build_id)
+        dest = Path(dest)
+        for rel, entry in manifest["files"].items():
+            target = dest / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if target.exists() or target.is_symlink():
+                target.unlink()
+            source = self.object_path(entry["sha256"])
+            method = place(source, target, mode)
+            if entry.get("executable"):
+                if method == "hardlink":
+                    # chmod on a link would change the object and every other link
+                    target.unlink()
+                    shutil.copyfile(source, target)
+                os.chmod(target, os.stat(target).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        return len(manifest["files"])
+
+    def gc(
+        self,
+        keep: int = 0,
+        max_age_days: float = 0,
+        dry_run: bool = False,
+    ) -> dict:
+        """
+        Drop builds outside retention, then delete unreferenced objects.
+
+        A build is kept if it is among the `keep` newest of its label, or
+        younger than `max_age_days` (either rule is disabled when 0).
+
+        Returns:
+            Removed build ids plus deleted object count and bytes
+        """
+        now = time.time()
+        per_label = {}
+        removed = []
+        live = set()
+        for manifest in self.manifests():
+            rank = per_label.setdefault(manifest["label"], 0)
+            per_label[manifest["label"]] += 1
+            keep_by_count = keep and rank < keep
+            keep_by_age = max_age_days and now - manifest["created"] < max_age_days * 86400
+            if keep_by_count or keep_by_age or not (keep or max_age_days):
+                live.update(entry["sha256"] for entry in manifest["files"].values())
+            else:
+                removed.append(manifest["id"])
+                if not dry_run:
+                    (self.builds / f"{manifest['id']}.json").unlink()
+
+        deleted = freed = 0
+        for bucket in self.objects.glob("??"):
+            for obj in bucket.iterdir():
+                if bucket.name + obj.name in live:
+                    continue
+                deleted += 1
+                freed += obj.stat().st_size
+                if not dry_run:
+                    obj.unlink()
+        return {"removed_builds": removed, "deleted_objects": deleted, "freed_bytes": freed}
+
+    def stats(self) -> Dict[str, dict]:
+        """Per-build logical size and bytes no other build shares."""
+        manifests = self.manifests()
+        refs = {}
+        for manifest in manifests:
+            for entry in manifest["files"].values():
+                refs.setdefault(entry["sha256"], set()).add(manifest["id"])
+        result = {}
+        for manifest in manifests:
+            files = manifest["files"].values()
+            result[manifest["id"]] = {
+                "label": manifest["label"],
+                "created": manifest["created"],
+                "files": len(manifest["files"]),
+                "size": sum(e["size"] for e in files),
+                "unique": sum(e["size"] for e in files if refs[e["sha256"]] == {manifest["id"]}),
+            }
+        return result
+
+
+def _mb(size: int) -> str:
+    return f"{size / 1024 / 1024:.2f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Content-addressed store for exported Godot builds",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s add ./build --store ~/.godot-builds --label web-main
+  %(prog)s list --store ~/.godot-builds
+  %(prog)s materialize web-main-20250101-120000 ./restored --store ~/.godot-builds
+  %(prog)s gc --store ~/.godot-builds --keep 5 --max-age-days 30 --dry-run
+
+Objects are always cloned or copied in, never hardlinked to the build
+output, and are read-only. Materialized files may be hardlinks to objects,
+so never edit them in place.
+        """
+    )
+    parser.add_argument(
+        "--store", "-s",
+        default=os.environ.get("GODOT_ARTIFACT_STORE", ".godot-artifacts"),
+        help="Store directory (default: $GODOT_ARTIFACT_STORE or .godot-artifacts)"
+    )
+    parser.add_argument(
+        "--mode", "-m",
+        choices=["auto", "reflink", "hardlink", "copy"],
+        default="auto",
+        help="How files are placed in/out of the store (default: auto)"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="Store a build")
+    add.add_argument("build", help="Export output directory or file")
+    add.add_argument("--label", "-l", required=True, help="Build family, e.g. preset or branch")
+    add.add_argument("--id", help="Build id (default: <label>-<timestamp>)")
+    add.add_argument("--jobs", "-j", type=int, default=0, help="Hashing threads (default: CPU count)")
+
+    commands.add_parser("list", help="List stored builds")
+
+    materialize = commands.add_parser("materialize", help="Recreate a stored build")
+    materialize.add_argument("id", help="Build id (see list)")
+    materialize.add_argument("dest", help="Destination directory")
+
+    gc = commands.add_parser("gc", help="Apply retention and delete unreferenced objects")
+    gc.add_argument("--keep", "-k", type=int, default=0, help="Newest builds kept per label")
+    gc.add_argument("--max-age-days", type=float, default=0, help="Keep builds younger than this")
+    gc.add_argument("--dry-run", "-n", action="store_true", help="Only report what would be removed")
+
+    args = parser.parse_args()
+    store = ArtifactStore(Path(args.store))
+
+    if args.command == "add":
+        build = Path(args.build)
+        if not build.exists():
+            print(f"ERROR: Build not found: {build}")
+            sys.exit(1)
+        manifest = store.add(build, args.label, args.id, args.mode, args.jobs)
+        total = sum(e["size"] for e in manifest["files"].values())
+        print(
+            f"Stored {manifest['id']}: {len(manifest['files'])} files, {_mb(total)} "
+            f"({manifest['new_objects']} new objects, {_mb(manifest['new_bytes'])} added to store)"
+        )
+
+    elif args.command == "list":
+        stats = store.stats()
+        if not stats:
+            print("No builds stored.")
+        for build_id, s in stats.items():
+            created = time.strftime("%Y-%m-%d %H:%M", time.localtime(s["created"]))
+            print(
+                f"{created}  {build_id:40} {s['files']:6d} files  "
+                f"{_mb(s['size']):>11}  unique {_mb(s['unique']):>11}"
+            )
+
+    elif args.command == "materialize":
+        try:
+            count = store.materialize(args.id, Path(args.dest), args.mode)
+        except KeyError:
+            print(f"ERROR: No such build: {args.id}")
+            sys.exit(1)
+        print(f"Materialized {args.id}: {count} files in {args.dest}")
+
+    elif args.command == "gc":
+        if not (args.keep or args.max_age_days):
+            print("ERROR: Pass --keep and/or --max-age-days")
+            sys.exit(1)
+        result = store.gc(args.keep, args.max_age_days, args.dry_run)
+        prefix = "Would remove" if args.dry_run else "Removed"
+        print(
+            f"{prefix} {len(result['removed_builds'])} builds, "
+            f"{result['deleted_objects']} objects ({_mb(result['freed_bytes'])})"
+        )
+        for build_id in result["removed_builds"]:
+            print(f"  - {build_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Rerun GdUnit4 suites several times and classify tests as stable or flaky.
+
+Usage:
+    python detect_flaky.py --project ./my-game --suite res://test/player_test.gd --runs 5
+    python detect_flaky.py --project ./my-game --runs 10 --jobs 2 --flaky-list .gdunit-flaky.json
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import date
+from pathlib import Path
+from typing import List
+
+from parse_results import parse_results_directory
+from run_tests import find_suite_path, run_tests, suite_path_map
+
+
+@dataclass
+class TestHistory:
+    key: str
+    passes: int = 0
+    failures: int = 0
+    times: List[float] = field(default_factory=list)
+
+    @property
+    def runs(self) -> int:
+        return self.passes + self.failures
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passes / self.runs if self.runs else 0.0
+
+    @property
+    def classification(self) -> str:
+        if self.failures == 0:
+            return "stable-pass"
+        if self.passes == 0:
+            return "stable-fail"
+        return "flaky"
+
+
+def repeat_runs(
+    project: str,
+    suites: List[str],
+    runs: int,
+    jobs: int,
+    report_root: Path,
+    timeout: int,
+) -> List[Path]:
+    """Run the selected suites `runs` times, `jobs` at a time; return report dirs."""
+    extra_args = [arg for suite in suites for arg in ("--add", suite)]
+    report_dirs = [report_root / f"run-{i + 1}" for i in range(runs)]
+    # GdUnit4 adds a report_N per invocation, so reports of an earlier detection
+    # (including runs beyond this one's count) would be counted again
+    for stale in report_root.glob("run-*"):
+        shutil.rmtree(stale, ignore_errors=True)
+
+    def one_run(report_dir: Path) -> int:
+        return run_tests(
+            project=project,
+            report_dir=str(report_dir),
+            timeout=timeout,
+            extra_args=extra_args,
+            quiet=jobs > 1,
+        )
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for report_dir, code in zip(report_dirs, pool.map(one_run, report_dirs)):
+            print(f"  {report_dir.name}: exit code {code}")
+
+    return report_dirs
+
+
+def collect_history(report_dirs: List[Path]) -> dict:
+    """Fold every run's results into per-test pass/fail counts and timings."""
+    history = {}
+    for report_dir in report_dirs:
+        if not report_dir.exists():
+            continue
+        for suite in parse_results_directory(report_dir).suites:
+            for tc in suite.testcases:
+                if tc.status == "skipped":
+                    continue
+                key = f"{tc.classname}::{tc.name}"
+                entry = history.setdefault(key, TestHistory(key))
+                if tc.status == "passed":
+                    entry.passes += 1
+                else:
+                    entry.failures += 1
+                entry.times.append(tc.time)
+    return history
+
+
+def update_flaky_list(path: Path, history: dict, project_path: Path) -> dict:
+    """Add newly flaky tests, drop ones that were stable across every rerun."""
+    data = json.loads(path.read_text()) if path.exists() else {"tests": {}}
+    tests = data.setdefault("tests", {})
+    suite_paths = suite_path_map(project_path)
+
+    for key, entry in history.items():
+        if entry.classification == "flaky":
+            suite = key.partition("::")[0]
+            tests[key] = {
+                "pass_rate": round(entry.pass_rate, 3),
+                "runs": entry.runs,
+                "suite_path": find_suite_path(suite_paths, suite),
+                "updated": date.today().isoformat(),
+            }
+        elif entry.classification == "stable-pass":
+            tests.pop(key, None)
+
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+    return tests
+
+
+def format_report(history: dict) -> str:
+    """Format a table of flaky and failing tests with timing spread."""
+    lines = []
+    lines.append("=" * 60)
+    lines.append("FLAKY TEST ANALYSIS")
+    lines.append("=" * 60)
+
+    counts = {"stable-pass": 0, "stable-fail": 0, "flaky": 0}
+    for entry in history.values():
+        counts[entry.classification] += 1
+    lines.append(
+        f"Stable pass: {counts['stable-pass']}  "
+        f"Stable fail: {counts['stable-fail']}  "
+        f"Flaky: {counts['flaky']}"
+    )
+    lines.append("")
+
+    order = {"flaky": 0, "stable-fail": 1}
+    interesting = sorted(
+        (e for e in history.values() if e.classification in order),
+        key=lambda e: (order[e.classification], e.pass_rate),
+    )
+    for entry in interesting:
+        mean = statistics.fmean(entry.times)
+        stdev = statistics.pstdev(entry.times)
+        lines.append(
+            f"{entry.classification.upper():12} {entry.pass_rate:6.0%} "
+            f"({entry.passes}/{entry.runs})  {mean:.3f}s ±{stdev:.3f}  {entry.key}"
+        )
+
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rerun GdUnit4 suites and classify tests as stable or flaky",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --project ./my-game --suite res://test/player_test.gd --runs 5
+  %(prog)s --project ./my-game --runs 10 --jobs 2 --flaky-list .gdunit-flaky.json
+  %(prog)s --project ./my-game --analyze-only --report ./flaky-reports
+        """
+    )
+
+    parser.add_argument(
+        "--project", "-p",
+        required=True,
+        help="Path to Godot project directory"
+    )
+    parser.add_argument(
+        "--suite", "-s",
+        action="append",
+        default=[],
+        help="Test suite or directory to rerun (repeatable, default: all)"
+    )
+    parser.add_argument(
+        "--runs", "-k",
+        type=int,
+        default=5,
+        help="Number of repeated runs (default: 5)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Runs to execute concurrently (default: 1)"
+    )
+    parser.add_argument(
+        "--report", "-r",
+        default="flaky-reports",
+        help="Directory for per-run reports (default: flaky-reports)"
+    )
+    parser.add_argument(
+        "--flaky-list",
+        help="Flake list JSON to update (read by run_tests.py --flaky-list)"
+    )
+    parser.add_argument(
+        "--analyze-only",
+        action="store_true",
+        help="Skip running; analyze existing run-* reports"
+    )
+    parser.add_argument(
+        "--format", "-f",
+        choices=["summary", "json"],
+        default="summary",
+        help="Output format (default: summary)"
+    )
+    parser.add_argument(
+        "--timeout", "-t",
+        type=int,
+        default=300,
+        help="Per-run timeout in seconds (default: 300)"
+    )
+
+    args = parser.parse_args()
+
+    project_path = Path(args.project).resolve()
+    report_root = Path(args.report).resolve()
+
+    if args.analyze_only:
+        report_dirs = sorted(report_root.glob("run-*"))
+    else:
+        print(f"Running selected suites {args.runs} times ({args.jobs} at a time)...")
+        report_dirs = repeat_runs(
+            args.project, args.suite, args.runs, max(args.jobs, 1),
+            report_root, args.timeout,
+        )
+
+    history = collect_history(report_dirs)
+    if not history:
+        print("ERROR: No test results found.")
+        sys.exit(1)
+
+    if args.flaky_list:
+        tests = update_flaky_list(Path(args.flaky_list), history, project_path)
+        print(f"Flake list {args.flaky_list}: {len(tests)} tests")
+
+    if args.format == "json":
+        print(json.dumps(
+            {
+                key: {
+                    "classification": e.classification,
+                    "pass_rate": e.pass_rate,
+                    **asdict(e),
+                }
+                for key, e in history.items()
+            },
+            indent=2,
+        ))
+    else:
+        print(format_report(history))
+
+    # Flakes are reported, not fatal; tests that never pass are real failures
+    failing = any(e.classification == "stable-fail" for e in history.values())
+    sys.exit(1 if failing else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,9 @@ import sys
 import os
 from pathlib import Path
 
+from analyze_pck import analyze, format_report
+from project_index import scan_tree
+
 
 def find_godot() -> str:
     """Find the Godot executable."""
@@ -79,12 +82,27 @@ def check_export_presets(project_path: Path) -> list[str]:
     return presets
 
 
+def print_size_report(output_path: Path):
+    """Print the analyze_pck.py report for an export (Web directory, .pck or executable)."""
+    target = output_path.parent if output_path.suffix == ".html" else output_path
+    try:
+        report = analyze(target)
+        if report["pack"] is None and target.with_suffix(".pck").exists():
+            report = analyze(target.with_suffix(".pck"))
+    except ValueError as exc:
+        print(f"WARNING: Could not analyze build size: {exc}")
+        return
+    print(format_report(report, top=10))
+
+
 def export_project(
     project: str,
     preset: str,
     output: str,
     debug: bool = False,
     verbose: bool = False,
+    analyze: bool = False,
+    store: str = None,
 ) -> int:
     """
     Export a Godot project.
@@ -95,6 +113,8 @@ def export_project(
         output: Output path for the exported build
         debug: Use debug export instead of release
         verbose: Enable verbose output
+        analyze: Print a per-resource size report after a successful export
+        store: Artifact store directory to record the build in (see artifact_store.py)
 
     Returns:
         Exit code (0 = success, non-zero = failure)
@@ -163,12 +183,29 @@ def export_project(
 
             # Show output files
             if output_path.is_dir():
-                files = list(output_path.rglob("*"))
-                print(f"Files created: {len(files)}")
+                files = scan_tree(output_path, ignored_dirs=(), honor_gdignore=False)
+                size = sum(file_size for file_size, _ in files.values()) / 1024 / 1024
+                print(f"Files created: {len(files)} ({size:.2f} MB)")
             else:
                 size = output_path.stat().st_size / 1024 / 1024
                 print(f"File size: {size:.2f} MB")
 
+            if analyze:
+                print_size_report(output_path)
+
+            if store:
+                from artifact_store import ArtifactStore
+
+                build_dir = output_path if output_path.is_dir() else output_path.parent
+                manifest = ArtifactStore(Path(store)).add(
+                    build_dir, preset, metadata={"preset": preset, "debug": debug}
+                )
+                print(
+                    f"Stored as {manifest['id']} "
+                    f"({manifest['new_objects']} new objects, "
+                    f"{manifest['new_bytes'] / 1024 / 1024:.2f} MB added to store)"
+                )
+
             return 0
         else:
             print("ERROR: Export failed or output not created.")
@@ -219,6 +256,15 @@ Examples:
         action="store_true",
         help="Enable verbose output"
     )
+    parser.add_argument(
+        "--analyze", "-a",
+        action="store_true",
+        help="Show which resources make up the build size (see analyze_pck.py)"
+    )
+    parser.add_argument(
+        "--store",
+        help="Also record the build in this content-addressed artifact store"
+    )
     parser.add_argument(
         "--list-presets", "-l",
         action="store_true",
@@ -246,6 +292,8 @@ Examples:
         output=args.output,
         debug=args.debug,
         verbose=args.verbose,
+        analyze=args.analyze,
+        store=args.store,
     )
 
     sys.exit(exit_code)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Linux inotify(7) support shared by the file watchers.
+
+Used by parse_results.py (report directories) and project_index.py (project
+tree). Kept free of any report or project logic so either can import it.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+from typing import List, Optional, Tuple
+
+# inotify(7) event bits
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_Q_OVERFLOW = 0x4000
+IN_ISDIR = 0x40000000
+INOTIFY_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class Inotify:
+    """One inotify instance via ctypes; raises OSError where it is unavailable."""
+
+    def __init__(self, mask: int = INOTIFY_MASK):
+        self.mask = mask
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(self.libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add_watch(self, path) -> int:
+        """Watch one directory; returns its watch descriptor, or -1 on failure."""
+        return self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.mask)
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """Block up to timeout (None = forever); True if events are pending."""
+        return bool(select.select([self.fd], [], [], timeout)[0])
+
+    def read(self) -> List[Tuple[int, int, str]]:
+        """Drain pending events as (watch descriptor, mask, name) tuples."""
+        events = []
+        data = os.read(self.fd, 65536)
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            events.append((wd, mask, name))
+        return events
+
+    def close(self):
+        os.close(self.fd)
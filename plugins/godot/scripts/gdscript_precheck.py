@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+Fast pure-Python syntax pre-check for GDScript 2.0 files.
+
+Catches indentation, bracket, string and basic grammar errors, plus
+`preload()` / `extends` paths that do not exist, without starting Godot.
+It is deliberately conservative: anything it accepts may still fail the
+engine's full parse, but what it rejects would not compile.
+
+Usage:
+    python gdscript_precheck.py --project ./my-game
+    python gdscript_precheck.py --project ./my-game scripts/player.gd
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import List, Optional
+
+from project_index import ProjectIndex
+
+KEYWORDS = {
+    "if", "elif", "else", "for", "while", "match", "when", "break", "continue",
+    "pass", "return", "class", "class_name", "extends", "is", "in", "as", "self",
+    "super", "signal", "func", "static", "const", "enum", "var", "breakpoint",
+    "preload", "await", "yield", "assert", "void", "not", "and", "or",
+    "true", "false", "null", "PI", "TAU", "INF", "NAN",
+}
+
+# Statements that open an indented block and need a ':' on their line
+BLOCK_KEYWORDS = {"if", "elif", "else", "for", "while", "match", "func", "class"}
+
+OPERATORS = [
+    "**=", "<<=", ">>=", "...",
+    "->", "==", "!=", "<=", ">=", "&&", "||", "+=", "-=", "*=", "/=", "%=",
+    "&=", "|=", "^=", "**", "<<", ">>", ":=", "..",
+    "+", "-", "*", "/", "%", "<", ">", "=", "!", "&", "|", "^", "~", ".",
+    ",", ":", ";", "$", "@",
+]
+
+# A statement cannot end with one of these (outside brackets)
+TRAILING_OPERATORS = {
+    "=", "+", "-", "*", "/", "%", "**", "==", "!=", "<", ">", "<=", ">=",
+    "&&", "||", "+=", "-=", "*=", "/=", "%=", "&=", "|=", "^=", "**=",
+    "<<=", ">>=", "<<", ">>", "&", "|", "^", ".", ",", ":=", "->", "and", "or", "not",
+}
+
+BRACKETS = {"(": ")", "[": "]", "{": "}"}
+CLOSERS = {v: k for k, v in BRACKETS.items()}
+
+NAME = re.compile(r"[^\W\d]\w*")
+NUMBER = re.compile(
+    r"0[xX][0-9a-fA-F_]+|0[bB][01_]+"
+    r"|(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d[\d_]*)?"
+)
+
+
+@dataclass
+class Diagnostic:
+    line: int
+    column: int
+    message: str
+
+
+@dataclass
+class Token:
+    kind: str  # name, number, string, op, annotation
+    value: str
+    line: int
+    column: int
+
+
+@dataclass
+class LogicalLine:
+    line: int
+    indent: str
+    tokens: List[Token] = field(default_factory=list)
+
+
+def tokenize(text: str) -> tuple[List[LogicalLine], List[Diagnostic]]:
+    """
+    Split source into logical lines of tokens.
+
+    Newlines inside brackets and after a backslash continue the logical
+    line. Comments are dropped. Lexical errors are reported, and scanning
+    resumes after them so later problems are still found.
+    """
+    lines = []
+    errors = []
+    stack = []  # (opener, line, column)
+    current = None
+    pos, line, line_start = 0, 1, 0
+    at_line_start = True
+    length = len(text)
+
+    while pos < length:
+        if at_line_start and not stack:
+            # Measure indentation; blank and comment-only lines do not count
+            end = pos
+            while end < length and text[end] in " \t":
+                end += 1
+            if end >= length or text[end] in "\r\n#":
+                pos = end
+                at_line_start = False
+                continue
+            if current is None:
+                current = LogicalLine(line, text[pos:end])
+            pos = end
+            at_line_start = False
+            continue
+        at_line_start = False
+
+        char = text[pos]
+        column = pos - line_start + 1
+
+        if char in " \t\r":
+            pos += 1
+        elif char == "\n":
+            pos += 1
+            line += 1
+            line_start = pos
+            at_line_start = True
+            if not stack and current is not None:
+                lines.append(current)
+                current = None
+        elif char == "#":
+            while pos < length and text[pos] != "\n":
+                pos += 1
+        elif char == "\\" and text[pos + 1:pos + 2] in ("\n", "\r"):
+            pos = text.index("\n", pos) + 1
+            line += 1
+            line_start = pos
+        else:
+            if current is None:
+                current = LogicalLine(line, "")
+            start_line = line
+            prefix = ""
+            if char in "r&^" and text[pos + 1:pos + 2] in ("'", '"'):
+                prefix, pos = char, pos + 1
+                char = text[pos]
+
+            if char in ("'", '"'):
+                quote = text[pos:pos + 3] if text[pos:pos + 3] in ('"""', "'''") else char
+                end = pos + len(quote)
+                closed = False
+                while end < length:
+                    if text[end] == "\\" and prefix != "r":
+                        if text[end + 1:end + 2] == "\n":
+                            line += 1
+                            line_start = end + 2
+                        end += 2
+                        continue
+                    if text.startswith(quote, end):
+                        end += len(quote)
+                        closed = True
+                        break
+                    if text[end] == "\n":
+                        if len(quote) == 1:
+                            break
+                        line += 1
+                        line_start = end + 1
+                    end += 1
+                if not closed:
+                    errors.append(Diagnostic(start_line, column, "Unterminated string."))
+                current.tokens.append(Token("string", text[pos:end], start_line, column))
+                pos = end
+            elif NUMBER.match(text, pos) and (char.isdigit() or text[pos + 1:pos + 2].isdigit()):
+                match = NUMBER.match(text, pos)
+                current.tokens.append(Token("number", match.group(), line, column))
+                pos = match.end()
+            elif NAME.match(text, pos):
+                match = NAME.match(text, pos)
+                current.tokens.append(Token("name", match.group(), line, column))
+                pos = match.end()
+            elif char == "@" and NAME.match(text, pos + 1):
+                match = NAME.match(text, pos + 1)
+                current.tokens.append(Token("annotation", match.group(), line, column))
+                pos = match.end()
+            elif char in BRACKETS:
+                stack.append((char, line, column))
+                current.tokens.append(Token("op", char, line, column))
+                pos += 1
+            elif char in CLOSERS:
+                if not stack:
+                    errors.append(Diagnostic(
+                        line, column, f'Closing "{char}" doesn\'t have an opening counterpart.'
+                    ))
+                elif stack[-1][0] != CLOSERS[char]:
+                    opener, open_line, _ = stack.pop()
+                    errors.append(Diagnostic(
+                        line, column,
+                        f'Closing "{char}" doesn\'t match the opening "{opener}" at line {open_line}.'
+                    ))
+                else:
+                    stack.pop()
+                current.tokens.append(Token("op", char, line, column))
+                pos += 1
+            else:
+                for op in OPERATORS:
+                    if text.startswith(op, pos):
+                        current.tokens.append(Token("op", op, line, column))
+                        pos += len(op)
+                        break
+                else:
+                    errors.append(Diagnostic(line, column, f'Invalid character "{char}".'))
+                    pos += 1
+
+    for opener, open_line, open_column in stack:
+        errors.append(Diagnostic(open_line, open_column, f'Unclosed "{opener}".'))
+    if current is not None and current.tokens:
+        lines.append(current)
+    return lines, errors
+
+
+def split_statements(tokens: List[Token]) -> List[List[Token]]:
+    """Split a logical line on top-level ';'."""
+    statements, current, depth = [], [], 0
+    for token in tokens:
+        if token.kind == "op" and token.value in BRACKETS:
+            depth += 1
+        elif token.kind == "op" and token.value in CLOSERS:
+            depth = max(depth - 1, 0)
+        if depth == 0 and token.kind == "op" and token.value == ";":
+            statements.append(current)
+            current = []
+            continue
+        current.append(token)
+    statements.append(current)
+    return [s for s in statements if s]
+
+
+def strip_prefix(tokens: List[Token]) -> tuple[List[Token], set]:
+    """Drop leading annotations (with arguments) and `static`; return the rest and annotation names."""
+    annotations = set()
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token.kind == "annotation":
+            annotations.add(token.value)
+            i += 1
+            if i < len(tokens) and tokens[i].value == "(" and tokens[i].kind == "op":
+                depth = 0
+                while i < len(tokens):
+                    if tokens[i].kind == "op" and tokens[i].value in BRACKETS:
+                        depth += 1
+                    elif tokens[i].kind == "op" and tokens[i].value in CLOSERS:
+                        depth -= 1
+                    i += 1
+                    if depth == 0:
+                        break
+        elif token.kind == "name" and token.value == "static":
+            i += 1
+        else:
+            break
+    return tokens[i:], annotations
+
+
+def top_level(tokens: List[Token]):
+    """Yield tokens that are not inside brackets."""
+    depth = 0
+    for token in tokens:
+        if token.kind == "op" and token.value in CLOSERS:
+            depth -= 1
+            continue
+        if depth == 0:
+            yield token
+        if token.kind == "op" and token.value in BRACKETS:
+            depth += 1
+
+
+def check_statement(tokens: List[Token]) -> List[Diagnostic]:
+    """Basic grammar of one statement."""
+    errors = []
+    tokens, annotations = strip_prefix(tokens)
+    if not tokens:
+        return errors
+
+    first = tokens[0]
+    outer = list(top_level(tokens))
+    keyword = first.value if first.kind == "name" else None
+
+    if keyword in BLOCK_KEYWORDS and not (keyword == "func" and "abstract" in annotations):
+        if not any(t.kind == "op" and t.value == ":" for t in outer):
+            errors.append(Diagnostic(first.line, first.column, f'Expected ":" after "{keyword}" statement.'))
+        if keyword == "else" and (len(tokens) < 2 or tokens[1].value != ":"):
+            errors.append(Diagnostic(first.line, first.column, 'Expected ":" after "else".'))
+
+    if keyword == "func":
+        if len(tokens) < 2 or tokens[1].kind != "name":
+            errors.append(Diagnostic(first.line, first.column, 'Expected function name after "func".'))
+        elif len(tokens) < 3 or tokens[2].value != "(":
+            errors.append(Diagnostic(
+                tokens[1].line, tokens[1].column, 'Expected opening "(" after function name.'
+            ))
+    elif keyword in ("var", "const", "signal", "class", "class_name"):
+        if len(tokens) < 2 or tokens[1].kind != "name" or tokens[1].value in KEYWORDS:
+            errors.append(Diagnostic(first.line, first.column, f'Expected name after "{keyword}".'))
+        elif keyword == "const" and not any(
+            t.kind == "op" and t.value in ("=", ":=") for t in outer
+        ):
+            errors.append(Diagnostic(first.line, first.column, "Expected initializer for constant."))
+
+    # Two operands in a row (e.g. `def foo`, `print "x"`) cannot be one expression
+    previous = None
+    for token in outer:
+        is_operand = token.kind in ("number", "string") or (
+            token.kind == "name" and token.value not in KEYWORDS
+        )
+        if is_operand and previous is not None:
+            found = token.value if token.kind == "string" else f'"{token.value}"'
+            errors.append(Diagnostic(
+                token.line, token.column,
+                f"Expected end of statement after expression, found {found}."
+            ))
+            break
+        previous = token if is_operand and token.kind != "op" else None
+
+    last = outer[-1]
+    if last.kind in ("op", "name") and last.value in TRAILING_OPERATORS:
+        errors.append(Diagnostic(last.line, last.column, f'Expected expression after "{last.value}".'))
+    return errors
+
+
+def check_lines(lines: List[LogicalLine]) -> List[Diagnostic]:
+    """Indentation and block structure across logical lines."""
+    errors = []
+    indent_char = None
+    stack = [0]
+    block_header = None  # logical line expecting an indented block
+    previous_keyword = {}  # indent width -> first keyword of the last statement there
+
+    for logical in lines:
+        indent = logical.indent
+        first = logical.tokens[0]
+        if " " in indent and "\t" in indent:
+            errors.append(Diagnostic(logical.line, 1, "Mixed use of tabs and spaces for indentation."))
+        elif indent:
+            char = indent[0]
+            if indent_char is None:
+                indent_char = char
+            elif char != indent_char:
+                used, before = ("tabs", "spaces") if char == "\t" else ("spaces", "tabs")
+                errors.append(Diagnostic(
+                    logical.line, 1,
+                    f"Used {used} for indentation instead of {before} as used before in the file."
+                ))
+        width = len(indent)
+
+        if block_header is not None:
+            if width <= stack[-1]:
+                errors.append(Diagnostic(
+                    logical.line, 1,
+                    f"Expected indented block after line {block_header.line}."
+                ))
+            else:
+                stack.append(width)
+        elif width > stack[-1]:
+            errors.append(Diagnostic(logical.line, 1, "Unexpected indentation."))
+            stack.append(width)
+        else:
+            while width < stack[-1]:
+                stack.pop()
+            if width != stack[-1]:
+                errors.append(Diagnostic(
+                    logical.line, 1, "Unindent doesn't match the previous indentation level."
+                ))
+                stack.append(width)
+
+        for deeper in [w for w in previous_keyword if w > width]:
+            del previous_keyword[deeper]
+        statements = split_statements(logical.tokens)
+        keyword = first.value if first.kind == "name" else None
+        if keyword in ("elif", "else") and previous_keyword.get(width) not in ("if", "elif"):
+            errors.append(Diagnostic(
+                first.line, first.column, f'"{keyword}" without a matching "if" at the same indentation.'
+            ))
+        previous_keyword[width] = keyword
+
+        for statement in statements:
+            errors.extend(check_statement(statement))
+
+        last = logical.tokens[-1]
+        opens_block = last.kind == "op" and last.value == ":"
+        # A block statement missing its ':' was already reported; still expect
+        # its body so the following lines do not cascade into indent errors
+        missing_colon = keyword in BLOCK_KEYWORDS and not any(
+            t.kind == "op" and t.value == ":" for t in top_level(logical.tokens)
+        )
+        block_header = logical if opens_block or missing_colon else None
+
+    if block_header is not None:
+        errors.append(Diagnostic(
+            block_header.line, 1, f"Expected indented block after line {block_header.line}."
+        ))
+    return errors
+
+
+def resolve_resource(reference: str, script_path: Path, project_path: Path) -> Optional[Path]:
+    """Filesystem path of a res:// or script-relative reference (None for uid:// etc.)."""
+    if reference.startswith("res://"):
+        return project_path / reference[len("res://"):]
+    if "://" in reference:
+        return None
+    return script_path.parent / reference
+
+
+def check_references(lines: List[LogicalLine], script_path: Path, project_path: Path) -> List[Diagnostic]:
+    """Report preload("...") and extends "..." paths that do not exist."""
+    errors = []
+    for logical in lines:
+        tokens = logical.tokens
+        for i, token in enumerate(tokens):
+            literal = None
+            if (
+                token.kind == "name" and token.value == "preload"
+                and i + 2 < len(tokens)
+                and tokens[i + 1].value == "(" and tokens[i + 2].kind == "string"
+            ):
+                literal, kind = tokens[i + 2], "Preload file"
+            elif (
+                token.kind == "name" and token.value == "extends"
+                and i + 1 < len(tokens) and tokens[i + 1].kind == "string"
+            ):
+                literal, kind = tokens[i + 1], "Extended script"
+            if literal is None or literal.value[:1] not in ("'", '"'):
+                continue
+            reference = literal.value.strip("'\"")
+            target = resolve_resource(reference, script_path, project_path)
+            if target is not None and not target.exists():
+                errors.append(Diagnostic(
+                    literal.line, literal.column, f'{kind} "{reference}" does not exist.'
+                ))
+    return errors
+
+
+def precheck_source(text: str, script_path: Path, project_path: Path) -> List[Diagnostic]:
+    """All pre-check diagnostics for one script's source, sorted by position."""
+    lines, errors = tokenize(text)
+    if not errors:
+        # Grammar checks on a broken token stream only produce noise
+        errors = check_lines(lines)
+    errors.extend(check_references(lines, script_path, project_path))
+    return sorted(errors, key=lambda d: (d.line, d.column))
+
+
+def precheck_file(script_path: Path, project_path: Path) -> List[Diagnostic]:
+    """Pre-check one .gd file."""
+    # Godot accepts (and some editors write) a UTF-8 byte order mark
+    text = script_path.read_text(encoding="utf-8-sig", errors="replace")
+    return precheck_source(text, script_path, project_path)
+
+
+def format_diagnostics(rel_path: str, diagnostics: List[Diagnostic]) -> str:
+    """Godot-style `res://path:line - Parse Error: message` lines."""
+    return "\n".join(
+        f"res://{rel_path}:{d.line}:{d.column} - Parse Error: {d.message}"
+        for d in diagnostics
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fast GDScript syntax pre-check without starting Godot",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --project ./my-game
+  %(prog)s --project ./my-game scripts/player.gd scripts/enemy.gd
+  %(prog)s --project ./my-game --format json
+        """
+    )
+
+    parser.add_argument(
+        "scripts",
+        nargs="*",
+        help="Scripts to check, relative to the project (default: all outside addons/)"
+    )
+    parser.add_argument(
+        "--project", "-p",
+        required=True,
+        help="Path to Godot project directory"
+    )
+    parser.add_argument(
+        "--format", "-f",
+        choices=["summary", "json"],
+        default="summary",
+        help="Output format (default: summary)"
+    )
+
+    args = parser.parse_args()
+
+    project_path = Path(args.project).resolve()
+    if not project_path.exists():
+        print(f"ERROR: Project directory not found: {project_path}")
+        sys.exit(1)
+
+    if args.scripts:
+        scripts = [project_path / s for s in args.scripts]
+    else:
+        index = ProjectIndex(project_path)
+        index.scan()
+        scripts = index.files(".gd")
+
+    started = time.perf_counter()
+    results = {}
+    for script in scripts:
+        rel_path = script.relative_to(project_path).as_posix()
+        results[rel_path] = precheck_file(script, project_path)
+    elapsed = time.perf_counter() - started
+
+    failed = {path: diags for path, diags in results.items() if diags}
+    if args.format == "json":
+        print(json.dumps(
+            {path: [asdict(d) for d in diags] for path, diags in failed.items()}, indent=2
+        ))
+    else:
+        for rel_path, diagnostics in failed.items():
+            print(format_diagnostics(rel_path, diagnostics))
+        print(
+            f"{len(results)} scripts checked in {elapsed * 1000:.0f} ms: "
+            f"{len(failed)} with errors"
+        )
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,29 @@ Usage:
     python parse_results.py ./reports
     python parse_results.py ./reports --format summary
     python parse_results.py ./reports --format json
+    python parse_results.py ./reports --format clusters
+    python parse_results.py ./reports --watch --format ndjson
+    python parse_results.py ./shard-1 ./shard-2 --merge ./reports/merged.xml
+    python parse_results.py ./reports --diff ./main-reports --format markdown
 """
 
 import argparse
+import hashlib
 import json
+import os
+import re
 import sys
+import time
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import List, Optional
 
+from fs_watch import (
+    IN_CLOSE_WRITE, IN_CREATE, IN_DELETE, IN_ISDIR, IN_MOVED_FROM, IN_MOVED_TO,
+    IN_Q_OVERFLOW, Inotify,
+)
+
 
 @dataclass
 class TestCase:
@@ -38,6 +51,15 @@ class TestSuite:
     testcases: List[TestCase]
 
 
+@dataclass
+class FailureCluster:
+    signature: str
+    status: str
+    count: int
+    normalized: str
+    representative: TestCase
+
+
 @dataclass
 class TestResults:
     suites: List[TestSuite]
@@ -49,6 +71,33 @@ class TestResults:
     success: bool
 
 
+@dataclass
+class ResultDiff:
+    newly_failing: List[str]  # includes added tests that fail
+    newly_passing: List[str]
+    added: List[tuple]  # (key, status)
+    removed: List[str]
+    slower: List[tuple]  # (key, baseline seconds, current seconds)
+    still_failing: int
+    baseline_tests: int
+    current_tests: int
+
+
+def testcase_result(testcase: ET.Element) -> tuple[str, Optional[str], Optional[str]]:
+    """Return (status, message, output) for a <testcase> element."""
+    failure = testcase.find("failure")
+    error = testcase.find("error")
+    skipped = testcase.find("skipped")
+
+    if failure is not None:
+        return "failed", failure.get("message", ""), failure.text
+    if error is not None:
+        return "error", error.get("message", ""), error.text
+    if skipped is not None:
+        return "skipped", skipped.get("message", ""), None
+    return "passed", None, None
+
+
 def parse_junit_xml(xml_path: Path) -> Optional[TestSuite]:
     """Parse a single JUnit XML file."""
     try:
@@ -67,50 +116,29 @@ def parse_junit_xml(xml_path: Path) -> Optional[TestSuite]:
 
         for suite in suites:
             for testcase in suite.findall("testcase"):
-                name = testcase.get("name", "unknown")
-                classname = testcase.get("classname", "unknown")
-                time = float(testcase.get("time", 0))
-
-                # Determine status
-                failure = testcase.find("failure")
-                error = testcase.find("error")
-                skipped = testcase.find("skipped")
-
-                if failure is not None:
-                    status = "failed"
-                    message = failure.get("message", "")
-                    output = failure.text
-                elif error is not None:
-                    status = "error"
-                    message = error.get("message", "")
-                    output = error.text
-                elif skipped is not None:
-                    status = "skipped"
-                    message = skipped.get("message", "")
-                    output = None
-                else:
-                    status = "passed"
-                    message = None
-                    output = None
-
+                status, message, output = testcase_result(testcase)
                 all_testcases.append(TestCase(
-                    name=name,
-                    classname=classname,
-                    time=time,
+                    name=testcase.get("name", "unknown"),
+                    classname=testcase.get("classname", "unknown"),
+                    time=float(testcase.get("time", 0)),
                     status=status,
                     message=message,
                     output=output,
                 ))
 
         if suites:
-            suite = suites[0]
+            # A <testsuites> file may hold several suites; fold their counts together
+            if len(suites) == 1:
+                name = suites[0].get("name", xml_path.stem)
+            else:
+                name = root.get("name", xml_path.stem)
             return TestSuite(
-                name=suite.get("name", xml_path.stem),
-                tests=int(suite.get("tests", len(all_testcases))),
-                failures=int(suite.get("failures", 0)),
-                errors=int(suite.get("errors", 0)),
-                skipped=int(suite.get("skipped", 0)),
-                time=float(suite.get("time", 0)),
+                name=name,
+                tests=sum(int(s.get("tests", len(s.findall("testcase")))) for s in suites),
+                failures=sum(int(s.get("failures", 0)) for s in suites),
+                errors=sum(int(s.get("errors", 0)) for s in suites),
+                skipped=sum(int(s.get("skipped", 0)) for s in suites),
+                time=sum(float(s.get("time", 0)) for s in suites),
                 testcases=all_testcases,
             )
 
@@ -121,15 +149,20 @@ def parse_junit_xml(xml_path: Path) -> Optional[TestSuite]:
     return None
 
 
-def parse_results_directory(report_dir: Path) -> TestResults:
-    """Parse all JUnit XML files in a directory."""
-    suites = []
+def testcase_key(testcase: ET.Element) -> str:
+    """Identify a testcase across runs as classname::name."""
+    return f"{testcase.get('classname', 'unknown')}::{testcase.get('name', 'unknown')}"
 
-    for xml_file in report_dir.glob("**/*.xml"):
-        suite = parse_junit_xml(xml_file)
-        if suite:
-            suites.append(suite)
 
+def find_report_files(report_path: Path) -> List[Path]:
+    """List JUnit XML files under a report directory (or the file itself)."""
+    if report_path.is_file():
+        return [report_path]
+    return sorted(report_path.glob("**/*.xml"))
+
+
+def summarize_suites(suites: List[TestSuite]) -> TestResults:
+    """Total up parsed suites."""
     total_tests = sum(s.tests for s in suites)
     total_failures = sum(s.failures for s in suites)
     total_errors = sum(s.errors for s in suites)
@@ -147,6 +180,195 @@ def parse_results_directory(report_dir: Path) -> TestResults:
     )
 
 
+def parse_results_directory(report_dir: Path) -> TestResults:
+    """Parse all JUnit XML files in a directory."""
+    suites = []
+
+    for xml_file in find_report_files(report_dir):
+        suite = parse_junit_xml(xml_file)
+        if suite:
+            suites.append(suite)
+
+    return summarize_suites(suites)
+
+
+def iter_suites(xml_files: List[Path]):
+    """Stream <testsuite> elements without loading whole files."""
+    for xml_file in xml_files:
+        try:
+            for _, elem in ET.iterparse(xml_file, events=("end",)):
+                if elem.tag == "testsuite":
+                    yield elem
+                    elem.clear()
+        except ET.ParseError as e:
+            print(f"WARNING: Failed to parse {xml_file}: {e}", file=sys.stderr)
+
+
+def merge_reports(report_paths: List[Path], output: Path) -> dict:
+    """
+    Merge many JUnit XML reports into one <testsuites> document.
+
+    Testcases that appear more than once (retried suites or shards) are
+    deduplicated by classname::name; the attempt from the most recently
+    written file wins. Output is written one suite at a time.
+
+    Args:
+        report_paths: Report directories or XML files
+        output: Path of the consolidated XML file
+
+    Returns:
+        Totals of the merged document
+    """
+    xml_files = [f for p in report_paths for f in find_report_files(p)]
+    xml_files = [f for f in xml_files if f.resolve() != output.resolve()]
+    xml_files.sort(key=lambda f: f.stat().st_mtime)
+
+    # Pass 1: pick the winning attempt of every testcase and total them up
+    winners = {}
+    for suite_no, suite in enumerate(iter_suites(xml_files)):
+        for position, testcase in enumerate(suite.findall("testcase")):
+            status, _, _ = testcase_result(testcase)
+            winners[testcase_key(testcase)] = (
+                suite_no, position, status, float(testcase.get("time", 0))
+            )
+
+    totals = {"tests": len(winners), "failures": 0, "errors": 0, "skipped": 0}
+    total_time = 0.0
+    for _, _, status, elapsed in winners.values():
+        if status == "failed":
+            totals["failures"] += 1
+        elif status == "error":
+            totals["errors"] += 1
+        elif status == "skipped":
+            totals["skipped"] += 1
+        total_time += elapsed
+
+    # Pass 2: stream suites back out keeping only winning testcases
+    output.parent.mkdir(parents=True, exist_ok=True)
+    suite_count = 0
+    with open(output, "w", encoding="utf-8") as out:
+        out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        attrs = " ".join(f'{k}="{v}"' for k, v in totals.items())
+        out.write(f'<testsuites {attrs} time="{total_time:.3f}">\n')
+
+        for suite_no, suite in enumerate(iter_suites(xml_files)):
+            kept = [
+                testcase
+                for position, testcase in enumerate(suite.findall("testcase"))
+                if winners[testcase_key(testcase)][:2] == (suite_no, position)
+            ]
+            if not kept:
+                continue
+
+            merged = ET.Element("testsuite", {
+                k: v for k, v in suite.attrib.items()
+                if k not in ("tests", "failures", "errors", "skipped", "time")
+            })
+            statuses = [testcase_result(tc)[0] for tc in kept]
+            merged.set("tests", str(len(kept)))
+            merged.set("failures", str(statuses.count("failed")))
+            merged.set("errors", str(statuses.count("error")))
+            merged.set("skipped", str(statuses.count("skipped")))
+            merged.set("time", f"{sum(float(tc.get('time', 0)) for tc in kept):.3f}")
+            for child in suite:
+                if child.tag != "testcase":
+                    merged.append(child)
+            merged.extend(kept)
+
+            out.write(ET.tostring(merged, encoding="unicode"))
+            out.write("\n")
+            suite_count += 1
+
+        out.write("</testsuites>\n")
+
+    return {"files": len(xml_files), "suites": suite_count, **totals,
+            "time": total_time}
+
+
+# Volatile fragments replaced before hashing, applied in order
+NORMALIZE_PATTERNS = [
+    (re.compile(r"0x[0-9a-fA-F]+"), "<addr>"),
+    (re.compile(r"\b(?:res|user)://[^\s'\"()\[\],:]+"), "<path>"),
+    # Only real path shapes, so "1/2" or "and/or" in a message stay text:
+    # /-rooted, drive-rooted, or relative with a file extension
+    (re.compile(
+        r"(?<![\w.:/\\])/(?:[\w.-]+/)*[\w.-]+"
+        r"|\b[A-Za-z]:[\\/](?:[\w.-]+[\\/])*[\w.-]+"
+        r"|\b(?:[\w.-]+[\\/])+[\w-]+\.[A-Za-z]\w{0,7}\b"
+    ), "<path>"),
+    (re.compile(r"\b[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}\b"), "<uuid>"),
+    (re.compile(r"[-+]?\b\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b"), "<n>"),
+]
+
+# Only the head of long outputs feeds the signature, keeping cost per failure bounded
+SIGNATURE_TEXT_LIMIT = 2000
+
+
+def normalize_failure_text(text: str) -> str:
+    """Strip numbers, paths and addresses so equivalent failures compare equal."""
+    text = text[:SIGNATURE_TEXT_LIMIT]
+    for pattern, replacement in NORMALIZE_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return " ".join(text.split())
+
+
+def failure_signature(tc: TestCase) -> tuple[str, str]:
+    """Return (signature hash, normalized text) for a failed or errored testcase."""
+    normalized = normalize_failure_text(f"{tc.message or ''}\n{tc.output or ''}")
+    digest = hashlib.sha1(f"{tc.status}:{normalized}".encode("utf-8")).hexdigest()
+    return digest[:12], normalized
+
+
+def cluster_failures(results: TestResults) -> List[FailureCluster]:
+    """Group failures and errors by signature, largest cluster first."""
+    clusters = {}
+    for suite in results.suites:
+        for tc in suite.testcases:
+            if tc.status not in ("failed", "error"):
+                continue
+            signature, normalized = failure_signature(tc)
+            cluster = clusters.get(signature)
+            if cluster:
+                cluster.count += 1
+            else:
+                clusters[signature] = FailureCluster(
+                    signature=signature,
+                    status=tc.status,
+                    count=1,
+                    normalized=normalized,
+                    representative=tc,
+                )
+
+    return sorted(clusters.values(), key=lambda c: c.count, reverse=True)
+
+
+def format_clusters(results: TestResults) -> str:
+    """Format failures grouped by signature, one representative per group."""
+    clusters = cluster_failures(results)
+    failures = sum(c.count for c in clusters)
+
+    lines = []
+    lines.append("=" * 60)
+    lines.append("FAILURE CLUSTERS")
+    lines.append("=" * 60)
+    lines.append("")
+    lines.append(f"{failures} failures/errors in {len(clusters)} clusters "
+                 f"({results.total_tests} tests)")
+
+    for cluster in clusters:
+        tc = cluster.representative
+        lines.append("")
+        lines.append(f"[{cluster.count}x] {cluster.status.upper()} {cluster.signature}")
+        lines.append(f"  e.g. {tc.classname}::{tc.name}")
+        if tc.message:
+            lines.append(f"  {tc.message}")
+
+    lines.append("")
+    lines.append("=" * 60)
+
+    return "\n".join(lines)
+
+
 def format_summary(results: TestResults) -> str:
     """Format results as human-readable summary."""
     lines = []
@@ -193,6 +415,36 @@ def format_json(results: TestResults) -> str:
     return json.dumps(asdict(results), indent=2)
 
 
+def testcase_records(suite: TestSuite) -> List[dict]:
+    """Flatten a suite into one NDJSON record per testcase."""
+    return [
+        {"type": "testcase", "suite": suite.name, **asdict(tc)}
+        for tc in suite.testcases
+    ]
+
+
+def totals_record(results: TestResults) -> dict:
+    """NDJSON record carrying the overall counts."""
+    return {
+        "type": "totals",
+        "tests": results.total_tests,
+        "failures": results.total_failures,
+        "errors": results.total_errors,
+        "skipped": results.total_skipped,
+        "time": round(results.total_time, 3),
+        "success": results.success,
+    }
+
+
+def format_ndjson(results: TestResults) -> str:
+    """Format results as newline-delimited JSON: testcases, then totals."""
+    lines = []
+    for suite in results.suites:
+        lines.extend(json.dumps(r) for r in testcase_records(suite))
+    lines.append(json.dumps(totals_record(results)))
+    return "\n".join(lines)
+
+
 def format_markdown(results: TestResults) -> str:
     """Format results as Markdown table."""
     lines = []
@@ -225,6 +477,441 @@ def format_markdown(results: TestResults) -> str:
     return "\n".join(lines)
 
 
+FORMATTERS = {
+    "summary": format_summary,
+    "json": format_json,
+    "markdown": format_markdown,
+    "clusters": format_clusters,
+    "ndjson": format_ndjson,
+}
+
+
+# Packed index values: time in ms << 2 | status code
+STATUS_CODES = {"passed": 0, "skipped": 1, "failed": 2, "error": 3}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+DIFF_LIST_LIMIT = 100
+
+
+def key_hash(key: str) -> int:
+    """64-bit hash of a classname::name key (collisions negligible below ~10^8 tests)."""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def report_files_by_mtime(report_paths: List[Path]) -> List[Path]:
+    """All XML files under the paths, oldest first, so later attempts win."""
+    xml_files = [f for p in report_paths for f in find_report_files(p)]
+    return sorted(xml_files, key=lambda f: f.stat().st_mtime)
+
+
+def index_results(xml_files: List[Path]) -> dict:
+    """
+    Stream reports into a compact {key hash: time_ms << 2 | status} index.
+
+    Only integers are kept per testcase, so memory stays flat per test no
+    matter how long names or failure messages are.
+    """
+    index = {}
+    for suite in iter_suites(xml_files):
+        for testcase in suite.findall("testcase"):
+            status, _, _ = testcase_result(testcase)
+            elapsed_ms = int(float(testcase.get("time", 0) or 0) * 1000)
+            index[key_hash(testcase_key(testcase))] = elapsed_ms << 2 | STATUS_CODES[status]
+    return index
+
+
+def diff_results(
+    baseline_paths: List[Path],
+    current_paths: List[Path],
+    slower_ratio: float = 0.5,
+    slower_min: float = 0.1,
+) -> ResultDiff:
+    """
+    Compare two runs in linear time.
+
+    Both runs are streamed into hashed indexes and compared hash by hash;
+    names are recovered afterwards by one more streaming pass, only for the
+    tests that are actually reported.
+
+    Args:
+        baseline_paths: Report directories/files of the reference run
+        current_paths: Report directories/files of the run under review
+        slower_ratio: Minimum relative slowdown to report (0.5 = 50% slower)
+        slower_min: Minimum absolute slowdown in seconds to report
+
+    Returns:
+        Categorized differences
+    """
+    baseline_files = report_files_by_mtime(baseline_paths)
+    current_files = report_files_by_mtime(current_paths)
+    baseline = index_results(baseline_files)
+    current = index_results(current_files)
+
+    # hash -> (category, extra)
+    wanted = {}
+    still_failing = 0
+    for digest, packed in current.items():
+        status, elapsed = packed & 3, packed >> 2
+        old = baseline.get(digest)
+        if old is None:
+            # A new test that fails is also a new failure
+            category = "added_failing" if status >= 2 else "added"
+            wanted[digest] = (category, STATUS_NAMES[status])
+            continue
+        old_status, old_elapsed = old & 3, old >> 2
+        failing, was_failing = status >= 2, old_status >= 2
+        if failing and not was_failing:
+            wanted[digest] = ("newly_failing", None)
+        elif failing:
+            still_failing += 1
+        elif was_failing and status == STATUS_CODES["passed"]:
+            wanted[digest] = ("newly_passing", None)
+        elif (
+            status == old_status == STATUS_CODES["passed"]
+            and elapsed - old_elapsed >= slower_min * 1000
+            and elapsed > old_elapsed * (1 + slower_ratio)
+        ):
+            wanted[digest] = ("slower", (old_elapsed / 1000, elapsed / 1000))
+    for digest in baseline:
+        if digest not in current:
+            wanted[digest] = ("removed", None)
+
+    diff = ResultDiff([], [], [], [], [], still_failing, len(baseline), len(current))
+    del baseline, current
+
+    for suite in iter_suites(current_files + baseline_files):
+        if not wanted:
+            break
+        for testcase in suite.findall("testcase"):
+            key = testcase_key(testcase)
+            found = wanted.pop(key_hash(key), None)
+            if found is None:
+                continue
+            category, extra = found
+            if category == "added_failing":
+                diff.newly_failing.append(key)
+                diff.added.append((key, extra))
+            elif category == "added":
+                diff.added.append((key, extra))
+            elif category == "slower":
+                diff.slower.append((key, *extra))
+            else:
+                getattr(diff, category).append(key)
+
+    diff.newly_failing.sort()
+    diff.newly_passing.sort()
+    diff.added.sort()
+    diff.removed.sort()
+    diff.slower.sort(key=lambda row: row[1] - row[2])
+    return diff
+
+
+def _limited(items: list, limit: int = DIFF_LIST_LIMIT) -> tuple[list, int]:
+    return items[:limit], max(len(items) - limit, 0)
+
+
+def format_diff_summary(diff: ResultDiff) -> str:
+    """Format a run-to-run diff as human-readable text."""
+    lines = []
+    lines.append("=" * 60)
+    lines.append("TEST RESULTS DIFF")
+    lines.append("=" * 60)
+    lines.append(f"Baseline: {diff.baseline_tests} tests   Current: {diff.current_tests} tests")
+    lines.append(
+        f"Newly failing: {len(diff.newly_failing)}  Newly passing: {len(diff.newly_passing)}  "
+        f"Still failing: {diff.still_failing}"
+    )
+    lines.append(
+        f"Added: {len(diff.added)}  Removed: {len(diff.removed)}  Slower: {len(diff.slower)}"
+    )
+
+    sections = [
+        ("NEWLY FAILING", diff.newly_failing),
+        ("NEWLY PASSING", diff.newly_passing),
+        ("ADDED", [f"{key} ({status})" for key, status in diff.added]),
+        ("REMOVED", diff.removed),
+        ("SLOWER", [
+            f"{key}  {old:.3f}s -> {new:.3f}s (+{new - old:.3f}s)"
+            for key, old, new in diff.slower
+        ]),
+    ]
+    for title, items in sections:
+        if not items:
+            continue
+        shown, hidden = _limited(items)
+        lines.append("")
+        lines.append(f"{title}:")
+        lines.extend(f"  {item}" for item in shown)
+        if hidden:
+            lines.append(f"  ... and {hidden} more")
+
+    lines.append("")
+    lines.append("=" * 60)
+    lines.append("NEW FAILURES" if diff.newly_failing else "NO NEW FAILURES")
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
+def format_diff_json(diff: ResultDiff) -> str:
+    """Format a run-to-run diff as JSON (complete lists)."""
+    return json.dumps(asdict(diff), indent=2)
+
+
+def format_diff_markdown(diff: ResultDiff) -> str:
+    """Format a run-to-run diff as Markdown for PR comments."""
+    lines = []
+    lines.append("## Test Results Diff")
+    lines.append("")
+    status_emoji = "❌" if diff.newly_failing else "✅"
+    lines.append(
+        f"**Status**: {status_emoji} {len(diff.newly_failing)} newly failing, "
+        f"{len(diff.newly_passing)} newly passing, {diff.still_failing} still failing"
+    )
+    lines.append("")
+    lines.append("| Change | Count |")
+    lines.append("|--------|-------|")
+    lines.append(f"| Newly failing | {len(diff.newly_failing)} |")
+    lines.append(f"| Newly passing | {len(diff.newly_passing)} |")
+    lines.append(f"| Added | {len(diff.added)} |")
+    lines.append(f"| Removed | {len(diff.removed)} |")
+    lines.append(f"| Slower | {len(diff.slower)} |")
+
+    sections = [
+        ("Newly Failing", [f"`{key}`" for key in diff.newly_failing]),
+        ("Newly Passing", [f"`{key}`" for key in diff.newly_passing]),
+        ("Added", [f"`{key}` ({status})" for key, status in diff.added]),
+        ("Removed", [f"`{key}`" for key in diff.removed]),
+        ("Slower", [
+            f"`{key}`: {old:.3f}s → {new:.3f}s (+{new - old:.3f}s)"
+            for key, old, new in diff.slower
+        ]),
+    ]
+    for title, items in sections:
+        if not items:
+            continue
+        shown, hidden = _limited(items)
+        lines.append("")
+        lines.append(f"### {title}")
+        lines.append("")
+        lines.extend(f"- {item}" for item in shown)
+        if hidden:
+            lines.append(f"- ... and {hidden} more")
+
+    return "\n".join(lines)
+
+
+DIFF_FORMATTERS = {
+    "summary": format_diff_summary,
+    "json": format_diff_json,
+    "markdown": format_diff_markdown,
+}
+
+
+class InotifyWatcher:
+    """Report XML files written under the watched trees, via Linux inotify."""
+
+    def __init__(self, roots: List[Path]):
+        self.inotify = Inotify()
+        self.dirs = {}
+        self.roots = roots
+        for root in roots:
+            self._add_tree(root)
+
+    def _add_tree(self, root: Path) -> List[Path]:
+        """Watch a directory tree; returns XML files already inside it."""
+        found = []
+        for dirpath, _, filenames in os.walk(root):
+            wd = self.inotify.add_watch(dirpath)
+            if wd >= 0:
+                self.dirs[wd] = Path(dirpath)
+            found.extend(Path(dirpath) / f for f in filenames if f.endswith(".xml"))
+        return found
+
+    def changes(self, timeout: float) -> tuple[set, set]:
+        """Block up to timeout; return (changed, removed) XML paths."""
+        changed, removed = set(), set()
+        wait = timeout
+        # After the first event, keep draining briefly to coalesce bursts
+        while self.inotify.wait(wait):
+            for wd, mask, name in self.inotify.read():
+                if mask & IN_Q_OVERFLOW:
+                    for root in self.roots:
+                        changed.update(find_report_files(root))
+                    continue
+                if wd not in self.dirs:
+                    continue
+                path = self.dirs[wd] / name
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        changed.update(self._add_tree(path))
+                elif path.suffix == ".xml":
+                    if mask & (IN_DELETE | IN_MOVED_FROM):
+                        removed.add(path)
+                        changed.discard(path)
+                    elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                        changed.add(path)
+                        removed.discard(path)
+            wait = 0.05
+        return changed, removed
+
+    def close(self):
+        self.inotify.close()
+
+
+class PollingWatcher:
+    """Fallback watcher: rescan the trees and report files whose size/mtime settled."""
+
+    def __init__(self, roots: List[Path], interval: float = 0.25):
+        self.roots = roots
+        self.interval = interval
+        self.seen = self._scan()
+        self.pending = dict(self.seen)
+
+    def _scan(self) -> dict:
+        found = {}
+        for root in self.roots:
+            for xml_file in find_report_files(root):
+                try:
+                    st = xml_file.stat()
+                except FileNotFoundError:
+                    continue
+                found[xml_file] = (st.st_mtime_ns, st.st_size)
+        return found
+
+    def changes(self, timeout: float) -> tuple[set, set]:
+        """Wait one interval; return (changed, removed) XML paths."""
+        time.sleep(min(self.interval, timeout))
+        current = self._scan()
+        # Only report a file once it looked the same on two scans (writer finished)
+        changed = {
+            p for p, sig in current.items()
+            if self.pending.get(p) == sig and self.seen.get(p) != sig
+        }
+        removed = set(self.seen) - set(current)
+        for p in changed:
+            self.seen[p] = current[p]
+        for p in removed:
+            del self.seen[p]
+        self.pending = current
+        return changed, removed
+
+    def close(self):
+        pass
+
+
+class RunningTotals:
+    """Per-file suites with totals kept up to date as files change."""
+
+    def __init__(self):
+        self.suites = {}
+        self.tests = self.failures = self.errors = self.skipped = 0
+        self.time = 0.0
+
+    def _apply(self, suite: TestSuite, sign: int):
+        self.tests += sign * suite.tests
+        self.failures += sign * suite.failures
+        self.errors += sign * suite.errors
+        self.skipped += sign * suite.skipped
+        self.time += sign * suite.time
+
+    def update(self, path: Path) -> Optional[TestSuite]:
+        """Re-parse one file, replacing its previous contribution."""
+        old = self.suites.pop(path, None)
+        if old:
+            self._apply(old, -1)
+        suite = parse_junit_xml(path) if path.exists() else None
+        if suite:
+            self.suites[path] = suite
+            self._apply(suite, 1)
+        return suite
+
+    def results(self) -> TestResults:
+        return TestResults(
+            suites=list(self.suites.values()),
+            total_tests=self.tests,
+            total_failures=self.failures,
+            total_errors=self.errors,
+            total_skipped=self.skipped,
+            total_time=self.time,
+            success=(self.failures == 0 and self.errors == 0),
+        )
+
+
+def write_atomic(path: Path, text: str):
+    """Replace a file's contents so readers never see a partial write."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text + "\n")
+    os.replace(tmp, path)
+
+
+def watch_results(
+    report_paths: List[Path],
+    output_format: str = "summary",
+    output: Optional[Path] = None,
+    poll: bool = False,
+) -> TestResults:
+    """
+    Follow report directories and keep totals current until interrupted.
+
+    Only files that were created or rewritten are parsed. With the ndjson
+    format, testcase records for each updated file and a fresh totals record
+    are streamed to stdout; otherwise a one-line running total is printed.
+
+    Args:
+        report_paths: Report directories to follow
+        output_format: Format written to stdout / output on each update
+        output: Optional file rewritten with the full formatted results
+        poll: Force the polling watcher instead of inotify
+
+    Returns:
+        Final results when the watch is stopped
+    """
+    totals = RunningTotals()
+    watcher = None
+    if not poll:
+        try:
+            watcher = InotifyWatcher(report_paths)
+        except (OSError, AttributeError, TypeError):
+            print("WARNING: inotify unavailable, polling instead", file=sys.stderr)
+    if watcher is None:
+        watcher = PollingWatcher(report_paths)
+
+    changed = {f for p in report_paths for f in find_report_files(p)}
+    removed = set()
+    try:
+        while True:
+            if changed or removed:
+                for path in sorted(removed):
+                    totals.update(path)
+                    if output_format == "ndjson":
+                        print(json.dumps({"type": "removed", "file": str(path)}))
+                updated = [s for s in map(totals.update, sorted(changed)) if s]
+                results = totals.results()
+
+                if output_format == "ndjson":
+                    for suite in updated:
+                        for record in testcase_records(suite):
+                            print(json.dumps(record))
+                    print(json.dumps(totals_record(results)), flush=True)
+                else:
+                    print(
+                        f"[{time.strftime('%H:%M:%S')}] {len(changed)} updated | "
+                        f"{results.total_tests} tests, {results.total_failures} failed, "
+                        f"{results.total_errors} errors, {results.total_skipped} skipped "
+                        f"({len(totals.suites)} files, {results.total_time:.2f}s)",
+                        flush=True,
+                    )
+                if output:
+                    write_atomic(output, FORMATTERS[output_format](results))
+
+            changed, removed = watcher.changes(timeout=1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+    return totals.results()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Parse GdUnit4 JUnit XML test results"
@@ -232,14 +919,52 @@ def main():
 
     parser.add_argument(
         "report_dir",
-        help="Directory containing JUnit XML files"
+        nargs="+",
+        help="Directories (or XML files) containing JUnit results"
     )
     parser.add_argument(
         "--format", "-f",
-        choices=["summary", "json", "markdown"],
+        choices=list(FORMATTERS),
         default="summary",
         help="Output format (default: summary)"
     )
+    parser.add_argument(
+        "--merge", "-m",
+        metavar="OUTPUT",
+        help="Merge all reports into one consolidated JUnit XML file"
+    )
+    parser.add_argument(
+        "--diff", "-d",
+        metavar="BASELINE",
+        help="Compare against a baseline report directory (or XML file)"
+    )
+    parser.add_argument(
+        "--slower-ratio",
+        type=float,
+        default=0.5,
+        help="With --diff, report tests this much slower than baseline (default: 0.5 = 50%%)"
+    )
+    parser.add_argument(
+        "--slower-min",
+        type=float,
+        default=0.1,
+        help="With --diff, ignore slowdowns smaller than this many seconds (default: 0.1)"
+    )
+    parser.add_argument(
+        "--watch", "-w",
+        action="store_true",
+        help="Keep running and update totals as report files are written"
+    )
+    parser.add_argument(
+        "--watch-output",
+        metavar="FILE",
+        help="With --watch, rewrite this file with the full formatted results on each update"
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, poll the directories instead of using inotify"
+    )
     parser.add_argument(
         "--exit-code", "-e",
         action="store_true",
@@ -248,19 +973,56 @@ def main():
 
     args = parser.parse_args()
 
-    report_path = Path(args.report_dir)
-    if not report_path.exists():
-        print(f"ERROR: Report directory not found: {report_path}")
-        sys.exit(1)
+    report_paths = [Path(p) for p in args.report_dir]
+    for report_path in report_paths:
+        if args.watch:
+            # Normal before the first GdUnit4 run; watch it fill up
+            report_path.mkdir(parents=True, exist_ok=True)
+        elif not report_path.exists():
+            print(f"ERROR: Report directory not found: {report_path}")
+            sys.exit(1)
 
-    results = parse_results_directory(report_path)
+    if args.diff:
+        baseline_path = Path(args.diff)
+        if not baseline_path.exists():
+            print(f"ERROR: Baseline report directory not found: {baseline_path}")
+            sys.exit(1)
+        if args.format not in DIFF_FORMATTERS:
+            print(f"ERROR: --diff supports --format {', '.join(DIFF_FORMATTERS)}")
+            sys.exit(1)
+        diff = diff_results([baseline_path], report_paths, args.slower_ratio, args.slower_min)
+        print(DIFF_FORMATTERS[args.format](diff))
+        if args.exit_code and diff.newly_failing:
+            sys.exit(1)
+        return
 
-    if args.format == "summary":
-        print(format_summary(results))
-    elif args.format == "json":
-        print(format_json(results))
-    elif args.format == "markdown":
-        print(format_markdown(results))
+    if args.merge:
+        totals = merge_reports(report_paths, Path(args.merge))
+        print(
+            f"Merged {totals['files']} files into {args.merge}: "
+            f"{totals['suites']} suites, {totals['tests']} tests, "
+            f"{totals['failures']} failed, {totals['errors']} errors, "
+            f"{totals['skipped']} skipped"
+        )
+        if args.exit_code and (totals["failures"] or totals["errors"]):
+            sys.exit(1)
+        return
+
+    if args.watch:
+        results = watch_results(
+            report_paths,
+            output_format=args.format,
+            output=Path(args.watch_output) if args.watch_output else None,
+            poll=args.poll,
+        )
+        if args.format != "ndjson":
+            print(FORMATTERS[args.format](results))
+    else:
+        suites = []
+        for report_path in report_paths:
+            suites.extend(parse_results_directory(report_path).suites)
+        results = summarize_suites(suites)
+        print(FORMATTERS[args.format](results))
 
     if args.exit_code and not results.success:
         sys.exit(1)
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Run import → validate → test → export as one dependency-aware pipeline.
+
+Steps form a DAG around a single shared import. Everything downstream of it
+(validation, test shards, one export per preset) runs concurrently within a
+CPU and memory budget, longest-remaining-path first. A critical-path report
+shows where the wall time went.
+
+Usage:
+    python pipeline.py --project ./my-game --export Web=build/web/index.html
+    python pipeline.py --project ./my-game --test-shards 4 \\
+        --export Web=build/web/index.html --export Linux=build/linux/game.x86_64
+    python pipeline.py --project ./my-game --cpus 8 --memory-gb 12 --json pipeline.json
+"""
+
+import argparse
+import json
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from parse_results import merge_reports
+from project_index import ProjectIndex
+from run_tests import find_godot
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+TIMINGS_FILE = Path(".godot") / "pipeline_timings.json"
+
+# (cpus, memory GB) reserved per task kind; clamped to the budget
+TASK_COSTS = {
+    "import": (4, 2.0),
+    "validate": (1, 0.5),
+    "test": (1, 1.0),
+    "merge": (1, 0.1),
+    "export": (2, 2.0),
+}
+
+
+@dataclass
+class Task:
+    name: str
+    kind: str
+    deps: List[str] = field(default_factory=list)
+    cmd: Optional[List[str]] = None
+    func: Optional[Callable[[], int]] = None
+    # Run once deps have finished, even if some failed (e.g. report merging)
+    always: bool = False
+    # Directory emptied right before the task runs (e.g. a reused report dir)
+    clean: Optional[Path] = None
+    # Filled in when run
+    status: str = "pending"
+    exit_code: Optional[int] = None
+    start: float = 0.0
+    end: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def available_memory_gb() -> float:
+    """MemAvailable from /proc/meminfo (8 GB if unknown)."""
+    try:
+        for line in Path("/proc/meminfo").read_text().splitlines():
+            if line.startswith("MemAvailable:"):
+                return int(line.split()[1]) / 1024 / 1024
+    except OSError:
+        pass
+    return 8.0
+
+
+def discover_suites(index: ProjectIndex) -> List[Path]:
+    """GdUnit4 suites: *_test.gd / *Test.gd outside addons/."""
+    return [p for p in index.files("_test.gd", "Test.gd")]
+
+
+def split_shards(suites: List[Path], shards: int) -> List[List[Path]]:
+    """Greedy balance of suites across shards by file size."""
+    buckets = [[0, []] for _ in range(shards)]
+    for suite in sorted(suites, key=lambda p: -p.stat().st_size):
+        bucket = min(buckets, key=lambda b: b[0])
+        bucket[0] += suite.stat().st_size
+        bucket[1].append(suite)
+    return [b[1] for b in buckets if b[1]]
+
+
+def build_tasks(
+    project_path: Path,
+    exports: Dict[str, str],
+    test_shards: int,
+    validate: bool,
+    gate_exports: bool,
+    report_dir: Path,
+    python: str = sys.executable,
+) -> Dict[str, Task]:
+    """Model the pipeline as a DAG of tasks keyed by name."""
+    project = str(project_path)
+    tasks = {}
+
+    def add(task: Task):
+        tasks[task.name] = task
+
+    add(Task("import", "import", cmd=[
+        python, str(SCRIPT_DIR / "validate_project.py"), "--project", project, "--import-only",
+    ]))
+
+    gates = []
+    if validate:
+        # validate_project.py skips its own import when nothing changed since the shared one
+        add(Task("validate", "validate", ["import"], cmd=[
+            python, str(SCRIPT_DIR / "validate_project.py"), "--project", project, "--check-scripts",
+        ]))
+        gates.append("validate")
+
+    if test_shards > 0 and (project_path / "addons" / "gdUnit4").exists():
+        index = ProjectIndex(project_path)
+        index.scan()
+        shards = split_shards(discover_suites(index), test_shards)
+        shard_dirs = []
+        for i, shard in enumerate(shards, 1):
+            shard_dir = report_dir / f"shard-{i}"
+            shard_dirs.append(shard_dir)
+            cmd = [python, str(SCRIPT_DIR / "run_tests.py"), "--project", project, "--report", str(shard_dir)]
+            for suite in shard:
+                cmd.extend(["--suite", f"res://{suite.relative_to(project_path).as_posix()}"])
+            # Stale report_N folders from an earlier run would be merged as current
+            add(Task(f"test-{i}", "test", ["import"], cmd=cmd, clean=shard_dir))
+
+        if shard_dirs:
+            def merge(shard_dirs=shard_dirs) -> int:
+                existing = [d for d in shard_dirs if d.exists()]
+                if not existing:
+                    return 1
+                totals = merge_reports(existing, report_dir / "results.xml")
+                # A shard that crashed or hung may have left no report to count
+                shards_failed = any(
+                    tasks[f"test-{i}"].status != "passed"
+                    for i in range(1, len(shard_dirs) + 1)
+                )
+                return 1 if shards_failed or totals.get("failures") or totals.get("errors") else 0
+
+            add(Task(
+                "test-merge", "merge", [f"test-{i}" for i in range(1, len(shards) + 1)],
+                func=merge, always=True,
+            ))
+            gates.append("test-merge")
+
+    for preset, output in exports.items():
+        deps = ["import"] + (gates if gate_exports else [])
+        add(Task(f"export:{preset}", "export", deps, cmd=[
+            python, str(SCRIPT_DIR / "export_build.py"),
+            "--project", project, "--preset", preset, "--output", output,
+        ]))
+
+    return tasks
+
+
+def path_ranks(tasks: Dict[str, Task], estimates: Dict[str, float]) -> Dict[str, float]:
+    """Estimated time from each task's start to the end of the pipeline."""
+    dependents = {name: [] for name in tasks}
+    for task in tasks.values():
+        for dep in task.deps:
+            dependents[dep].append(task.name)
+
+    ranks = {}
+
+    def rank(name: str) -> float:
+        if name not in ranks:
+            ranks[name] = estimates.get(name, 1.0) + max(
+                (rank(d) for d in dependents[name]), default=0.0
+            )
+        return ranks[name]
+
+    for name in tasks:
+        rank(name)
+    return ranks
+
+
+def run_pipeline(
+    tasks: Dict[str, Task],
+    cpus: float,
+    memory_gb: float,
+    log_dir: Path,
+    estimates: Dict[str, float],
+    env: dict,
+    fail_fast: bool = False,
+) -> bool:
+    """
+    Execute the DAG under the CPU/memory budget.
+
+    Ready tasks are started in order of longest estimated remaining path
+    while their reserved cost fits; dependents of failed tasks are skipped.
+
+    Returns:
+        True if every task succeeded
+    """
+    log_dir.mkdir(parents=True, exist_ok=True)
+    ranks = path_ranks(tasks, estimates)
+    done = queue.Queue()
+    free_cpus, free_mem = cpus, memory_gb
+    running = {}
+    started = time.monotonic()
+    failed = False
+
+    def cost(task: Task) -> tuple:
+        task_cpus, task_mem = TASK_COSTS[task.kind]
+        return min(task_cpus, cpus), min(task_mem, memory_gb)
+
+    def execute(task: Task):
+        log_path = log_dir / f"{task.name.replace(':', '-')}.log"
+        try:
+            if task.clean is not None:
+                shutil.rmtree(task.clean, ignore_errors=True)
+            if task.func is not None:
+                code = task.func()
+            else:
+                with open(log_path, "w") as log:
+                    code = subprocess.run(
+                        task.cmd, stdout=log, stderr=subprocess.STDOUT, env=env
+                    ).returncode
+        except Exception as exc:  # reported like a failed step
+            log_path.write_text(f"{exc}\n")
+            code = 1
+        done.put((task.name, code))
+
+    def stamp() -> str:
+        return f"[{time.monotonic() - started:7.1f}s]"
+
+    while True:
+        for task in tasks.values():
+            blocking = ("skipped",) if task.always else ("failed", "skipped")
+            if task.status == "pending" and any(
+                tasks[d].status in blocking for d in task.deps
+            ):
+                task.status = "skipped"
+                print(f"{stamp()} skip  {task.name}", flush=True)
+
+        ready = sorted(
+            (t for t in tasks.values()
+             if t.status == "pending" and all(
+                 tasks[d].status in (("passed", "failed") if t.always else ("passed",))
+                 for d in t.deps
+             )),
+            key=lambda t: -ranks[t.name],
+        )
+        if not (failed and fail_fast):
+            for task in ready:
+                task_cpus, task_mem = cost(task)
+                if task_cpus > free_cpus or task_mem > free_mem:
+                    continue
+                free_cpus -= task_cpus
+                free_mem -= task_mem
+                task.status = "running"
+                task.start = time.monotonic() - started
+                running[task.name] = task
+                print(f"{stamp()} start {task.name}", flush=True)
+                threading.Thread(target=execute, args=(task,), daemon=True).start()
+
+        if not running:
+            break
+
+        name, code = done.get()
+        task = running.pop(name)
+        task.end = time.monotonic() - started
+        task.exit_code = code
+        task.status = "passed" if code == 0 else "failed"
+        task_cpus, task_mem = cost(task)
+        free_cpus += task_cpus
+        free_mem += task_mem
+        print(
+            f"{stamp()} {'done ' if code == 0 else 'FAIL '} {task.name} ({task.duration:.1f}s)",
+            flush=True,
+        )
+        if code != 0:
+            failed = True
+            log_path = log_dir / f"{task.name.replace(':', '-')}.log"
+            if log_path.exists():
+                for line in log_path.read_text(errors="replace").splitlines()[-20:]:
+                    print(f"    {line}")
+
+    for task in tasks.values():
+        if task.status == "pending":
+            task.status = "skipped"
+    return all(t.status == "passed" for t in tasks.values())
+
+
+def critical_path(tasks: Dict[str, Task]) -> List[Task]:
+    """Chain of tasks that determined the finish time, first to last."""
+    ran = [t for t in tasks.values() if t.end]
+    if not ran:
+        return []
+    path = [max(ran, key=lambda t: t.end)]
+    while True:
+        deps = [tasks[d] for d in path[-1].deps if tasks[d].end]
+        if not deps:
+            break
+        path.append(max(deps, key=lambda t: t.end))
+    return path[::-1]
+
+
+def format_report(tasks: Dict[str, Task], path: List[Task], width: int = 40) -> str:
+    """Per-task timeline plus the critical path with queueing gaps."""
+    total = max((t.end for t in tasks.values()), default=0.0) or 1.0
+    lines = []
+    lines.append("=" * 60)
+    lines.append("PIPELINE TIMING")
+    lines.append("=" * 60)
+    for task in sorted(tasks.values(), key=lambda t: (t.start if t.end else float("inf"), t.name)):
+        if not task.end:
+            lines.append(f"{task.name:20} {task.status}")
+            continue
+        first = int(task.start / total * width)
+        last = max(first + 1, int(task.end / total * width))
+        bar = " " * first + "#" * (last - first)
+        lines.append(f"{task.name:20} |{bar:{width}}| {task.duration:7.1f}s {task.status}")
+
+    lines.append("")
+    lines.append(f"CRITICAL PATH ({total:.1f}s wall):")
+    previous_end = 0.0
+    for task in path:
+        wait = task.start - previous_end
+        if wait > 0.05:
+            lines.append(f"  {wait:7.1f}s  {'(waiting for budget)':20} {wait / total:5.0%}")
+        lines.append(f"  {task.duration:7.1f}s  {task.name:20} {task.duration / total:5.0%}")
+        previous_end = task.end
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run import, validation, tests and exports as one concurrent pipeline",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --project ./my-game --export Web=build/web/index.html
+  %(prog)s --project ./my-game --test-shards 4 --export Web=build/web/index.html --export Linux=build/linux/game.x86_64
+  %(prog)s --project ./my-game --cpus 8 --memory-gb 12 --json pipeline.json
+  %(prog)s --project ./my-game --gate-exports --fail-fast --export Web=build/web/index.html
+        """
+    )
+
+    parser.add_argument(
+        "--project", "-p",
+        required=True,
+        help="Path to Godot project directory"
+    )
+    parser.add_argument(
+        "--export", "-e",
+        action="append",
+        default=[],
+        metavar="PRESET=OUTPUT",
+        help="Export a preset to an output path (repeatable)"
+    )
+    parser.add_argument(
+        "--test-shards", "-n",
+        type=int,
+        default=1,
+        help="Split GdUnit4 suites across this many concurrent runs (default: 1, 0 = no tests)"
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip structure and script validation"
+    )
+    parser.add_argument(
+        "--gate-exports",
+        action="store_true",
+        help="Only export after validation and tests passed"
+    )
+    parser.add_argument(
+        "--cpus",
+        type=float,
+        default=os.cpu_count() or 1,
+        help="CPU budget (default: all cores)"
+    )
+    parser.add_argument(
+        "--memory-gb",
+        type=float,
+        help="Memory budget in GB (default: 80%% of available memory)"
+    )
+    parser.add_argument(
+        "--report", "-r",
+        default="reports",
+        help="Directory for test reports (default: reports)"
+    )
+    parser.add_argument(
+        "--logs",
+        default="pipeline-logs",
+        help="Directory for per-step logs (default: pipeline-logs)"
+    )
+    parser.add_argument(
+        "--json",
+        help="Also write the timing report as JSON"
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Start no new steps after the first failure"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the steps and their dependencies without running them"
+    )
+
+    args = parser.parse_args()
+
+    project_path = Path(args.project).resolve()
+    if not (project_path / "project.godot").exists():
+        print(f"ERROR: No project.godot found in: {project_path}")
+        sys.exit(1)
+
+    exports = {}
+    for spec in args.export:
+        preset, sep, output = spec.partition("=")
+        if not sep or not preset or not output:
+            print(f"ERROR: --export expects PRESET=OUTPUT, got: {spec}")
+            sys.exit(1)
+        exports[preset] = str(Path(output).resolve())
+
+    tasks = build_tasks(
+        project_path, exports, args.test_shards, not args.no_validate,
+        args.gate_exports, Path(args.report).resolve(),
+    )
+
+    if args.dry_run:
+        for task in tasks.values():
+            deps = f" <- {', '.join(task.deps)}" if task.deps else ""
+            print(f"{task.name}{deps}")
+            if task.cmd:
+                print(f"    {' '.join(task.cmd)}")
+        sys.exit(0)
+
+    # Resolve Godot once; every step inherits it through $GODOT
+    env = dict(os.environ, GODOT=find_godot())
+
+    timings_path = project_path / TIMINGS_FILE
+    estimates = json.loads(timings_path.read_text()) if timings_path.exists() else {}
+    memory_gb = args.memory_gb or available_memory_gb() * 0.8
+
+    print(f"Running {len(tasks)} steps (budget: {args.cpus:g} CPUs, {memory_gb:.1f} GB)")
+    passed = run_pipeline(
+        tasks, args.cpus, memory_gb, Path(args.logs).resolve(), estimates, env, args.fail_fast
+    )
+
+    estimates.update({t.name: round(t.duration, 2) for t in tasks.values() if t.status == "passed"})
+    timings_path.parent.mkdir(parents=True, exist_ok=True)
+    timings_path.write_text(json.dumps(estimates, indent=2, sort_keys=True) + "\n")
+
+    path = critical_path(tasks)
+    print(format_report(tasks, path))
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            "passed": passed,
+            "tasks": [
+                {k: v for k, v in asdict(t).items() if k != "func"}
+                for t in tasks.values()
+            ],
+            "critical_path": [t.name for t in path],
+        }, indent=2, default=str) + "\n")
+
+    print("PIPELINE PASSED" if passed else "PIPELINE FAILED")
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Profile a Godot scene headless using the Performance monitors.
+
+Usage:
+    python profile_scene.py --project ./my-game --scene res://scenes/main.tscn --frames 600
+    python profile_scene.py --project ./my-game --scene res://scenes/main.tscn --seconds 20 --csv perf.csv
+    python profile_scene.py --project ./my-game --scene res://scenes/main.tscn --baseline perf-baseline.json
+"""
+
+import argparse
+import csv
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from run_tests import find_godot
+
+# Series recorded per frame, in CSV column order
+SERIES = [
+    "frame_ms",
+    "process_ms",
+    "physics_ms",
+    "objects",
+    "nodes",
+    "static_memory_mb",
+    "draw_calls",
+]
+
+# Series whose percentiles gate regressions; the others are reported as max/growth
+TIMING_SERIES = ["frame_ms", "process_ms", "physics_ms"]
+
+RUNNER_SCRIPT = """extends SceneTree
+
+# Generated by profile_scene.py; prints one PERF line when done.
+
+var config: Dictionary
+var series := {}
+var frame := 0
+var started_usec := 0
+var last_usec := 0
+var failed := false
+
+func _initialize() -> void:
+    config = JSON.parse_string(
+        FileAccess.get_file_as_string(OS.get_cmdline_user_args()[0]))
+    for key in config["series"]:
+        series[key] = []
+    var scene := load(config["scene"]) as PackedScene
+    if scene == null:
+        push_error("Cannot load scene: " + str(config["scene"]))
+        failed = true
+        quit(1)
+        return
+    root.add_child(scene.instantiate())
+    started_usec = Time.get_ticks_usec()
+    last_usec = started_usec
+
+func _process(_delta: float) -> bool:
+    if failed:
+        return true
+    var now := Time.get_ticks_usec()
+    frame += 1
+    if frame > int(config["warmup"]):
+        series["frame_ms"].append((now - last_usec) / 1000.0)
+        series["process_ms"].append(Performance.get_monitor(Performance.TIME_PROCESS) * 1000.0)
+        series["physics_ms"].append(Performance.get_monitor(Performance.TIME_PHYSICS_PROCESS) * 1000.0)
+        series["objects"].append(Performance.get_monitor(Performance.OBJECT_COUNT))
+        series["nodes"].append(Performance.get_monitor(Performance.OBJECT_NODE_COUNT))
+        series["static_memory_mb"].append(Performance.get_monitor(Performance.MEMORY_STATIC) / 1048576.0)
+        series["draw_calls"].append(Performance.get_monitor(Performance.RENDER_TOTAL_DRAW_CALLS_IN_FRAME))
+    last_usec = now
+
+    var recorded: int = series["frame_ms"].size()
+    var done_frames: bool = int(config["frames"]) > 0 and recorded >= int(config["frames"])
+    var done_time: bool = float(config["seconds"]) > 0 and now - started_usec >= float(config["seconds"]) * 1000000.0
+    if done_frames or done_time:
+        print("PERF " + JSON.stringify(series))
+        return true
+    return false
+"""
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize_series(series: dict) -> dict:
+    """Percentiles for timings; max and first-to-last growth for counters."""
+    summary = {"frames": len(series["frame_ms"])}
+    for key in SERIES:
+        values = series.get(key, [])
+        ordered = sorted(values)
+        if key in TIMING_SERIES:
+            summary[key] = {
+                "mean": sum(values) / len(values) if values else 0.0,
+                "p50": percentile(ordered, 0.50),
+                "p95": percentile(ordered, 0.95),
+                "p99": percentile(ordered, 0.99),
+                "max": ordered[-1] if ordered else 0.0,
+            }
+        else:
+            summary[key] = {
+                "max": ordered[-1] if ordered else 0,
+                "growth": values[-1] - values[0] if values else 0,
+            }
+    return summary
+
+
+def profile_scene(
+    project_path: Path,
+    godot: str,
+    scene: str,
+    frames: int,
+    seconds: float,
+    warmup: int,
+    headless: bool = True,
+    fixed_fps: int = None,
+    timeout: int = 600,
+    verbose: bool = False,
+) -> dict:
+    """Run the scene in Godot and return its per-frame series (empty on failure)."""
+    work_dir = project_path / ".godot" / "profile"
+    work_dir.mkdir(parents=True, exist_ok=True)
+    (work_dir / "runner.gd").write_text(RUNNER_SCRIPT)
+    config = work_dir / "config.json"
+    config.write_text(json.dumps({
+        "scene": scene,
+        "frames": frames,
+        "seconds": seconds,
+        "warmup": warmup,
+        "series": SERIES,
+    }))
+
+    cmd = [godot, "--path", str(project_path)]
+    if headless:
+        cmd.append("--headless")
+    if fixed_fps:
+        cmd.extend(["--fixed-fps", str(fixed_fps)])
+    cmd.extend(["-s", "res://.godot/profile/runner.gd", "--", str(config)])
+
+    if verbose:
+        print(f"Running: {' '.join(cmd)}")
+
+    result = subprocess.run(
+        cmd,
+        cwd=project_path,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+
+    # A script error leaves the runner profiling whatever did load
+    output = result.stdout + result.stderr
+    if result.returncode != 0 or "SCRIPT ERROR" in output:
+        print(output)
+        return {}
+
+    for line in result.stdout.splitlines():
+        if line.startswith("PERF "):
+            return json.loads(line[len("PERF "):])
+        if verbose:
+            print(line)
+
+    print(output)
+    return {}
+
+
+def write_csv(series: dict, path: Path):
+    """Write the per-frame series as one CSV row per frame."""
+    with open(path, "w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["frame", *SERIES])
+        for frame, row in enumerate(zip(*(series[key] for key in SERIES))):
+            writer.writerow([frame, *(f"{value:.4g}" for value in row)])
+
+
+def compare_to_baseline(summary: dict, baseline: dict, tolerance: float) -> list[str]:
+    """List regressions: slower timing percentiles or more memory/node growth."""
+    regressions = []
+    for key in TIMING_SERIES:
+        for stat in ("p95", "p99"):
+            base = baseline.get(key, {}).get(stat)
+            current = summary[key][stat]
+            if base and current > base * (1 + tolerance):
+                regressions.append(f"{key} {stat}: {base:.3f} -> {current:.3f} ms")
+    for key in ("static_memory_mb", "nodes", "objects"):
+        base = baseline.get(key, {}).get("max")
+        current = summary[key]["max"]
+        if base and current > base * (1 + tolerance):
+            regressions.append(f"{key} max: {base:.4g} -> {current:.4g}")
+    return regressions
+
+
+def format_summary(scene: str, summary: dict, regressions: list[str]) -> str:
+    """Format percentile tables and any regressions."""
+    lines = []
+    lines.append("=" * 60)
+    lines.append(f"SCENE PROFILE: {scene} ({summary['frames']} frames)")
+    lines.append("=" * 60)
+    lines.append(f"{'':12} {'mean':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for key in TIMING_SERIES:
+        s = summary[key]
+        lines.append(
+            f"{key:12} {s['mean']:8.3f} {s['p50']:8.3f} {s['p95']:8.3f} "
+            f"{s['p99']:8.3f} {s['max']:8.3f}"
+        )
+    lines.append("")
+    for key in SERIES:
+        if key not in TIMING_SERIES:
+            s = summary[key]
+            lines.append(f"{key:18} max {s['max']:.4g}  growth {s['growth']:+.4g}")
+    lines.append("=" * 60)
+    if regressions:
+        lines.append("REGRESSIONS:")
+        for regression in regressions:
+            lines.append(f"  {regression}")
+    else:
+        lines.append("NO REGRESSIONS")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Profile a Godot scene headless using Performance monitors",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --project ./my-game --scene res://scenes/main.tscn --frames 600
+  %(prog)s --project ./my-game --scene res://scenes/level1.tscn --seconds 30 --fixed-fps 60
+  %(prog)s --project ./my-game --scene res://scenes/main.tscn --save-baseline perf.json
+  %(prog)s --project ./my-game --scene res://scenes/main.tscn --baseline perf.json
+
+Draw calls are only reported when running with a renderer (--no-headless).
+        """
+    )
+
+    parser.add_argument(
+        "--project", "-p",
+        required=True,
+        help="Path to Godot project directory"
+    )
+    parser.add_argument(
+        "--scene", "-s",
+        required=True,
+        help="Scene to profile (res:// path)"
+    )
+    parser.add_argument(
+        "--frames", "-n",
+        type=int,
+        default=600,
+        help="Frames to record after warmup (default: 600, 0 = use --seconds)"
+    )
+    parser.add_argument(
+        "--seconds",
+        type=float,
+        default=0,
+        help="Stop after this many seconds instead of a frame count"
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=30,
+        help="Frames to skip before recording (default: 30)"
+    )
+    parser.add_argument(
+        "--fixed-fps",
+        type=int,
+        help="Pass --fixed-fps to Godot for deterministic physics steps"
+    )
+    parser.add_argument(
+        "--no-headless",
+        action="store_true",
+        help="Run with a display and renderer (enables draw-call counts)"
+    )
+    parser.add_argument(
+        "--csv",
+        help="Write the per-frame time series to this CSV file"
+    )
+    parser.add_argument(
+        "--baseline", "-b",
+        help="Baseline summary JSON to compare against"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        help="Write this run's summary as a baseline JSON"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.15,
+        help="Allowed increase vs baseline as a fraction (default: 0.15)"
+    )
+    parser.add_argument(
+        "--format", "-f",
+        choices=["summary", "json"],
+        default="summary",
+        help="Output format (default: summary)"
+    )
+    parser.add_argument(
+        "--timeout", "-t",
+        type=int,
+        default=600,
+        help="Timeout in seconds (default: 600)"
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable verbose output"
+    )
+
+    args = parser.parse_args()
+
+    project_path = Path(args.project).resolve()
+    if not (project_path / "project.godot").exists():
+        print(f"ERROR: No project.godot found in: {project_path}")
+        sys.exit(1)
+
+    # A mistyped --baseline must not quietly turn the regression gate off
+    if args.baseline and not Path(args.baseline).exists():
+        print(f"ERROR: Baseline not found: {args.baseline}")
+        sys.exit(1)
+
+    if args.frames <= 0 and not args.seconds:
+        print("ERROR: --frames 0 needs --seconds")
+        sys.exit(1)
+
+    frames = 0 if args.seconds else args.frames
+    godot = find_godot()
+
+    try:
+        series = profile_scene(
+            project_path, godot, args.scene, frames, args.seconds, args.warmup,
+            headless=not args.no_headless, fixed_fps=args.fixed_fps,
+            timeout=args.timeout, verbose=args.verbose,
+        )
+    except subprocess.TimeoutExpired:
+        print(f"ERROR: Profiling timed out after {args.timeout} seconds")
+        sys.exit(1)
+
+    if not series or not series.get("frame_ms"):
+        print("ERROR: No performance samples were produced.")
+        sys.exit(1)
+
+    if args.csv:
+        write_csv(series, Path(args.csv))
+
+    summary = summarize_series(series)
+
+    baseline = {}
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+    regressions = compare_to_baseline(summary, baseline, args.tolerance)
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(summary, indent=2) + "\n")
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.format == "json":
+        print(json.dumps({"summary": summary, "regressions": regressions}, indent=2))
+    else:
+        print(format_summary(args.scene, summary, regressions))
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
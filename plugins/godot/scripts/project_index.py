@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Fast, persistent file index for Godot projects.
+
+Walks the project with os.scandir, pruning VCS/cache/tool directories and
+any directory containing a `.gdignore` file (the same rule Godot's importer
+uses). The path/size/mtime index is saved under `.godot/` so later runs can
+tell exactly which files were added, modified or removed.
+
+Usage:
+    python project_index.py --project ./my-game
+    python project_index.py --project ./my-game --changed
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from fs_watch import IN_CREATE, IN_ISDIR, IN_MOVED_TO, IN_Q_OVERFLOW, Inotify
+
+INDEX_FILE = Path(".godot") / "file_index.json"
+INDEX_VERSION = 1
+
+# Directory names never worth descending into
+DEFAULT_IGNORED_DIRS = {
+    ".godot", ".import", ".git", ".hg", ".svn",
+    "__pycache__", ".venv", "venv", "node_modules",
+}
+
+# (size, mtime_ns) keyed by project-relative POSIX path
+Entries = Dict[str, Tuple[int, int]]
+
+
+@dataclass
+class IndexDiff:
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> List[str]:
+        return self.added + self.modified
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+def scan_tree(
+    root: Path,
+    ignored_dirs: Iterable[str] = DEFAULT_IGNORED_DIRS,
+    ignore_patterns: Iterable[str] = (),
+    honor_gdignore: bool = True,
+    prefix: str = "",
+    dirs: Optional[List[str]] = None,
+) -> Entries:
+    """
+    Walk root with os.scandir, pruning ignored directories.
+
+    Args:
+        root: Directory to walk
+        ignored_dirs: Directory names never descended into
+        ignore_patterns: fnmatch globs matched against relative paths
+        honor_gdignore: Prune directories (other than the project root) holding a .gdignore
+        prefix: Relative path of root inside the project ("" or ending in "/")
+        dirs: If given, receives the relative path of every directory walked
+
+    Returns:
+        (size, mtime_ns) per relative file path
+    """
+    ignored_dirs = set(ignored_dirs)
+    ignore_patterns = list(ignore_patterns)
+    entries = {}
+    stack = [(root, prefix)]
+
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                children = list(it)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+
+        if honor_gdignore and prefix and any(c.name == ".gdignore" for c in children):
+            continue
+        if dirs is not None:
+            dirs.append(prefix)
+
+        for child in children:
+            rel = f"{prefix}{child.name}"
+            if ignore_patterns and any(fnmatch.fnmatch(rel, p) for p in ignore_patterns):
+                continue
+            try:
+                if child.is_dir(follow_symlinks=False):
+                    if child.name not in ignored_dirs:
+                        stack.append((Path(child.path), f"{rel}/"))
+                elif child.is_file():
+                    st = child.stat()
+                    entries[rel] = (st.st_size, st.st_mtime_ns)
+            except FileNotFoundError:
+                continue
+
+    return entries
+
+
+def diff_entries(old: Entries, new: Entries) -> IndexDiff:
+    """Compare two scans."""
+    diff = IndexDiff()
+    for path, sig in new.items():
+        previous = old.get(path)
+        if previous is None:
+            diff.added.append(path)
+        elif previous != sig:
+            diff.modified.append(path)
+    diff.removed = [path for path in old if path not in new]
+    return diff
+
+
+class ProjectIndex:
+    """Persistent path/size/mtime index of a Godot project."""
+
+    def __init__(self, project_path: Path, ignore_patterns: Iterable[str] = ()):
+        self.project_path = Path(project_path).resolve()
+        self.ignore_patterns = list(ignore_patterns)
+        self.index_path = self.project_path / INDEX_FILE
+        self.entries: Entries = {}
+        self.meta: dict = {}
+        self._load()
+
+    def _load(self):
+        try:
+            data = json.loads(self.index_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.entries = {path: tuple(sig) for path, sig in data.get("files", {}).items()}
+        self.meta = data.get("meta", {})
+
+    def save(self):
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({
+            "version": INDEX_VERSION,
+            "meta": self.meta,
+            "files": self.entries,
+        }, separators=(",", ":")))
+        os.replace(tmp, self.index_path)
+
+    def scan(self, save: bool = True, dirs: Optional[List[str]] = None) -> IndexDiff:
+        """Rescan the project; return what changed since the last saved scan."""
+        new_entries = scan_tree(
+            self.project_path, ignore_patterns=self.ignore_patterns, dirs=dirs
+        )
+        diff = diff_entries(self.entries, new_entries)
+        self.entries = new_entries
+        if save:
+            self.save()
+        return diff
+
+    def _ignored(self, rel: str) -> bool:
+        if any(part in DEFAULT_IGNORED_DIRS for part in rel.split("/")):
+            return True
+        return any(fnmatch.fnmatch(rel, p) for p in self.ignore_patterns)
+
+    def update(self, paths: Iterable[str], save: bool = True) -> IndexDiff:
+        """
+        Refresh only the given relative paths (files or directories).
+
+        Much cheaper than scan() when the caller already knows what changed,
+        e.g. from filesystem events.
+        """
+        old, new = {}, {}
+        for rel in set(paths):
+            if self._ignored(rel):
+                continue
+            full = self.project_path / rel
+            subtree = [p for p in self.entries if p == rel or p.startswith(rel + "/")]
+            old.update((p, self.entries[p]) for p in subtree)
+            if full.is_dir():
+                new.update(scan_tree(
+                    full, ignore_patterns=self.ignore_patterns, prefix=rel + "/"
+                ))
+            elif full.is_file():
+                st = full.stat()
+                new[rel] = (st.st_size, st.st_mtime_ns)
+
+        diff = diff_entries(old, new)
+        for rel in diff.removed:
+            del self.entries[rel]
+        self.entries.update(new)
+        if save and diff:
+            self.save()
+        return diff
+
+    def files(self, *suffixes: str, include_addons: bool = False) -> List[Path]:
+        """Absolute paths of indexed files with the given suffixes."""
+        found = []
+        for rel in sorted(self.entries):
+            if suffixes and not rel.endswith(suffixes):
+                continue
+            if not include_addons and rel.split("/", 1)[0] == "addons":
+                continue
+            found.append(self.project_path / rel)
+        return found
+
+    def digest(self) -> str:
+        """Fingerprint of the current file set, for "anything changed?" checks."""
+        h = hashlib.sha1()
+        for rel in sorted(self.entries):
+            size, mtime = self.entries[rel]
+            h.update(f"{rel}\0{size}\0{mtime}\n".encode("utf-8"))
+        return h.hexdigest()
+
+    def mark(self, name: str):
+        """Remember the current digest under a name (e.g. after a clean import)."""
+        self.meta[name] = self.digest()
+        self.save()
+
+    def unchanged_since(self, name: str) -> bool:
+        return self.meta.get(name) == self.digest()
+
+
+class ProjectWatcher:
+    """
+    Block until project files change and return the index diff.
+
+    Uses Linux inotify on every indexed directory, falling back to periodic
+    rescans. Bursts of events (editor saves, VCS checkouts) are coalesced
+    until the tree has been quiet for the debounce period.
+    """
+
+    def __init__(self, index: ProjectIndex, poll: bool = False, interval: float = 0.5):
+        self.index = index
+        self.interval = interval
+        self.inotify = None
+        self.dirs = {}
+        if not poll:
+            try:
+                self.inotify = Inotify()
+            except (OSError, AttributeError, TypeError):
+                print("WARNING: inotify unavailable, polling instead", file=sys.stderr)
+            else:
+                dirs = []
+                self.index.scan(dirs=dirs)
+                self._add_watches(dirs)
+
+    def _add_watches(self, rel_dirs: List[str]):
+        for rel in rel_dirs:
+            wd = self.inotify.add_watch(self.index.project_path / rel)
+            if wd >= 0:
+                self.dirs[wd] = rel
+
+    def _read_events(self, paths: Set[str]) -> bool:
+        """Drain pending events into paths; returns True on queue overflow."""
+        overflow = False
+        for wd, mask, name in self.inotify.read():
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if wd not in self.dirs:
+                continue
+            rel = f"{self.dirs[wd]}{name}"
+            if name == ".gdignore":
+                # The directory itself becomes (un)ignored
+                rel = self.dirs[wd].rstrip("/")
+            paths.add(rel)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                dirs = []
+                scan_tree(
+                    self.index.project_path / rel,
+                    ignore_patterns=self.index.ignore_patterns,
+                    prefix=rel + "/",
+                    dirs=dirs,
+                )
+                self._add_watches(dirs)
+        return overflow
+
+    def wait(self, debounce: float = 0.15) -> IndexDiff:
+        """Block until at least one indexed file changed; return the diff."""
+        while True:
+            if self.inotify is None:
+                time.sleep(self.interval)
+                diff = self.index.scan()
+            else:
+                paths = set()
+                overflow = False
+                timeout = None
+                while self.inotify.wait(timeout):
+                    overflow |= self._read_events(paths)
+                    timeout = debounce
+                if overflow or "" in paths:
+                    dirs = []
+                    diff = self.index.scan(dirs=dirs)
+                    watched = set(self.dirs.values())
+                    self._add_watches([d for d in dirs if d not in watched])
+                else:
+                    diff = self.index.update(paths)
+            if diff:
+                return diff
+
+    def close(self):
+        if self.inotify is not None:
+            self.inotify.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build or update the fast file index of a Godot project"
+    )
+    parser.add_argument(
+        "--project", "-p",
+        required=True,
+        help="Path to Godot project directory"
+    )
+    parser.add_argument(
+        "--ignore",
+        action="append",
+        default=[],
+        help="Extra glob (relative path) to skip (repeatable)"
+    )
+    parser.add_argument(
+        "--changed", "-c",
+        action="store_true",
+        help="List files added/modified/removed since the last scan"
+    )
+
+    args = parser.parse_args()
+
+    project_path = Path(args.project).resolve()
+    if not project_path.exists():
+        print(f"ERROR: Project directory not found: {project_path}")
+        sys.exit(1)
+
+    index = ProjectIndex(project_path, args.ignore)
+    diff = index.scan()
+
+    total = sum(size for size, _ in index.entries.values())
+    print(f"Indexed {len(index.entries)} files ({total / 1024 / 1024:.2f} MB)")
+    print(f"  +{len(diff.added)} ~{len(diff.modified)} -{len(diff.removed)} since last scan")
+
+    if args.changed:
+        for rel in diff.added:
+            print(f"  A {rel}")
+        for rel in diff.modified:
+            print(f"  M {rel}")
+        for rel in diff.removed:
+            print(f"  D {rel}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Run GDScript micro-benchmarks headless and compare them against a baseline.
+
+Benchmarks are `bench_*` functions in `*_bench.gd` scripts. Each script is
+instantiated once; an optional `before_bench()` runs first.
+
+Usage:
+    python run_benchmarks.py --project ./my-game
+    python run_benchmarks.py --project ./my-game --save-baseline bench-baseline.json
+    python run_benchmarks.py --project ./my-game --baseline bench-baseline.json --tolerance 0.1
+"""
+
+import argparse
+import json
+import math
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from project_index import ProjectIndex
+from run_tests import find_godot
+
+BENCH_FUNC = re.compile(r"^func\s+(bench_\w+)\s*\(\s*\)", re.MULTILINE)
+
+# Two-sided 95% Student t critical values by degrees of freedom
+T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086,
+    25: 2.060, 30: 2.042,
+}
+
+RUNNER_SCRIPT = """extends SceneTree
+
+# Generated by run_benchmarks.py; prints one BENCH line per benchmark.
+
+func _initialize() -> void:
+    var config: Dictionary = JSON.parse_string(
+        FileAccess.get_file_as_string(OS.get_cmdline_user_args()[0]))
+    for entry in config["scripts"]:
+        var obj = load(entry["path"]).new()
+        if obj is Node:
+            root.add_child(obj)
+        if obj.has_method("before_bench"):
+            obj.before_bench()
+        for fn in entry["functions"]:
+            for i in int(config["warmup"]) * int(config["iterations"]):
+                obj.call(fn)
+            var samples := []
+            for s in int(config["samples"]):
+                var start := Time.get_ticks_usec()
+                for i in int(config["iterations"]):
+                    obj.call(fn)
+                var elapsed := Time.get_ticks_usec() - start
+                samples.append(elapsed * 1000.0 / int(config["iterations"]))
+            print("BENCH " + JSON.stringify(
+                {"path": entry["path"], "name": fn, "samples": samples}))
+        if obj is Node:
+            obj.queue_free()
+        elif not (obj is RefCounted):
+            obj.free()
+    quit()
+"""
+
+
+def discover_benchmarks(project_path: Path) -> list[dict]:
+    """Find `bench_*` functions in `*_bench.gd` scripts outside addons/."""
+    index = ProjectIndex(project_path)
+    index.scan()
+    found = []
+    for script in index.files("_bench.gd"):
+        rel_path = script.relative_to(project_path)
+        functions = BENCH_FUNC.findall(script.read_text(errors="replace"))
+        if functions:
+            found.append({"path": f"res://{rel_path.as_posix()}", "functions": functions})
+    return found
+
+
+def t_critical(df: int) -> float:
+    """Nearest tabulated t value at or below df (normal beyond 30)."""
+    if df > 30:
+        return 1.96
+    return T_95[max(k for k in T_95 if k <= df)]
+
+
+def summarize_samples(samples: list[float]) -> dict:
+    """Mean/median/stddev and a 95% confidence interval of the mean (ns per call)."""
+    n = len(samples)
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples) if n > 1 else 0.0
+    half_width = t_critical(n - 1) * stdev / math.sqrt(n) if n > 1 else 0.0
+    return {
+        "n": n,
+        "mean": mean,
+        "median": statistics.median(samples),
+        "stdev": stdev,
+        "ci_low": mean - half_width,
+        "ci_high": mean + half_width,
+    }
+
+
+def run_benchmarks(
+    project_path: Path,
+    godot: str,
+    benchmarks: list[dict],
+    warmup: int,
+    samples: int,
+    iterations: int,
+    timeout: int,
+    verbose: bool = False,
+) -> tuple[int, dict]:
+    """Run benchmarks in one headless Godot process; return its exit code and stats."""
+    work_dir = project_path / ".godot" / "benchmarks"
+    work_dir.mkdir(parents=True, exist_ok=True)
+    runner = work_dir / "runner.gd"
+    config = work_dir / "config.json"
+    runner.write_text(RUNNER_SCRIPT)
+    config.write_text(json.dumps({
+        "scripts": benchmarks,
+        "warmup": warmup,
+        "samples": samples,
+        "iterations": iterations,
+    }))
+
+    cmd = [
+        godot,
+        "--headless",
+        "--path", str(project_path),
+        "-s", "res://.godot/benchmarks/runner.gd",
+        "--", str(config),
+    ]
+    if verbose:
+        print(f"Running: {' '.join(cmd)}")
+
+    result = subprocess.run(
+        cmd,
+        cwd=project_path,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+
+    stats = {}
+    for line in result.stdout.splitlines():
+        if line.startswith("BENCH "):
+            record = json.loads(line[len("BENCH "):])
+            stats[f"{record['path']}::{record['name']}"] = summarize_samples(record["samples"])
+        elif verbose:
+            print(line)
+
+    if result.returncode != 0 or not stats:
+        print(result.stdout + result.stderr)
+    return result.returncode, stats
+
+
+def compare_to_baseline(stats: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Return keys that regressed beyond tolerance.
+
+    A benchmark regresses when its mean is more than `tolerance` slower than
+    the baseline mean and the whole confidence interval sits above the
+    baseline, so noise alone does not fail the run. A baseline entry with
+    no result (a deleted or crashed benchmark) is a regression too.
+    """
+    regressions = [key for key in baseline if key not in stats]
+    for key, current in stats.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        limit = base["mean"] * (1 + tolerance)
+        if current["mean"] > limit and current["ci_low"] > base["mean"]:
+            regressions.append(key)
+    return regressions
+
+
+def format_report(stats: dict, baseline: dict, regressions: list[str]) -> str:
+    """Format a results table in microseconds per call."""
+    lines = []
+    lines.append("=" * 60)
+    lines.append("BENCHMARK RESULTS (µs per call)")
+    lines.append("=" * 60)
+    for key, s in stats.items():
+        line = (
+            f"{s['mean'] / 1000:10.3f} ±{(s['ci_high'] - s['mean']) / 1000:.3f}  "
+            f"median {s['median'] / 1000:.3f}  sd {s['stdev'] / 1000:.3f}  {key}"
+        )
+        if key in baseline:
+            change = s["mean"] / baseline[key]["mean"] - 1
+            line += f"  ({change:+.1%} vs baseline)"
+        if key in regressions:
+            line += "  REGRESSION"
+        lines.append(line)
+    for key in regressions:
+        if key not in stats:
+            lines.append(f"{'MISSING':>10}  {key}  (in baseline, no result)  REGRESSION")
+    lines.append("=" * 60)
+    if regressions:
+        lines.append(f"{len(regressions)} BENCHMARKS REGRESSED")
+    else:
+        lines.append("NO REGRESSIONS")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run GDScript micro-benchmarks headless",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --project ./my-game
+  %(prog)s --project ./my-game --filter pathfinding --samples 30
+  %(prog)s --project ./my-game --save-baseline bench-baseline.json
+  %(prog)s --project ./my-game --baseline bench-baseline.json --tolerance 0.1
+        """
+    )
+
+    parser.add_argument(
+        "--project", "-p",
+        required=True,
+        help="Path to Godot project directory"
+    )
+    parser.add_argument(
+        "--filter", "-f",
+        help="Only run benchmarks whose path::name contains this"
+    )
+    parser.add_argument(
+        "--warmup", "-w",
+        type=int,
+        default=3,
+        help="Untimed warmup rounds per benchmark (default: 3)"
+    )
+    parser.add_argument(
+        "--samples", "-n",
+        type=int,
+        default=20,
+        help="Timed samples per benchmark (default: 20)"
+    )
+    parser.add_argument(
+        "--iterations", "-i",
+        type=int,
+        default=100,
+        help="Calls per sample (default: 100)"
+    )
+    parser.add_argument(
+        "--baseline", "-b",
+        help="Baseline JSON to compare against"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        help="Write these results as a baseline JSON"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed slowdown vs baseline as a fraction (default: 0.10)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["summary", "json"],
+        default="summary",
+        help="Output format (default: summary)"
+    )
+    parser.add_argument(
+        "--timeout", "-t",
+        type=int,
+        default=600,
+        help="Timeout in seconds (default: 600)"
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable verbose output"
+    )
+
+    args = parser.parse_args()
+
+    project_path = Path(args.project).resolve()
+    if not (project_path / "project.godot").exists():
+        print(f"ERROR: No project.godot found in: {project_path}")
+        sys.exit(1)
+
+    # A mistyped --baseline must not quietly turn the regression gate off
+    if args.baseline and not Path(args.baseline).exists():
+        print(f"ERROR: Baseline not found: {args.baseline}")
+        sys.exit(1)
+
+    benchmarks = discover_benchmarks(project_path)
+    if args.filter:
+        for entry in benchmarks:
+            entry["functions"] = [
+                fn for fn in entry["functions"]
+                if args.filter in f"{entry['path']}::{fn}"
+            ]
+        benchmarks = [entry for entry in benchmarks if entry["functions"]]
+    if not benchmarks:
+        print("ERROR: No benchmarks found (bench_* functions in *_bench.gd files).")
+        sys.exit(1)
+
+    godot = find_godot()
+    count = sum(len(entry["functions"]) for entry in benchmarks)
+    print(f"Running {count} benchmarks ({args.samples} samples x {args.iterations} calls)...")
+
+    try:
+        exit_code, stats = run_benchmarks(
+            project_path, godot, benchmarks,
+            args.warmup, args.samples, args.iterations, args.timeout, args.verbose,
+        )
+    except subprocess.TimeoutExpired:
+        print(f"ERROR: Benchmarks timed out after {args.timeout} seconds")
+        sys.exit(1)
+
+    if not stats:
+        print("ERROR: No benchmark results were produced.")
+        sys.exit(1)
+    if exit_code != 0:
+        print(f"ERROR: Godot exited with code {exit_code}; results are incomplete.")
+        sys.exit(1)
+
+    baseline = {}
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        if args.filter:
+            # Entries the filter excluded were not meant to run
+            baseline = {key: value for key, value in baseline.items() if args.filter in key}
+    regressions = compare_to_baseline(stats, baseline, args.tolerance)
+
+    if args.save_baseline:
+        # Merge so a filtered run only refreshes the benchmarks it measured
+        baseline_path = Path(args.save_baseline)
+        saved = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+        saved.update(stats)
+        baseline_path.write_text(json.dumps(saved, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if args.format == "json":
+        print(json.dumps({"results": stats, "regressions": regressions}, indent=2))
+    else:
+        print(format_report(stats, baseline, regressions))
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,14 +6,28 @@ Usage:
     python run_tests.py --project ./my-game
     python run_tests.py --project ./my-game --filter "player"
     python run_tests.py --project ./my-game --report ./reports
+    python run_tests.py --project ./my-game --flaky-list .gdunit-flaky.json --flaky-mode last
+    python run_tests.py --project ./my-game --rerun-failed ./reports
+    python run_tests.py --project ./my-game --report ./reports --test-timeout 30 --suite-timeout 120
 """
 
 import argparse
+import json
+import shutil
 import subprocess
 import sys
 import os
+import queue
+import re
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
+from parse_results import merge_reports, parse_results_directory
+from project_index import ProjectIndex
+
 
 def find_godot() -> str:
     """Find the Godot executable."""
@@ -39,12 +53,213 @@ def find_godot() -> str:
     sys.exit(1)
 
 
+def suite_path_map(project_path: Path) -> dict:
+    """Map script stems (GdUnit4 suite names) to res:// paths with one project scan."""
+    index = ProjectIndex(project_path)
+    index.scan()
+    paths = {}
+    for script in index.files(".gd"):
+        paths.setdefault(script.stem, f"res://{script.relative_to(project_path).as_posix()}")
+    return paths
+
+
+def find_suite_path(suite_paths: dict, suite_name: str) -> str:
+    """Map a JUnit classname (GdUnit4 suite name) to its res:// script path."""
+    if suite_name.startswith("res://"):
+        return suite_name
+    return suite_paths.get(suite_name, suite_name)
+
+
+def load_flaky_list(path: str) -> dict:
+    """Load a flake list written by detect_flaky.py (classname::name -> entry)."""
+    flaky_path = Path(path)
+    if not flaky_path.exists():
+        return {}
+    return json.loads(flaky_path.read_text()).get("tests", {})
+
+
+# GdUnit4 console progress lines (colour codes stripped first)
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+SUITE_START = re.compile(r"Run Test Suite:?\s+(res://\S+)")
+TEST_START = re.compile(r"Run Test:?\s+(res://\S+?)\s*>\s*(\w+)")
+TEST_END = re.compile(r"\b(PASSED|FAILED|ERRORS?|SKIPPED|ABORTED|FLAKY)\b")
+
+
+def watch_process(
+    cmd: list[str],
+    cwd: Path,
+    deadline: float,
+    test_timeout: float = None,
+    suite_timeout: float = None,
+    idle_timeout: float = None,
+    quiet: bool = False,
+) -> tuple[int, dict]:
+    """
+    Run GdUnit4 while following its output, killing it if progress stalls.
+
+    Returns:
+        (exit code, hang record or None)
+    """
+    process = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+    )
+    lines = queue.Queue()
+
+    def reader():
+        for line in process.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    threading.Thread(target=reader, daemon=True).start()
+
+    suite = test = None
+    now = time.monotonic()
+    last_output = suite_started = test_started = now
+
+    while True:
+        try:
+            line = lines.get(timeout=0.2)
+        except queue.Empty:
+            line = ""
+        if line is None:
+            break
+
+        now = time.monotonic()
+        if line:
+            last_output = now
+            if not quiet:
+                print(line, end="")
+            text = ANSI_ESCAPE.sub("", line)
+            suite_match = SUITE_START.search(text)
+            test_match = TEST_START.search(text)
+            if suite_match:
+                suite, test = suite_match.group(1), None
+                suite_started = now
+            elif test_match:
+                if suite != test_match.group(1):
+                    suite, suite_started = test_match.group(1), now
+                # The finished line repeats "Run Test: ... > name" with its status
+                if TEST_END.search(text, test_match.end()):
+                    test = None
+                else:
+                    test, test_started = test_match.group(2), now
+            elif test and TEST_END.search(text):
+                test = None
+
+        reason = limit = None
+        if test and test_timeout and now - test_started > test_timeout:
+            reason, limit = "test-timeout", test_timeout
+        elif suite and suite_timeout and now - suite_started > suite_timeout:
+            reason, limit = "suite-timeout", suite_timeout
+        elif idle_timeout and now - last_output > idle_timeout:
+            reason, limit = "idle-timeout", idle_timeout
+        elif now > deadline:
+            reason, limit = "timeout", None
+
+        if reason:
+            process.kill()
+            process.wait()
+            hang = {"suite": suite, "test": test, "reason": reason, "limit": limit}
+            return 1, hang
+
+    return process.wait(), None
+
+
+def write_hang_report(report_path: Path, hangs: list[dict]):
+    """Record stalled tests as JUnit errors so report consumers see them."""
+    hang_dir = report_path / "watchdog"
+    hang_dir.mkdir(parents=True, exist_ok=True)
+    root = ET.Element("testsuites")
+    for hang in hangs:
+        suite_name = Path(hang["suite"]).stem if hang["suite"] else "unknown"
+        suite = ET.SubElement(root, "testsuite", {
+            "name": suite_name, "tests": "1", "failures": "0",
+            "errors": "1", "skipped": "0", "time": "0",
+        })
+        case = ET.SubElement(suite, "testcase", {
+            "classname": suite_name, "name": hang["test"] or "(suite)", "time": "0",
+        })
+        error = ET.SubElement(case, "error", {"message": f"Watchdog: {hang['reason']}"})
+        error.text = json.dumps(hang)
+    ET.ElementTree(root).write(hang_dir / "hangs.xml", encoding="utf-8", xml_declaration=True)
+    (hang_dir / "hangs.json").write_text(json.dumps(hangs, indent=2) + "\n")
+
+
+def run_watched(
+    cmd: list[str],
+    project_path: Path,
+    timeout: int,
+    report_path: Path = None,
+    test_timeout: float = None,
+    suite_timeout: float = None,
+    idle_timeout: float = None,
+    max_restarts: int = 3,
+    quiet: bool = False,
+) -> int:
+    """
+    Run GdUnit4 under the hang watchdog, restarting past whatever stalled.
+
+    After a hang the run is restarted with the stalled test (or the whole
+    stalled suite) added to --ignore, which takes suite names rather than
+    res:// paths. Suites that finished before the kill are run again:
+    GdUnit4 only writes its report when a run completes, so their results
+    would otherwise be lost.
+    """
+    deadline = time.monotonic() + timeout
+    ignores = []
+    hangs = []
+
+    while True:
+        exit_code, hang = watch_process(
+            cmd + ignores, project_path, deadline,
+            test_timeout, suite_timeout, idle_timeout, quiet,
+        )
+        if hang is None:
+            break
+
+        hangs.append(hang)
+        where = f"{hang['suite'] or '?'} > {hang['test'] or '(suite)'}"
+        print(f"WATCHDOG: {hang['reason']} in {where}; killed Godot")
+        if report_path:
+            write_hang_report(report_path, hangs)
+
+        if hang["reason"] == "timeout":
+            print(f"ERROR: Tests timed out after {timeout} seconds")
+            break
+        if len(hangs) > max_restarts:
+            print(f"ERROR: Giving up after {max_restarts} restarts")
+            break
+        suite_name = Path(hang["suite"]).stem if hang["suite"] else None
+        if suite_name and hang["test"]:
+            ignores.extend(["--ignore", f"{suite_name}:{hang['test']}"])
+        elif suite_name:
+            ignores.extend(["--ignore", suite_name])
+        else:
+            break
+        print(f"Restarting with {len(ignores) // 2} ignored suites/tests...")
+
+    return 1 if hangs else exit_code
+
+
 def run_tests(
     project: str,
     filter_pattern: str = None,
     report_dir: str = None,
     verbose: bool = False,
     timeout: int = 300,
+    extra_args: list[str] = None,
+    quiet: bool = False,
+    flaky_list: str = None,
+    flaky_mode: str = "last",
+    test_timeout: float = None,
+    suite_timeout: float = None,
+    idle_timeout: float = None,
+    max_restarts: int = 3,
 ) -> int:
     """
     Run GdUnit4 tests.
@@ -55,6 +270,14 @@ def run_tests(
         report_dir: Optional directory for JUnit XML reports
         verbose: Enable verbose output
         timeout: Test timeout in seconds
+        extra_args: Additional GdUnitCmdTool arguments (e.g. --add/--ignore)
+        quiet: Discard Godot output (for concurrent runs)
+        flaky_list: Flake list JSON from detect_flaky.py
+        flaky_mode: "quarantine" skips listed tests, "last" runs them after the rest
+        test_timeout: Kill and restart if one test runs longer than this
+        suite_timeout: Kill and restart if one suite runs longer than this
+        idle_timeout: Kill and restart if Godot prints nothing for this long
+        max_restarts: Restarts allowed after hangs before giving up
 
     Returns:
         Exit code (0 = success, non-zero = failure)
@@ -90,6 +313,17 @@ def run_tests(
     if filter_pattern:
         cmd.extend(["--add", filter_pattern])
 
+    if extra_args:
+        cmd.extend(extra_args)
+
+    flaky = load_flaky_list(flaky_list) if flaky_list else {}
+    if filter_pattern:
+        flaky = {k: v for k, v in flaky.items()
+                 if filter_pattern in k or filter_pattern in v.get("suite_path", "")}
+    for key in flaky:
+        cmd.extend(["--ignore", key.replace("::", ":", 1)])
+
+    report_path = None
     if report_dir:
         report_path = Path(report_dir).resolve()
         report_path.mkdir(parents=True, exist_ok=True)
@@ -98,16 +332,54 @@ def run_tests(
     if verbose:
         print(f"Running: {' '.join(cmd)}")
 
-    print(f"Running GdUnit4 tests in: {project_path}")
-    print("-" * 60)
+    if not quiet:
+        print(f"Running GdUnit4 tests in: {project_path}")
+        print("-" * 60)
 
+    output = subprocess.DEVNULL if quiet else None
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=project_path,
-            timeout=timeout,
-        )
-        return result.returncode
+        if test_timeout or suite_timeout or idle_timeout:
+            exit_code = run_watched(
+                cmd, project_path, timeout, report_path,
+                test_timeout, suite_timeout, idle_timeout, max_restarts, quiet,
+            )
+        else:
+            result = subprocess.run(
+                cmd,
+                cwd=project_path,
+                timeout=timeout,
+                stdout=output,
+                stderr=output,
+            )
+            exit_code = result.returncode
+
+        if flaky and flaky_mode == "last":
+            print(f"Running {len(flaky)} known-flaky tests last...")
+            flaky_args = []
+            suite_paths = None
+            for key, entry in flaky.items():
+                suite, _, name = key.partition("::")
+                suite_path = entry.get("suite_path")
+                if not suite_path:
+                    if suite_paths is None:
+                        suite_paths = suite_path_map(project_path)
+                    suite_path = find_suite_path(suite_paths, suite)
+                flaky_args.extend(["--add", f"{suite_path}:{name}"])
+            flaky_cmd = cmd[:cmd.index("--run-tests") + 1] + flaky_args
+            if report_dir:
+                flaky_report = report_path / "flaky"
+                flaky_report.mkdir(parents=True, exist_ok=True)
+                flaky_cmd.extend(["--report-directory", str(flaky_report)])
+            flaky_result = subprocess.run(
+                flaky_cmd,
+                cwd=project_path,
+                timeout=timeout,
+                stdout=output,
+                stderr=output,
+            )
+            exit_code = exit_code or flaky_result.returncode
+
+        return exit_code
     except subprocess.TimeoutExpired:
         print(f"ERROR: Tests timed out after {timeout} seconds")
         return 1
@@ -116,6 +388,78 @@ def run_tests(
         return 130
 
 
+def rerun_failed(
+    project: str,
+    report_dir: str,
+    verbose: bool = False,
+    timeout: int = 300,
+) -> int:
+    """
+    Rerun only the tests that failed or errored in a previous report.
+
+    The new results are merged into report_dir: every testcase keeps its
+    latest outcome and the directory ends up holding one results.xml.
+
+    Args:
+        project: Path to Godot project directory
+        report_dir: Directory holding the previous JUnit XML reports
+        verbose: Enable verbose output
+        timeout: Test timeout in seconds
+
+    Returns:
+        Exit code (0 = every test now passes, non-zero = failures remain)
+    """
+    project_path = Path(project).resolve()
+    report_path = Path(report_dir).resolve()
+
+    if not report_path.exists():
+        print(f"ERROR: Report directory not found: {report_path}")
+        return 1
+
+    previous = parse_results_directory(report_path)
+    selection = []
+    suite_paths = None
+    for suite in previous.suites:
+        for tc in suite.testcases:
+            if tc.status in ("failed", "error"):
+                if suite_paths is None:
+                    suite_paths = suite_path_map(project_path)
+                suite_path = find_suite_path(suite_paths, tc.classname)
+                selection.extend(["--add", f"{suite_path}:{tc.name}"])
+
+    if not selection:
+        print(f"No failed tests in {report_path}")
+        return 0
+
+    print(f"Rerunning {len(selection) // 2} failed tests from {report_path}")
+
+    rerun_path = Path(tempfile.mkdtemp(prefix="rerun-", dir=report_path))
+    try:
+        exit_code = run_tests(
+            project=project,
+            report_dir=str(rerun_path),
+            verbose=verbose,
+            timeout=timeout,
+            extra_args=selection,
+        )
+
+        merged_path = report_path.parent / f".{report_path.name}-merged.xml"
+        totals = merge_reports([report_path], merged_path)
+        for old in report_path.glob("**/*.xml"):
+            old.unlink()
+        shutil.move(str(merged_path), str(report_path / "results.xml"))
+    finally:
+        shutil.rmtree(rerun_path, ignore_errors=True)
+
+    print(
+        f"Merged into {report_path / 'results.xml'}: {totals['tests']} tests, "
+        f"{totals['failures']} failed, {totals['errors']} errors"
+    )
+    if totals["failures"] or totals["errors"]:
+        return exit_code or 1
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Run GdUnit4 tests for a Godot project",
@@ -125,6 +469,9 @@ Examples:
   %(prog)s --project ./my-game
   %(prog)s --project ./my-game --filter "test_player"
   %(prog)s --project ./my-game --report ./reports --verbose
+  %(prog)s --project ./my-game --flaky-list .gdunit-flaky.json --flaky-mode quarantine
+  %(prog)s --project ./my-game --rerun-failed ./reports
+  %(prog)s --project ./my-game --report ./reports --test-timeout 30 --suite-timeout 120
         """
     )
 
@@ -137,6 +484,12 @@ Examples:
         "--filter", "-f",
         help="Filter tests by pattern"
     )
+    parser.add_argument(
+        "--suite", "-s",
+        action="append",
+        default=[],
+        help="Test suite or directory to run (repeatable, default: all)"
+    )
     parser.add_argument(
         "--report", "-r",
         help="Directory for JUnit XML reports"
@@ -152,15 +505,67 @@ Examples:
         action="store_true",
         help="Enable verbose output"
     )
+    parser.add_argument(
+        "--flaky-list",
+        help="Flake list JSON written by detect_flaky.py"
+    )
+    parser.add_argument(
+        "--flaky-mode",
+        choices=["last", "quarantine"],
+        default="last",
+        help="Run listed flaky tests after the rest, or skip them (default: last)"
+    )
+
+    parser.add_argument(
+        "--test-timeout",
+        type=float,
+        help="Kill and restart past any single test running longer than this (seconds)"
+    )
+    parser.add_argument(
+        "--suite-timeout",
+        type=float,
+        help="Kill and restart past any suite running longer than this (seconds)"
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        help="Kill and restart if Godot prints nothing for this long (seconds)"
+    )
+    parser.add_argument(
+        "--max-restarts",
+        type=int,
+        default=3,
+        help="Restarts allowed after hangs (default: 3)"
+    )
+    parser.add_argument(
+        "--rerun-failed",
+        metavar="REPORT_DIR",
+        help="Rerun only tests that failed in REPORT_DIR and merge the results into it"
+    )
 
     args = parser.parse_args()
 
+    if args.rerun_failed:
+        sys.exit(rerun_failed(
+            project=args.project,
+            report_dir=args.rerun_failed,
+            verbose=args.verbose,
+            timeout=args.timeout,
+        ))
+
     exit_code = run_tests(
         project=args.project,
         filter_pattern=args.filter,
         report_dir=args.report,
         verbose=args.verbose,
         timeout=args.timeout,
+        extra_args=[arg for suite in args.suite for arg in ("--add", suite)],
+        flaky_list=args.flaky_list,
+        flaky_mode=args.flaky_mode,
+        test_timeout=args.test_timeout,
+        suite_timeout=args.suite_timeout,
+        idle_timeout=args.idle_timeout,
+        max_restarts=args.max_restarts,
     )
 
     sys.exit(exit_code)
@@ -5,14 +5,31 @@ Validate and import a Godot project.
 Usage:
     python validate_project.py --project ./my-game
     python validate_project.py --project ./my-game --check-scripts
+    python validate_project.py --project ./my-game --watch
+    python validate_project.py --project ./my-game --precheck-only
 """
 
 import argparse
 import subprocess
 import sys
 import re
+import time
 from pathlib import Path
 
+from gdscript_precheck import format_diagnostics, precheck_file
+from project_index import IndexDiff, ProjectIndex, ProjectWatcher
+
+# Index meta key holding the file-set digest of the last clean import
+IMPORT_MARK = "last_clean_import"
+
+# Files Godot loads as-is; anything else changed on disk needs a reimport
+NO_IMPORT_SUFFIXES = (
+    ".gd", ".tscn", ".tres", ".gdshader", ".godot", ".cfg", ".uid",
+    ".md", ".txt", ".json",
+)
+
+RES_PATH = re.compile(r"res://[^\s\"')]+")
+
 
 def find_godot() -> str:
     """Find the Godot executable."""
@@ -35,8 +52,22 @@ def find_godot() -> str:
     sys.exit(1)
 
 
-def import_project(project_path: Path, godot: str) -> tuple[bool, str]:
-    """Import project resources."""
+def import_project(
+    project_path: Path,
+    godot: str,
+    index: ProjectIndex = None,
+    force: bool = False,
+) -> tuple[bool, str]:
+    """
+    Import project resources.
+
+    With an index, the import is skipped when no file has been added,
+    modified or removed since the last import that finished cleanly.
+    """
+    if index is not None and not force and index.unchanged_since(IMPORT_MARK):
+        print("Importing project resources... (unchanged since last clean import, skipped)")
+        return (True, "")
+
     print("Importing project resources...")
 
     result = subprocess.run(
@@ -62,43 +93,246 @@ def import_project(project_path: Path, godot: str) -> tuple[bool, str]:
             has_errors = True
             break
 
+    if index is not None and not has_errors:
+        # Import writes .import sidecars next to new assets; index those too
+        index.scan()
+        index.mark(IMPORT_MARK)
+
     return (not has_errors, output)
 
 
-def validate_scripts(project_path: Path, godot: str) -> tuple[bool, list[str]]:
-    """Check all GDScript files for syntax errors."""
+def validate_scripts(
+    project_path: Path,
+    godot: str,
+    index: ProjectIndex = None,
+    precheck: bool = True,
+) -> tuple[bool, dict[str, str]]:
+    """Check all GDScript files (outside addons/) for syntax errors, by path."""
     print("Validating GDScript files...")
 
-    errors = []
-    scripts = list(project_path.rglob("*.gd"))
-
-    # Skip addons directory for validation
-    scripts = [s for s in scripts if "addons" not in str(s)]
-
-    for script in scripts:
-        rel_path = script.relative_to(project_path)
-        result = subprocess.run(
-            [
-                godot, "--headless",
-                "--path", str(project_path),
-                "--check-only",
-                "--script", f"res://{rel_path}",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+    if index is None:
+        index = ProjectIndex(project_path)
+        index.scan()
 
-        output = result.stdout + result.stderr
-
-        if "error" in output.lower() or result.returncode != 0:
-            errors.append(f"{rel_path}: {output.strip()}")
+    errors = {}
+    for script in index.files(".gd"):
+        rel_path = script.relative_to(project_path).as_posix()
+        error = check_script(project_path, godot, rel_path, precheck)
+        if error is not None:
+            errors[rel_path] = error
         else:
             print(f"  ✓ {rel_path}")
 
     return (len(errors) == 0, errors)
 
 
+def check_script(
+    project_path: Path,
+    godot: str,
+    rel_path: str,
+    precheck: bool = True,
+) -> str:
+    """
+    Check one script; return its error output or None.
+
+    The pure-Python pre-check runs first, and Godot's --check-only is only
+    started for scripts that pass it (or never, when godot is None).
+    """
+    if precheck:
+        diagnostics = precheck_file(project_path / rel_path, project_path)
+        if diagnostics:
+            return format_diagnostics(rel_path, diagnostics)
+    if godot is None:
+        return None
+
+    result = subprocess.run(
+        [
+            godot, "--headless",
+            "--path", str(project_path),
+            "--check-only",
+            "--script", f"res://{rel_path}",
+        ],
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+    output = result.stdout + result.stderr
+
+    if "error" in output.lower() or result.returncode != 0:
+        return output.strip()
+    return None
+
+
+class ReferenceMap:
+    """Which scripts mention which res:// paths, kept current as scripts change."""
+
+    def __init__(self, project_path: Path, index: ProjectIndex):
+        self.project_path = project_path
+        self.refs = {}
+        for script in index.files(".gd"):
+            self.refresh(script.relative_to(project_path).as_posix())
+
+    def refresh(self, rel_path: str):
+        try:
+            text = (self.project_path / rel_path).read_text(errors="replace")
+        except FileNotFoundError:
+            self.refs.pop(rel_path, None)
+            return
+        self.refs[rel_path] = set(RES_PATH.findall(text))
+
+    def dependents(self, rel_paths: set) -> set:
+        """Scripts that reference any of the given files."""
+        targets = {f"res://{rel}" for rel in rel_paths}
+        return {script for script, refs in self.refs.items() if refs & targets}
+
+
+# Keys for outstanding non-script failures in watch mode
+STRUCTURE = "(structure)"
+IMPORT = "(import)"
+
+
+def record(failures: dict, key: str, error: str):
+    """Set or clear one outstanding failure."""
+    if error is None:
+        failures.pop(key, None)
+    else:
+        failures[key] = error
+
+
+def revalidate(
+    project_path: Path,
+    godot: str,
+    index: ProjectIndex,
+    refs: ReferenceMap,
+    diff: IndexDiff,
+    precheck: bool = True,
+    failures: dict = None,
+) -> bool:
+    """
+    Re-check only what a batch of file changes can affect.
+
+    Changed scripts and the scripts that reference any changed or removed
+    file are re-checked; non-script assets trigger a (Godot-incremental)
+    reimport; project.godot triggers the structure check. Each diagnostic
+    is printed as soon as it is known.
+
+    Args:
+        failures: Outstanding failures (script path, STRUCTURE or IMPORT ->
+            error), updated in place with what this batch re-checked
+
+    Returns:
+        True if everything re-checked passed
+    """
+    started = time.monotonic()
+    touched = set(diff.changed) | set(diff.removed)
+    ok = True
+    if failures is None:
+        failures = {}
+
+    for rel in diff.changed + diff.removed:
+        if rel.endswith(".gd"):
+            refs.refresh(rel)
+    for rel in diff.removed:
+        failures.pop(rel, None)
+
+    if "project.godot" in touched:
+        passed, issues = check_project_structure(project_path)
+        for issue in issues:
+            print(f"  ✗ {issue}", flush=True)
+        record(failures, STRUCTURE, None if passed else "; ".join(issues))
+        ok &= passed
+
+    assets = [rel for rel in touched if not rel.endswith(NO_IMPORT_SUFFIXES)]
+    if godot is None:
+        assets = []
+    if assets:
+        passed, output = import_project(project_path, godot, index)
+        if passed:
+            print("  ✓ Import", flush=True)
+        else:
+            print("  ✗ Import failed", flush=True)
+            print(output, flush=True)
+        record(failures, IMPORT, None if passed else output)
+        ok &= passed
+
+    scripts = {rel for rel in diff.changed if rel.endswith(".gd")}
+    scripts |= refs.dependents(touched)
+    scripts = sorted(s for s in scripts if s.split("/", 1)[0] != "addons" and s in index.entries)
+    for rel in scripts:
+        error = check_script(project_path, godot, rel, precheck)
+        if error is None:
+            print(f"  ✓ {rel}", flush=True)
+        else:
+            print(f"  ✗ {rel}: {error}", flush=True)
+            ok = False
+        record(failures, rel, error)
+
+    summary = (
+        f"{'OK' if ok else 'FAILED'} ({len(scripts)} scripts"
+        f"{', import' if assets else ''}, {time.monotonic() - started:.2f}s)"
+    )
+    checked = set(scripts)
+    if "project.godot" in touched:
+        checked.add(STRUCTURE)
+    if assets:
+        checked.add(IMPORT)
+    earlier = sorted(key for key in failures if key not in checked)
+    if earlier:
+        summary += f"; still failing from earlier: {', '.join(earlier)}"
+    print(summary, flush=True)
+    return ok
+
+
+def watch_project(
+    project_path: Path,
+    godot: str,
+    index: ProjectIndex,
+    debounce: float = 0.15,
+    poll: bool = False,
+    precheck: bool = True,
+    failures: dict = None,
+) -> bool:
+    """
+    Re-validate affected files on every save until interrupted.
+
+    Args:
+        project_path: Project directory
+        godot: Godot executable
+        index: Project index (already scanned)
+        debounce: Quiet period in seconds that ends a burst of saves
+        poll: Force periodic rescans instead of inotify
+        precheck: Run the pure-Python syntax pre-check before Godot
+        failures: Failures of the initial validation (see revalidate)
+
+    Returns:
+        True if nothing was left failing when the watch was stopped
+    """
+    if failures is None:
+        failures = {}
+    refs = ReferenceMap(project_path, index)
+    watcher = ProjectWatcher(index, poll=poll)
+    print(f"Watching {project_path} (Ctrl+C to stop)", flush=True)
+    try:
+        while True:
+            diff = watcher.wait(debounce)
+            print(
+                f"[{time.strftime('%H:%M:%S')}] "
+                f"+{len(diff.added)} ~{len(diff.modified)} -{len(diff.removed)}: "
+                f"{', '.join((diff.changed + diff.removed)[:5])}"
+                f"{' ...' if len(diff.changed) + len(diff.removed) > 5 else ''}",
+                flush=True,
+            )
+            revalidate(project_path, godot, index, refs, diff, precheck, failures)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    finally:
+        watcher.close()
+    if failures:
+        print(f"Still failing: {', '.join(sorted(failures))}")
+    return not failures
+
+
 def check_project_structure(project_path: Path) -> tuple[bool, list[str]]:
     """Verify required project files exist."""
     print("Checking project structure...")
@@ -148,6 +382,37 @@ def main():
         action="store_true",
         help="Only import project, skip other checks"
     )
+    parser.add_argument(
+        "--force-import",
+        action="store_true",
+        help="Import even if no files changed since the last clean import"
+    )
+    parser.add_argument(
+        "--watch", "-w",
+        action="store_true",
+        help="After the initial validation, keep re-validating files as they change"
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=150,
+        help="Milliseconds of quiet that end a burst of saves in --watch (default: 150)"
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Watch by periodic rescans instead of inotify"
+    )
+    parser.add_argument(
+        "--no-precheck",
+        action="store_true",
+        help="Send every script to Godot without the pure-Python syntax pre-check"
+    )
+    parser.add_argument(
+        "--precheck-only",
+        action="store_true",
+        help="Only run the pure-Python syntax pre-check (no Godot, no import)"
+    )
 
     args = parser.parse_args()
 
@@ -157,43 +422,70 @@ def main():
         print(f"ERROR: Project directory not found: {project_path}")
         sys.exit(1)
 
-    godot = find_godot()
+    if args.precheck_only and args.no_precheck:
+        print("ERROR: --precheck-only and --no-precheck are mutually exclusive")
+        sys.exit(1)
+
+    # The pre-check needs no engine, so --precheck-only works without Godot
+    godot = None if args.precheck_only else find_godot()
+    precheck = not args.no_precheck
     all_passed = True
+    failures = {}
 
     print(f"Validating project: {project_path}")
     print("=" * 60)
 
+    index = ProjectIndex(project_path)
+    diff = index.scan()
+    print(
+        f"Indexed {len(index.entries)} files "
+        f"(+{len(diff.added)} ~{len(diff.modified)} -{len(diff.removed)} since last run)"
+    )
+
     # Structure check
     if not args.import_only:
         passed, issues = check_project_structure(project_path)
         if not passed:
             all_passed = False
+            failures[STRUCTURE] = "; ".join(issues)
             for issue in issues:
                 print(f"  ✗ {issue}")
         else:
             print("  ✓ Project structure OK")
 
     # Import
-    passed, output = import_project(project_path, godot)
-    if not passed:
-        all_passed = False
-        print("  ✗ Import failed")
-        print(output)
-    else:
-        print("  ✓ Project imported successfully")
+    if godot is not None:
+        passed, output = import_project(project_path, godot, index, args.force_import)
+        if not passed:
+            all_passed = False
+            failures[IMPORT] = output
+            print("  ✗ Import failed")
+            print(output)
+        else:
+            print("  ✓ Project imported successfully")
 
     # Script validation
-    if args.check_scripts and not args.import_only:
-        passed, errors = validate_scripts(project_path, godot)
+    if (args.check_scripts or args.precheck_only) and not args.import_only:
+        started = time.monotonic()
+        passed, errors = validate_scripts(project_path, godot, index, precheck)
+        print(f"  Checked scripts in {time.monotonic() - started:.2f}s")
         if not passed:
             all_passed = False
+            failures.update(errors)
             print("  ✗ Script validation failed:")
-            for error in errors:
-                print(f"    {error}")
+            for rel_path, error in errors.items():
+                print(f"    {rel_path}: {error}")
         else:
             print("  ✓ All scripts valid")
 
     print("=" * 60)
+    if args.watch:
+        print("VALIDATION PASSED" if all_passed else "VALIDATION FAILED", flush=True)
+        passed = watch_project(
+            project_path, godot, index, args.debounce / 1000, args.poll, precheck,
+            failures,
+        )
+        sys.exit(0 if passed else 1)
     if all_passed:
         print("VALIDATION PASSED")
         sys.exit(0)
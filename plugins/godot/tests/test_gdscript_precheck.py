@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from gdscript_precheck import precheck_file  # noqa: E402
+
+SCRIPT = "extends Node\n\nfunc _ready() -> void:\n\tprint(\"ready\")\n"
+
+
+def test_bom_prefixed_script_passes(tmp_path):
+    (tmp_path / "project.godot").write_text("")
+    script = tmp_path / "bom.gd"
+    script.write_bytes(b"\xef\xbb\xbf" + SCRIPT.encode("utf-8"))
+
+    assert precheck_file(script, tmp_path) == []
+
+
+def test_syntax_error_after_bom_is_reported(tmp_path):
+    (tmp_path / "project.godot").write_text("")
+    script = tmp_path / "broken.gd"
+    script.write_bytes(b"\xef\xbb\xbf" + SCRIPT.replace("-> void:", "-> void").encode("utf-8"))
+
+    diagnostics = precheck_file(script, tmp_path)
+    assert [d.line for d in diagnostics] == [3]
@@ -0,0 +1,43 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from run_tests import watch_process  # noqa: E402
+
+# GdUnit4 console output, colour codes included
+LINES = [
+    "\x1b[1mRun Test Suite: res://test/a_test.gd\x1b[0m",
+    "Run Test: res://test/a_test.gd > test_one :STARTED",
+    "Run Test: res://test/a_test.gd > test_one :\x1b[32mPASSED\x1b[0m 5ms",
+]
+
+
+def fake_godot(lines):
+    script = "import time\n" + "".join(f"print({line!r}, flush=True)\n" for line in lines)
+    return [sys.executable, "-c", script + "time.sleep(30)\n"]
+
+
+def test_stall_after_passed_test_is_not_blamed_on_it(tmp_path):
+    exit_code, hang = watch_process(
+        fake_godot(LINES), tmp_path, time.monotonic() + 20,
+        test_timeout=0.5, suite_timeout=1.5, quiet=True,
+    )
+
+    assert exit_code == 1
+    assert hang["reason"] == "suite-timeout"
+    assert hang["suite"] == "res://test/a_test.gd"
+    assert hang["test"] is None
+
+
+def test_stall_inside_started_test_is_reported(tmp_path):
+    lines = LINES + ["Run Test: res://test/a_test.gd > test_two :STARTED"]
+    exit_code, hang = watch_process(
+        fake_godot(lines), tmp_path, time.monotonic() + 20,
+        test_timeout=0.5, suite_timeout=5, quiet=True,
+    )
+
+    assert exit_code == 1
+    assert hang["reason"] == "test-timeout"
+    assert hang["test"] == "test_two"
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from rc_stub_server import start_server
+from rc_wait_ready import http_put_json, wait_for_info
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def timed_call(url: str, payload: dict, timeout: float) -> float:
+    began = time.perf_counter()
+    http_put_json(url, payload, timeout=timeout)
+    return (time.perf_counter() - began) * 1000
+
+
+def run_level(
+    url: str, payload: dict, concurrency: int, calls: int, timeout: float
+) -> dict:
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        began = time.perf_counter()
+        latencies = list(
+            pool.map(lambda _: timed_call(url, payload, timeout), range(calls))
+        )
+        elapsed = time.perf_counter() - began
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "calls": calls,
+        "calls_per_s": round(calls / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "max_ms": round(latencies[-1], 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark Remote Control client throughput and latency."
+    )
+    parser.add_argument(
+        "--host", help="Target an existing server instead of the stand-in."
+    )
+    parser.add_argument("--port", type=int, default=30010, help="Target port.")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Stand-in delay per request."
+    )
+    parser.add_argument(
+        "--jitter-ms", type=float, default=0.0, help="Stand-in random extra delay."
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        action="append",
+        help="Concurrent clients (repeatable, default 1, 4, 16).",
+    )
+    parser.add_argument("--calls", type=int, default=1000, help="Calls per level.")
+    parser.add_argument("--warmup", type=int, default=50, help="Untimed calls first.")
+    parser.add_argument(
+        "--object-path",
+        default="/Game/Maps/Main.Main:PersistentLevel.PlayUnrealDriver_1",
+    )
+    parser.add_argument("--function", default="Ping")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--json", action="store_true", help="Print JSON results.")
+    args = parser.parse_args()
+
+    server = None
+    host, port = args.host, args.port
+    if host is None:
+        server = start_server(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms)
+        host, port = server.server_address[:2]
+    wait_for_info(host, port, args.timeout, 0.1)
+
+    url = f"http://{host}:{port}/remote/object/call"
+    payload = {
+        "objectPath": args.object_path,
+        "functionName": args.function,
+        "parameters": {},
+    }
+    for _ in range(args.warmup):
+        http_put_json(url, payload, timeout=args.timeout)
+
+    results = [
+        run_level(url, payload, level, args.calls, args.timeout)
+        for level in args.concurrency or [1, 4, 16]
+    ]
+    if server:
+        server.shutdown()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(
+        f"{'conc':>5} {'calls':>7} {'calls/s':>10} "
+        f"{'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    )
+    for row in results:
+        print(
+            f"{row['concurrency']:5d} {row['calls']:7d} {row['calls_per_s']:10.1f} "
+            f"{row['p50_ms']:9.3f} {row['p99_ms']:9.3f} {row['max_ms']:9.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import time
+from dataclasses import dataclass, field
+
+from rc_wait_ready import http_put_json
+
+try:
+    import pytest
+except ImportError:  # The snapshot/restore CLI does not need pytest.
+    pytest = None
+
+PROPERTY_ROUTE = "/remote/object/property"
+
+
+@dataclass
+class ResetResult:
+    seconds: float
+    restored: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+
+def parse_object_spec(spec: str) -> tuple[str, list[str]]:
+    # "Path" tracks every property, "Path=A,B" only A and B.
+    path, _, names = spec.partition("=")
+    return path, [name for name in names.split(",") if name]
+
+
+class LevelState:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        objects: dict[str, list[str]],
+        ignore: set[str] | None = None,
+        timeout: float = 10.0,
+    ) -> None:
+        self.batch_url = f"http://{host}:{port}/remote/batch"
+        self.objects = objects
+        self.ignore = ignore or set()
+        self.timeout = timeout
+        self.baseline: dict[str, dict] = {}
+        self.unwritable: set[tuple[str, str]] = set()
+
+    def batch(self, bodies: list[dict]) -> list[tuple[int, dict]]:
+        payload = {
+            "Requests": [
+                {"RequestId": i, "URL": PROPERTY_ROUTE, "Verb": "PUT", "Body": body}
+                for i, body in enumerate(bodies)
+            ]
+        }
+        response = http_put_json(self.batch_url, payload, timeout=self.timeout)
+        by_id = {item.get("RequestId"): item for item in response.get("Responses", [])}
+        results = []
+        for i in range(len(bodies)):
+            item = by_id.get(i, {})
+            body = item.get("ResponseBody")
+            if isinstance(body, str):
+                body = json.loads(body) if body else {}
+            results.append((int(item.get("ResponseCode", 0)), body or {}))
+        return results
+
+    def read(self) -> dict[str, dict]:
+        # One round trip for every tracked object, whole objects at a time.
+        paths = list(self.objects)
+        results = self.batch(
+            [{"objectPath": path, "access": "READ_ACCESS"} for path in paths]
+        )
+        state = {}
+        for path, (code, body) in zip(paths, results):
+            if code != 200:
+                raise RuntimeError(
+                    f"Reading {path} failed ({code}): {body.get('errorMessage', body)}"
+                )
+            names = self.objects[path] or body.keys()
+            state[path] = {
+                name: body[name]
+                for name in names
+                if name in body and name not in self.ignore
+            }
+        return state
+
+    def snapshot(self) -> float:
+        start = time.perf_counter()
+        self.baseline = self.read()
+        return time.perf_counter() - start
+
+    def changed(self, current: dict[str, dict]) -> list[tuple[str, str, object]]:
+        changes = []
+        for path, properties in self.baseline.items():
+            now = current.get(path, {})
+            for name, value in properties.items():
+                if (path, name) in self.unwritable:
+                    continue
+                if now.get(name) != value:
+                    changes.append((path, name, value))
+        return changes
+
+    def restore(self) -> ResetResult:
+        start = time.perf_counter()
+        changes = self.changed(self.read())
+        result = ResetResult(0.0)
+        if changes:
+            results = self.batch(
+                [
+                    {
+                        "objectPath": path,
+                        "access": "WRITE_ACCESS",
+                        "propertyName": name,
+                        "propertyValue": {name: value},
+                    }
+                    for path, name, value in changes
+                ]
+            )
+            for (path, name, _), (code, _) in zip(changes, results):
+                if code == 200:
+                    result.restored.append(f"{path}.{name}")
+                else:
+                    # Read-only or transient; stop trying after the first refusal.
+                    self.unwritable.add((path, name))
+                    result.failed.append(f"{path}.{name}")
+        result.seconds = time.perf_counter() - start
+        return result
+
+
+def format_report(results: dict[str, ResetResult], snapshot_s: float) -> str:
+    if not results:
+        return "No resets."
+    times = sorted(result.seconds for result in results.values())
+    restored: dict[str, int] = {}
+    failed = set()
+    for result in results.values():
+        for name in result.restored:
+            restored[name] = restored.get(name, 0) + 1
+        failed.update(result.failed)
+    mean_ms = sum(times) / len(times) * 1000
+    lines = [
+        f"snapshot {snapshot_s * 1000:.1f}ms; {len(times)} resets, "
+        f"total {sum(times) * 1000:.1f}ms, mean {mean_ms:.1f}ms, "
+        f"max {times[-1] * 1000:.1f}ms",
+        f"{sum(restored.values())} property restores across {len(restored)} properties",
+    ]
+    for name, count in sorted(restored.items(), key=lambda item: -item[1])[:10]:
+        lines.append(f"  {count:5d}x  {name}")
+    if failed:
+        lines.append(
+            "Not restorable (skipped after first failure): "
+            + ", ".join(sorted(failed))
+        )
+    return "\n".join(lines)
+
+
+# pytest plugin: load with `-p rc_state` to reset tracked properties after every test.
+
+_results: dict[str, ResetResult] = {}
+_snapshot_s = 0.0
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("rc-state", "Unreal level state reset between tests")
+    group.addoption(
+        "--rc-state-object",
+        action="append",
+        default=[],
+        help="Object path to snapshot and restore, "
+        "optionally PATH=Prop1,Prop2 (repeatable).",
+    )
+    group.addoption(
+        "--rc-state-ignore",
+        action="append",
+        default=[],
+        help="Property name never restored, "
+        "e.g. one that changes every frame (repeatable).",
+    )
+    group.addoption(
+        "--rc-state-timeout",
+        type=float,
+        default=10.0,
+        help="Seconds per Remote Control batch request.",
+    )
+
+
+if pytest is not None:
+
+    @pytest.fixture(scope="session")
+    def rc_level_state(request):
+        global _snapshot_s
+        specs = request.config.getoption("rc_state_object")
+        if not specs:
+            yield None
+            return
+        state = LevelState(
+            os.environ.get("UE_RC_HOST", "127.0.0.1"),
+            int(os.environ.get("UE_RC_PORT", "30010")),
+            dict(parse_object_spec(spec) for spec in specs),
+            set(request.config.getoption("rc_state_ignore")),
+            request.config.getoption("rc_state_timeout"),
+        )
+        _snapshot_s = state.snapshot()
+        yield state
+
+    @pytest.fixture(autouse=True)
+    def rc_level_reset(request, rc_level_state):
+        yield
+        if rc_level_state is not None:
+            _results[request.node.nodeid] = rc_level_state.restore()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not _results:
+        return
+    terminalreporter.write_sep("=", "Level state reset")
+    terminalreporter.write_line(format_report(_results, _snapshot_s))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Save or restore Unreal object properties over Remote Control."
+    )
+    parser.add_argument("action", choices=("snapshot", "restore"))
+    parser.add_argument("file", help="JSON snapshot to write or restore from.")
+    parser.add_argument("--host", default="127.0.0.1", help="Remote Control host.")
+    parser.add_argument("--port", type=int, default=30010, help="Remote Control port.")
+    parser.add_argument(
+        "--object",
+        action="append",
+        default=[],
+        help="Object path, optionally PATH=Prop1,Prop2 (repeatable; snapshot only).",
+    )
+    parser.add_argument(
+        "--ignore", action="append", default=[], help="Property name to skip."
+    )
+    args = parser.parse_args()
+
+    if args.action == "snapshot":
+        if not args.object:
+            parser.error("snapshot needs at least one --object")
+        state = LevelState(
+            args.host,
+            args.port,
+            dict(parse_object_spec(spec) for spec in args.object),
+            set(args.ignore),
+        )
+        seconds = state.snapshot()
+        with open(args.file, "w") as handle:
+            json.dump(state.baseline, handle, indent=2, sort_keys=True)
+        count = sum(len(props) for props in state.baseline.values())
+        print(
+            f"Saved {count} properties of {len(state.baseline)} objects "
+            f"in {seconds * 1000:.1f}ms."
+        )
+        return 0
+
+    with open(args.file) as handle:
+        baseline = json.load(handle)
+    state = LevelState(
+        args.host,
+        args.port,
+        {path: list(props) for path, props in baseline.items()},
+        set(args.ignore),
+    )
+    state.baseline = baseline
+    result = state.restore()
+    print(
+        f"Restored {len(result.restored)} properties in {result.seconds * 1000:.1f}ms."
+    )
+    for name in result.failed:
+        print(f"Could not restore {name}")
+    return 1 if result.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
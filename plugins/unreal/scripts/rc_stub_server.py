@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubState:
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        objects: dict[str, dict] | None = None,
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.objects = objects or {}
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def delay(self) -> None:
+        delay_ms = self.latency_ms + random.uniform(0, self.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    def info(self) -> tuple[int, dict]:
+        return 200, {
+            "HttpRoutes": [
+                {"Path": "/remote/info", "Verb": "GET"},
+                {"Path": "/remote/object/call", "Verb": "PUT"},
+                {"Path": "/remote/object/property", "Verb": "PUT"},
+                {"Path": "/remote/batch", "Verb": "PUT"},
+            ],
+            "ActivePreset": None,
+        }
+
+    def call(self, body: dict) -> tuple[int, dict]:
+        if "objectPath" not in body or "functionName" not in body:
+            return 400, {"errorMessage": "objectPath and functionName are required"}
+        with self._lock:
+            self.calls += 1
+        # Out-params mirror the inputs so clients can check round-trips.
+        return 200, dict(body.get("parameters") or {})
+
+    def property(self, body: dict) -> tuple[int, dict]:
+        properties = self.objects.get(body.get("objectPath"))
+        if properties is None:
+            return 400, {"errorMessage": f"Object not found: {body.get('objectPath')}"}
+        name = body.get("propertyName")
+        if name and name not in properties:
+            return 400, {"errorMessage": f"Property not found: {name}"}
+        if body.get("access", "READ_ACCESS") == "READ_ACCESS":
+            with self._lock:
+                if name:
+                    return 200, {name: properties[name]}
+                return 200, dict(properties)
+        value = (body.get("propertyValue") or {}).get(name)
+        if not name or value is None:
+            return 400, {"errorMessage": "propertyName and propertyValue are required"}
+        with self._lock:
+            properties[name] = value
+        return 200, {}
+
+    def batch(self, body: dict) -> tuple[int, dict]:
+        responses = []
+        for request in body.get("Requests", []):
+            code, payload = self.route(
+                request.get("Verb", "PUT"),
+                request.get("URL", ""),
+                request.get("Body") or {},
+            )
+            responses.append(
+                {
+                    "RequestId": request.get("RequestId"),
+                    "ResponseCode": code,
+                    "ResponseBody": payload,
+                }
+            )
+        return 200, {"Responses": responses}
+
+    def route(self, verb: str, path: str, body: dict) -> tuple[int, dict]:
+        if path == "/remote/info":
+            return self.info()
+        if path == "/remote/object/call" and verb == "PUT":
+            return self.call(body)
+        if path == "/remote/object/property" and verb == "PUT":
+            return self.property(body)
+        if path == "/remote/batch" and verb == "PUT":
+            return self.batch(body)
+        return 404, {"errorMessage": f"No route for {verb} {path}"}
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 resets connections under benchmark concurrency.
+    request_queue_size = 256
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state: StubState
+
+    def _handle(self, verb: str) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw) if raw else {}
+        except json.JSONDecodeError:
+            code, payload = 400, {"errorMessage": "Invalid JSON body"}
+        else:
+            self.state.delay()
+            code, payload = self.state.route(verb, self.path, body)
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_PUT(self) -> None:
+        self._handle("PUT")
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def start_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    objects: dict[str, dict] | None = None,
+) -> StubServer:
+    handler = type("BoundStubHandler", (StubHandler,), {})
+    handler.state = StubState(latency_ms, jitter_ms, objects)
+    server = StubServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve a stand-in for the Unreal Remote Control HTTP API."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Bind host.")
+    parser.add_argument("--port", type=int, default=30010, help="Bind port.")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Added delay per request."
+    )
+    parser.add_argument(
+        "--jitter-ms", type=float, default=0.0, help="Extra random delay (0..N ms)."
+    )
+    parser.add_argument(
+        "--objects",
+        help="JSON file of {objectPath: {property: value}} "
+        "served by /remote/object/property.",
+    )
+    args = parser.parse_args()
+
+    objects = None
+    if args.objects:
+        with open(args.objects) as handle:
+            objects = json.load(handle)
+
+    server = start_server(
+        args.host, args.port, args.latency_ms, args.jitter_ms, objects
+    )
+    host, port = server.server_address[:2]
+    print(f"Remote Control stand-in listening on http://{host}:{port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
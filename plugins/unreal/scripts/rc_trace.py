@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from urllib.parse import urlparse
+
+# Upper bounds (ms) of the latency buckets; the last bucket is open-ended.
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+@dataclass
+class CallRecord:
+    endpoint: str
+    function: str
+    start: float
+    duration_ms: float
+    request_bytes: int
+    response_bytes: int
+    error: str | None = None
+    test: str | None = None
+
+
+@dataclass
+class Histogram:
+    count: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(BUCKETS_MS) + 1))
+
+    def add(self, record: CallRecord) -> None:
+        self.count += 1
+        self.errors += record.error is not None
+        self.total_ms += record.duration_ms
+        self.max_ms = max(self.max_ms, record.duration_ms)
+        self.request_bytes += record.request_bytes
+        self.response_bytes += record.response_bytes
+        self.buckets[bisect_left(BUCKETS_MS, record.duration_ms)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        # Resolves to the upper bound of the bucket holding the percentile.
+        target = fraction * self.count
+        seen = 0
+        for bound, hits in zip((*BUCKETS_MS, self.max_ms), self.buckets):
+            seen += hits
+            if hits and seen >= target:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self.records: list[CallRecord] = []
+        self.histograms: dict[str, Histogram] = {}
+        self.current_test: str | None = None
+        self._lock = threading.Lock()
+
+    def add(self, record: CallRecord) -> None:
+        record.test = self.current_test
+        with self._lock:
+            self.records.append(record)
+            for key in (record.endpoint, f"{record.endpoint}#{record.function}"):
+                self.histograms.setdefault(key, Histogram()).add(record)
+
+    def slowest(self, limit: int) -> list[CallRecord]:
+        return sorted(self.records, key=lambda r: r.duration_ms, reverse=True)[:limit]
+
+    def write_ndjson(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as handle:
+            for record in self.records:
+                handle.write(json.dumps(asdict(record)) + "\n")
+
+    def write_chrome_trace(self, path: Path) -> None:
+        # Load in chrome://tracing or https://ui.perfetto.dev.
+        events = [
+            {
+                "name": record.function or record.endpoint,
+                "cat": record.endpoint,
+                "ph": "X",
+                "ts": record.start * 1e6,
+                "dur": record.duration_ms * 1e3,
+                "pid": os.getpid(),
+                "tid": 0,
+                "args": {
+                    "test": record.test,
+                    "request_bytes": record.request_bytes,
+                    "response_bytes": record.response_bytes,
+                    "error": record.error,
+                },
+            }
+            for record in self.records
+        ]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": events}))
+
+
+TRACER: Tracer | None = None
+
+
+def enable() -> Tracer:
+    global TRACER
+    if TRACER is None:
+        TRACER = Tracer()
+    return TRACER
+
+
+def disable() -> None:
+    global TRACER
+    TRACER = None
+
+
+@contextmanager
+def trace_call(url: str, payload: dict, request_bytes: int):
+    # The caller fills in "response_bytes" on the yielded dict.
+    call = {"response_bytes": 0}
+    tracer = TRACER
+    if tracer is None:
+        yield call
+        return
+    start = time.time()
+    began = time.perf_counter()
+    error = None
+    try:
+        yield call
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        tracer.add(
+            CallRecord(
+                endpoint=urlparse(url).path,
+                function=payload.get("functionName", ""),
+                start=start,
+                duration_ms=(time.perf_counter() - began) * 1000,
+                request_bytes=request_bytes,
+                response_bytes=call["response_bytes"],
+                error=error,
+            )
+        )
+
+
+def format_report(tracer: Tracer, limit: int = 10) -> str:
+    lines = [
+        f"{'calls':>7} {'err':>4} {'mean ms':>9} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'max ms':>9} {'req KiB':>9} {'resp KiB':>9}  endpoint#function"
+    ]
+    for key, hist in sorted(
+        tracer.histograms.items(), key=lambda item: item[1].total_ms, reverse=True
+    ):
+        lines.append(
+            f"{hist.count:7d} {hist.errors:4d} {hist.total_ms / hist.count:9.1f} "
+            f"{hist.percentile(0.5):8.0f} {hist.percentile(0.99):8.0f} "
+            f"{hist.max_ms:9.1f} {hist.request_bytes / 1024:9.1f} "
+            f"{hist.response_bytes / 1024:9.1f}  {key}"
+        )
+    lines.append("")
+    lines.append(f"Slowest {limit} Remote Control calls:")
+    for record in tracer.slowest(limit):
+        status = f" [{record.error}]" if record.error else ""
+        lines.append(
+            f"{record.duration_ms:9.1f} ms  {record.endpoint}#{record.function}"
+            f"  ({record.test or 'outside tests'}){status}"
+        )
+    return "\n".join(lines)
+
+
+# pytest plugin: load with `-p rc_trace` to trace every http_put_json call.
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("rc-trace", "Unreal Remote Control call tracing")
+    group.addoption("--rc-trace", help="Write one NDJSON record per call here.")
+    group.addoption("--rc-trace-chrome", help="Write a Chrome trace JSON here.")
+    group.addoption(
+        "--rc-trace-top",
+        type=int,
+        default=10,
+        help="Slowest calls to list in the terminal summary.",
+    )
+
+
+def pytest_configure(config):
+    enable()
+
+
+def pytest_runtest_logstart(nodeid, location):
+    if TRACER:
+        TRACER.current_test = nodeid
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    if TRACER:
+        TRACER.current_test = None
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not TRACER or not TRACER.records:
+        return
+    if config.getoption("rc_trace"):
+        TRACER.write_ndjson(Path(config.getoption("rc_trace")))
+    if config.getoption("rc_trace_chrome"):
+        TRACER.write_chrome_trace(Path(config.getoption("rc_trace_chrome")))
+    terminalreporter.write_sep("=", "Remote Control call timings")
+    terminalreporter.write_line(
+        format_report(TRACER, config.getoption("rc_trace_top"))
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Summarize or convert a Remote Control NDJSON trace."
+    )
+    parser.add_argument("trace", help="NDJSON trace written by --rc-trace.")
+    parser.add_argument("--chrome", help="Also write a Chrome trace JSON here.")
+    parser.add_argument("--top", type=int, default=10, help="Slowest calls to list.")
+    args = parser.parse_args()
+
+    tracer = Tracer()
+    with open(args.trace) as handle:
+        for line in handle:
+            if line.strip():
+                record = CallRecord(**json.loads(line))
+                tracer.current_test = record.test
+                tracer.add(record)
+
+    if args.chrome:
+        tracer.write_chrome_trace(Path(args.chrome))
+    print(format_report(tracer, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,9 +2,15 @@
 
 import argparse
 import json
+import subprocess
+import threading
 import time
 import urllib.error
 import urllib.request
+from pathlib import Path
+
+from rc_trace import trace_call
+from ue_log import LogFollower, follow_log
 
 
 def http_get(url: str, timeout: float) -> bytes:
@@ -21,25 +27,47 @@ def http_put_json(url: str, payload: dict, timeout: float) -> dict:
         method="PUT",
         headers={"Content-Type": "application/json"},
     )
-    with urllib.request.urlopen(req, timeout=timeout) as response:
-        body = response.read().decode("utf-8")
+    with trace_call(url, payload, len(data)) as call:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            raw = response.read()
+        call["response_bytes"] = len(raw)
+    body = raw.decode("utf-8")
     try:
         return json.loads(body)
     except json.JSONDecodeError:
         return {"raw": body}
 
 
-def wait_for_info(host: str, port: int, timeout: float, interval: float) -> None:
+def wait_for_info(
+    host: str,
+    port: int,
+    timeout: float,
+    interval: float,
+    process: subprocess.Popen | None = None,
+    log: LogFollower | None = None,
+) -> None:
     url = f"http://{host}:{port}/remote/info"
     deadline = time.time() + timeout
     while True:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(
+                f"Unreal exited with code {process.returncode} "
+                f"before Remote Control was ready at {url}"
+            )
+        if log is not None:
+            log.check()
         try:
             http_get(url, timeout=interval)
             return
         except (urllib.error.URLError, TimeoutError):
             if time.time() >= deadline:
-                raise TimeoutError(f"Remote Control not ready at {url}")
-            time.sleep(interval)
+                detail = f" ({log.log.progress()})" if log is not None else ""
+                raise TimeoutError(f"Remote Control not ready at {url}{detail}")
+            if log is None:
+                time.sleep(interval)
+            elif log.wake.wait(interval):
+                # The log says the server started (or failed); poll tightly now.
+                time.sleep(0.02)
 
 
 def main() -> int:
@@ -58,6 +86,10 @@ def main() -> int:
         default="Ping",
         help="Function to call on the object path.",
     )
+    parser.add_argument(
+        "--log-file",
+        help="Follow this Unreal log (-abslog=PATH) for milestones and fatal errors.",
+    )
     parser.add_argument(
         "--params",
         default="{}",
@@ -65,8 +97,17 @@ def main() -> int:
     )
     args = parser.parse_args()
 
-    wait_for_info(args.host, args.port, args.timeout, args.interval)
+    log = None
+    stop = threading.Event()
+    if args.log_file:
+        log = follow_log(Path(args.log_file), stop, args.port)
+    try:
+        wait_for_info(args.host, args.port, args.timeout, args.interval, log=log)
+    finally:
+        stop.set()
     print("Remote Control ready.")
+    if log is not None:
+        print(log.log.format_breakdown())
 
     if not args.object_path:
         return 0
@@ -1,12 +1,286 @@
 #!/usr/bin/env python3
 
 import argparse
+import os
+import shlex
+import socket
 import subprocess
-import sys
+import tempfile
+import threading
+import urllib.error
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 
+from rc_wait_ready import http_put_json, wait_for_info
+from ue_launch import build_command
+from ue_log import LogFollower, follow_log
 
-def main() -> int:
+SCRIPT_DIR = Path(__file__).resolve().parent
+TEST_FILE_PATTERNS = ("test_*.py", "*_test.py")
+
+
+def allocate_port_pairs(host: str, count: int) -> list[tuple[int, int]]:
+    # Keep every socket bound until all ports are chosen so no pair collides.
+    with ExitStack() as stack:
+        ports = []
+        for _ in range(count * 2):
+            sock = stack.enter_context(
+                socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            )
+            sock.bind((host, 0))
+            ports.append(sock.getsockname()[1])
+    return [(ports[i], ports[i + 1]) for i in range(0, len(ports), 2)]
+
+
+def discover_test_files(tests: str) -> list[Path]:
+    path = Path(tests)
+    if not path.is_dir():
+        return [path]
+    files = set()
+    for pattern in TEST_FILE_PATTERNS:
+        files.update(path.rglob(pattern))
+    return sorted(files)
+
+
+def target_size(path: Path) -> int:
+    # Node ids ("tests/test_x.py::test_a") weigh as their file; missing paths as 0.
+    try:
+        return Path(str(path).split("::", 1)[0]).stat().st_size
+    except OSError:
+        return 0
+
+
+def distribute_files(files: list[Path], workers: int) -> list[list[Path]]:
+    # Largest files first onto the lightest bucket keeps shards roughly even.
+    buckets: list[list[Path]] = [[] for _ in range(workers)]
+    loads = [0] * workers
+    sizes = {path: target_size(path) for path in files}
+    for path in sorted(files, key=sizes.get, reverse=True):
+        index = loads.index(min(loads))
+        buckets[index].append(path)
+        loads[index] += sizes[path]
+    return [bucket for bucket in buckets if bucket]
+
+
+def merge_junit(paths: list[Path], output: Path) -> None:
+    merged = ET.Element("testsuites")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+    elapsed = 0.0
+    for path in paths:
+        if not path.exists():
+            continue
+        root = ET.parse(path).getroot()
+        suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+        for suite in suites:
+            merged.append(suite)
+            for key in totals:
+                totals[key] += int(suite.get(key, 0))
+            elapsed += float(suite.get("time", 0))
+    for key, value in totals.items():
+        merged.set(key, str(value))
+    merged.set("time", f"{elapsed:.3f}")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(merged).write(output, encoding="utf-8", xml_declaration=True)
+
+
+def launch_unreal(
+    args: argparse.Namespace,
+    http_port: int | None,
+    ws_port: int | None,
+    log_path: Path | None = None,
+) -> subprocess.Popen:
+    launch_args = argparse.Namespace(
+        exe=args.ue_exe,
+        uproject=args.uproject,
+        map=args.map,
+        rc_enable=args.rc_enable,
+        rc_http_port=http_port,
+        rc_ws_port=ws_port,
+        start_rc=True,
+        exec_cmd=[],
+        extra_arg=[f"-abslog={log_path}"] if log_path else [],
+    )
+    cmd = build_command(launch_args)
+    print(shlex.join(cmd))
+    return subprocess.Popen(cmd)
+
+
+def wait_until_ready(
+    args: argparse.Namespace,
+    port: int,
+    unreal_process: subprocess.Popen,
+    log: LogFollower | None = None,
+) -> None:
+    wait_for_info(
+        args.rc_host,
+        port,
+        args.timeout,
+        args.interval,
+        process=unreal_process,
+        log=log,
+    )
+    print(f"Remote Control ready on port {port}.")
+
+    if not args.object_path:
+        return
+
+    call_url = f"http://{args.rc_host}:{port}/remote/object/call"
+    payload = {
+        "objectPath": args.object_path,
+        "functionName": args.ping_function,
+        "parameters": {},
+    }
+    http_put_json(call_url, payload, timeout=args.timeout)
+
+
+def stop_unreal(process: subprocess.Popen) -> None:
+    if process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def run_pytest(
+    args: argparse.Namespace,
+    index: int,
+    tests: list[str],
+    port: int,
+    ws_port: int | None,
+    junit_path: Path | None,
+    unreal_process: subprocess.Popen,
+) -> int:
+    pytest_cmd = ["pytest", *tests, *args.pytest_arg]
+    if args.reset_object:
+        pytest_cmd.extend(["-p", "rc_state"])
+        pytest_cmd.extend(f"--rc-state-object={spec}" for spec in args.reset_object)
+    if junit_path:
+        pytest_cmd.append(f"--junitxml={junit_path}")
+    env = dict(
+        os.environ,
+        UE_RC_HOST=args.rc_host,
+        UE_RC_PORT=str(port),
+        UE_E2E_WORKER=str(index),
+    )
+    if ws_port:
+        env["UE_RC_WS_PORT"] = str(ws_port)
+    # Lets tests import the helpers and load `-p ue_monitor` / `-p rc_trace`.
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(SCRIPT_DIR), env.get("PYTHONPATH")])
+    )
+
+    monitor = None
+    if args.monitor:
+        # Imported here: the /proc sampler is Linux-only.
+        from ue_monitor import (
+            MARKS_ENV,
+            ProcessMonitor,
+            format_top_growth,
+            write_report,
+        )
+
+        monitor_dir = Path(args.monitor)
+        if args.workers > 1:
+            monitor_dir = monitor_dir / f"worker-{index}"
+        monitor_dir.mkdir(parents=True, exist_ok=True)
+        marks_path = monitor_dir / "marks.ndjson"
+        marks_path.unlink(missing_ok=True)
+        pytest_cmd.extend(["-p", "ue_monitor"])
+        env[MARKS_ENV] = str(marks_path)
+        monitor = ProcessMonitor(unreal_process.pid, args.monitor_interval).start()
+
+    exit_code = subprocess.call(pytest_cmd, env=env)
+
+    if monitor:
+        summary = write_report(monitor.stop(), marks_path, monitor_dir)
+        print(f"Worker {index}: {format_top_growth(summary)}")
+
+    return exit_code
+
+
+def run_worker(
+    args: argparse.Namespace,
+    index: int,
+    tests: list[str],
+    http_port: int | None,
+    ws_port: int | None,
+    junit_path: Path | None,
+) -> int:
+    port = http_port or args.rc_port
+    log_path = None
+    if args.ue_log:
+        log_path = Path(args.ue_log).resolve() / f"worker-{index}.log"
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        # A stale log from the last run would satisfy the milestones early.
+        log_path.unlink(missing_ok=True)
+    unreal_process = launch_unreal(args, http_port, ws_port, log_path)
+
+    # Keeps following after readiness so a crash mid-test is reported at once.
+    stop_log = threading.Event()
+    completed = False
+    try:
+        log = follow_log(log_path, stop_log, port) if log_path else None
+        try:
+            wait_until_ready(args, port, unreal_process, log)
+        except (RuntimeError, TimeoutError, urllib.error.URLError) as exc:
+            print(f"Worker {index}: {exc}")
+            if log:
+                print(log.log.format_breakdown())
+            return 1
+        if log:
+            print(f"Worker {index}: {log.log.format_breakdown()}")
+
+        exit_code = run_pytest(
+            args, index, tests, port, ws_port, junit_path, unreal_process
+        )
+        completed = True
+        return exit_code
+    finally:
+        stop_log.set()
+        # An error or Ctrl+C must not leave Unreal holding the worker's ports.
+        if not (completed and args.keep_alive):
+            stop_unreal(unreal_process)
+
+
+def run_parallel(args: argparse.Namespace) -> int:
+    shards = distribute_files(discover_test_files(args.tests), args.workers)
+    if not shards:
+        print(f"No test files found under {args.tests}.")
+        return 5
+
+    ports = allocate_port_pairs(args.rc_host, len(shards))
+    with tempfile.TemporaryDirectory(prefix="ue-e2e-") as tmp:
+        junit_paths = [Path(tmp) / f"worker-{i}.xml" for i in range(len(shards))]
+        with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+            futures = [
+                pool.submit(
+                    run_worker,
+                    args,
+                    index,
+                    [str(path) for path in shard],
+                    http_port,
+                    ws_port,
+                    junit_paths[index],
+                )
+                for index, (shard, (http_port, ws_port)) in enumerate(
+                    zip(shards, ports)
+                )
+            ]
+            exit_codes = [future.result() for future in futures]
+
+        if args.junitxml:
+            merge_junit(junit_paths, Path(args.junitxml))
+
+    for index, code in enumerate(exit_codes):
+        print(f"Worker {index} (port {ports[index][0]}): exit code {code}")
+    return max(exit_codes)
+
+
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Launch Unreal, wait for Remote Control, then run pytest."
     )
@@ -23,6 +297,9 @@ def main() -> int:
     parser.add_argument("--object-path", help="Automation actor object path.")
     parser.add_argument("--ping-function", default="Ping")
     parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument(
+        "--interval", type=float, default=0.5, help="Readiness poll interval."
+    )
     parser.add_argument("--tests", default="tests", help="Pytest path or node id.")
     parser.add_argument(
         "--pytest-arg",
@@ -30,60 +307,50 @@ def main() -> int:
         default=[],
         help="Extra pytest args (repeatable).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Unreal instances to run test files across, each on its own ports.",
+    )
+    parser.add_argument("--junitxml", help="Write (merged) JUnit XML here.")
+    parser.add_argument(
+        "--reset-object",
+        action="append",
+        default=[],
+        help="Restore this object's changed properties after every test, "
+        "optionally PATH=Prop1,Prop2 (repeatable).",
+    )
+    parser.add_argument(
+        "--monitor",
+        help="Sample Unreal CPU/RSS/threads/I/O into this directory while tests run.",
+    )
+    parser.add_argument(
+        "--monitor-interval",
+        type=float,
+        default=0.5,
+        help="Seconds between resource samples.",
+    )
+    parser.add_argument(
+        "--ue-log",
+        help="Write each Unreal log here (-abslog) and follow it for startup "
+        "milestones, phase timings and fatal errors.",
+    )
     parser.add_argument(
         "--keep-alive",
         action="store_true",
         help="Do not terminate Unreal after tests.",
     )
-    args = parser.parse_args()
-
-    script_dir = Path(__file__).resolve().parent
-    launch_cmd = [
-        sys.executable,
-        str(script_dir / "ue_launch.py"),
-        "--exe",
-        args.ue_exe,
-    ]
-    if args.uproject:
-        launch_cmd.extend(["--uproject", args.uproject])
-    if args.map:
-        launch_cmd.extend(["--map", args.map])
-    if args.rc_enable:
-        launch_cmd.append("--rc-enable")
-
-    unreal_process = subprocess.Popen(launch_cmd)
-
-    wait_cmd = [
-        sys.executable,
-        str(script_dir / "rc_wait_ready.py"),
-        "--host",
-        args.rc_host,
-        "--port",
-        str(args.rc_port),
-        "--timeout",
-        str(args.timeout),
-    ]
-    if args.object_path:
-        wait_cmd.extend(["--object-path", args.object_path])
-        wait_cmd.extend(["--function", args.ping_function])
+    args = parser.parse_args(argv)
 
-    try:
-        subprocess.check_call(wait_cmd)
-    except subprocess.CalledProcessError:
-        unreal_process.terminate()
-        return 1
-
-    pytest_cmd = ["pytest", args.tests, *args.pytest_arg]
-    exit_code = subprocess.call(pytest_cmd)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
-    if not args.keep_alive:
-        unreal_process.terminate()
-        try:
-            unreal_process.wait(timeout=10)
-        except subprocess.TimeoutExpired:
-            unreal_process.kill()
+    if args.workers > 1:
+        return run_parallel(args)
 
-    return exit_code
+    junit_path = Path(args.junitxml) if args.junitxml else None
+    return run_worker(args, 0, [args.tests], None, None, junit_path)
 
 
 if __name__ == "__main__":
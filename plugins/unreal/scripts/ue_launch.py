@@ -4,6 +4,8 @@ import argparse
 import shlex
 import subprocess
 
+RC_SETTINGS_SECTION = "[/Script/RemoteControlCommon.RemoteControlSettings]"
+
 
 def build_command(args: argparse.Namespace):
     cmd = [args.exe]
@@ -17,6 +19,17 @@ def build_command(args: argparse.Namespace):
     if args.rc_enable:
         cmd.extend(["-RCWebControlEnable", "-RCWebInterfaceEnable"])
 
+    if args.rc_http_port:
+        cmd.append(
+            f"-ini:RemoteControl:{RC_SETTINGS_SECTION}:"
+            f"RemoteControlHttpServerPort={args.rc_http_port}"
+        )
+    if args.rc_ws_port:
+        cmd.append(
+            f"-ini:RemoteControl:{RC_SETTINGS_SECTION}:"
+            f"RemoteControlWebSocketServerPort={args.rc_ws_port}"
+        )
+
     exec_cmds = []
     if args.start_rc:
         exec_cmds.append("WebControl.StartServer")
@@ -47,6 +60,16 @@ def main() -> int:
         action="store_true",
         help="Add RC flags for packaged builds.",
     )
+    parser.add_argument(
+        "--rc-http-port",
+        type=int,
+        help="Override the Remote Control HTTP port (default 30010).",
+    )
+    parser.add_argument(
+        "--rc-ws-port",
+        type=int,
+        help="Override the Remote Control WebSocket port (default 30020).",
+    )
     parser.add_argument(
         "--start-rc",
         dest="start_rc",
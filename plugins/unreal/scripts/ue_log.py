@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+
+import argparse
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+# Startup milestones in launch order; readiness is the Remote Control server.
+MILESTONES = (
+    (
+        "engine_init",
+        re.compile(r"Engine is initialized|\(Engine Initialization\) Total time"),
+    ),
+    (
+        "map_loaded",
+        re.compile(
+            r"Took [\d.]+ seconds to LoadMap\((?P<map>[^)]*)\)"
+            r"|Bringing World (?P<world>\S+) up for play"
+        ),
+    ),
+    (
+        "rc_server",
+        re.compile(
+            r"Created new HttpListener on \S+:(?P<port>\d+)"
+            r"|Web ?Remote ?Control\b.*\bstarted",
+            re.IGNORECASE,
+        ),
+    ),
+)
+READY_MILESTONE = "rc_server"
+FATAL = re.compile(
+    r"Fatal error|=== Critical error: ===|Assertion failed:|Unhandled Exception"
+    r"|appError called|Failed to load map|: Fatal:"
+)
+# "[2024.05.01-10.11.12:345][  0]LogInit: Display: ..." with -abslog/-log.
+PREFIX = re.compile(
+    r"^(?:\[(?P<stamp>\d{4}\.\d\d\.\d\d-\d\d\.\d\d\.\d\d:\d{3})\])?(?:\[\s*\d+\])?"
+)
+CATEGORY = re.compile(r"^(?P<category>Log\w+):(?: (?P<verbosity>\w+):)?")
+
+
+@dataclass
+class Phase:
+    name: str
+    start: float
+    end: float | None = None
+    categories: Counter = field(default_factory=Counter)
+
+
+def parse_stamp(stamp: str) -> float:
+    return datetime.strptime(stamp, "%Y.%m.%d-%H.%M.%S:%f").timestamp()
+
+
+class StartupLog:
+    def __init__(
+        self,
+        rc_port: int | None = None,
+        on_fatal: Callable[[str], None] | None = None,
+    ) -> None:
+        self.rc_port = rc_port
+        self.on_fatal = on_fatal or (
+            lambda line: print(f"UNREAL FATAL: {line}", flush=True)
+        )
+        self.start: float | None = None
+        self.last_time: float | None = None
+        self.last_line = ""
+        self.phases = [Phase("launch", 0.0)]
+        self.reached: dict[str, float] = {}
+        self.details: dict[str, str] = {}
+        self.fatal: list[str] = []
+        self.errors = 0
+        self.warnings = 0
+        self.lines = 0
+
+    def feed(self, line: str, at: float) -> None:
+        line = line.rstrip("\r\n")
+        prefix = PREFIX.match(line)
+        text = line[prefix.end() :]
+        if self.start is None:
+            self.start = at
+        self.last_time = at
+        self.last_line = text
+        self.lines += 1
+        elapsed = at - self.start
+
+        category = CATEGORY.match(text)
+        if category:
+            self.phases[-1].categories[category.group("category")] += 1
+            verbosity = category.group("verbosity")
+            if verbosity == "Error":
+                self.errors += 1
+            elif verbosity == "Warning":
+                self.warnings += 1
+
+        if FATAL.search(text):
+            self.fatal.append(text)
+            self.on_fatal(text)
+
+        for name, pattern in MILESTONES:
+            if name in self.reached:
+                continue
+            match = pattern.search(text)
+            if not match:
+                continue
+            port = match.groupdict().get("port")
+            if name == READY_MILESTONE and port and self.rc_port:
+                if int(port) != self.rc_port:
+                    continue
+            self.reached[name] = elapsed
+            self.details[name] = next((v for v in match.groupdict().values() if v), "")
+            self.phases[-1].name = name
+            self.phases[-1].end = elapsed
+            self.phases.append(Phase("after " + name, elapsed))
+
+    @property
+    def ready(self) -> bool:
+        return READY_MILESTONE in self.reached
+
+    def progress(self) -> str:
+        if self.start is None:
+            return "no Unreal log output yet"
+        if self.reached:
+            name, seconds = max(self.reached.items(), key=lambda item: item[1])
+            state = f"last milestone {name} at {seconds:.1f}s"
+        else:
+            state = "no milestone reached"
+        busy = self.phases[-1].categories.most_common(1)
+        if busy:
+            state += f", busy with {busy[0][0]} ({busy[0][1]} lines)"
+        return f"{state}; last log line: {self.last_line[:160]}"
+
+    def format_breakdown(self) -> str:
+        if self.start is None:
+            return "No Unreal log output."
+        total = self.reached.get(READY_MILESTONE)
+        title = (
+            f"Startup: {total:.1f}s to Remote Control"
+            if total is not None
+            else f"Startup: not ready after {self.last_time - self.start:.1f}s of log"
+        )
+        lines = [
+            f"{title} ({self.lines} lines, "
+            f"{self.errors} errors, {self.warnings} warnings)"
+        ]
+        for phase in self.phases:
+            end = phase.end if phase.end is not None else self.last_time - self.start
+            if phase.end is None and not phase.categories:
+                continue
+            top = ", ".join(
+                f"{name} {count}" for name, count in phase.categories.most_common(3)
+            )
+            detail = self.details.get(phase.name, "")
+            label = f"{phase.name} ({detail})" if detail else phase.name
+            lines.append(f"  {end - phase.start:7.1f}s  {label:<40}  {top}")
+        for line in self.fatal:
+            lines.append(f"  FATAL: {line}")
+        return "\n".join(lines)
+
+
+def follow_file(
+    path: Path, stop: threading.Event, interval: float = 0.05
+) -> Iterator[str]:
+    # Tail a log that may not exist yet or may be truncated by a new run.
+    handle = None
+    pending = ""
+    try:
+        while not stop.is_set():
+            if handle is None:
+                try:
+                    handle = open(path, encoding="utf-8-sig", errors="replace")
+                except FileNotFoundError:
+                    stop.wait(interval)
+                    continue
+            chunk = handle.read()
+            if not chunk:
+                try:
+                    if path.stat().st_size < handle.tell():
+                        handle.seek(0)
+                        pending = ""
+                except FileNotFoundError:
+                    pass
+                stop.wait(interval)
+                continue
+            pending += chunk
+            *lines, pending = pending.split("\n")
+            yield from lines
+    finally:
+        if handle:
+            handle.close()
+
+
+class LogFollower:
+    def __init__(self, lines: Iterable[str], log: StartupLog) -> None:
+        self.lines = lines
+        self.log = log
+        # Set when the server is up, a fatal error appears or the log ends.
+        self.wake = threading.Event()
+        self.ended = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "LogFollower":
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        for line in self.lines:
+            self.log.feed(line, time.monotonic())
+            if self.log.ready or self.log.fatal:
+                self.wake.set()
+        self.ended = True
+        self.wake.set()
+
+    def check(self) -> None:
+        if self.log.fatal:
+            raise RuntimeError(f"Unreal reported a fatal error: {self.log.fatal[0]}")
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self._thread.join(timeout)
+
+
+def follow_log(
+    path: Path, stop: threading.Event, rc_port: int | None = None
+) -> LogFollower:
+    return LogFollower(follow_file(path, stop), StartupLog(rc_port)).start()
+
+
+def replay(path: Path, rc_port: int | None = None) -> StartupLog:
+    # Timings from the log's own timestamps, for a run that already finished.
+    log = StartupLog(rc_port)
+    last = 0.0
+    with open(path, encoding="utf-8-sig", errors="replace") as handle:
+        for line in handle:
+            stamp = PREFIX.match(line).group("stamp")
+            if stamp:
+                last = parse_stamp(stamp)
+            log.feed(line, last)
+    return log
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Follow an Unreal log until Remote Control starts, "
+        "with phase timings."
+    )
+    parser.add_argument("log", help="Log file, e.g. one written with -abslog=PATH.")
+    parser.add_argument(
+        "--rc-port", type=int, help="Only this HttpListener port counts."
+    )
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Read a finished log once, timing phases from its timestamps.",
+    )
+    args = parser.parse_args()
+
+    if args.replay:
+        log = replay(Path(args.log), args.rc_port)
+        print(log.format_breakdown())
+        return 0 if log.ready and not log.fatal else 1
+
+    stop = threading.Event()
+    follower = follow_log(Path(args.log), stop, args.rc_port)
+    ready = follower.wake.wait(args.timeout)
+    stop.set()
+    follower.stop()
+    print(follower.log.format_breakdown())
+    if follower.log.fatal:
+        return 1
+    if not ready or not follower.log.ready:
+        print(f"Not ready: {follower.log.progress()}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
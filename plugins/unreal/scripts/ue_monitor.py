@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+
+import argparse
+import bisect
+import csv
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+MARKS_ENV = "UE_MONITOR_MARKS"
+SAMPLE_FIELDS = ("time", "cpu_s", "rss_bytes", "threads", "read_bytes", "write_bytes")
+
+
+@dataclass
+class Sample:
+    time: float
+    cpu_s: float
+    rss_bytes: int
+    threads: int
+    read_bytes: int
+    write_bytes: int
+
+
+@cache
+def proc_units() -> tuple[int, int]:
+    # Resolved on first sample; os.sysconf does not exist on Windows.
+    return os.sysconf("SC_CLK_TCK"), os.sysconf("SC_PAGE_SIZE")
+
+
+def read_stat(pid: int) -> tuple[int, float, int, int] | None:
+    try:
+        text = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return None
+    # comm may contain spaces or parens, so split after the last ')'.
+    fields = text[text.rindex(")") + 2 :].split()
+    clock_ticks, page_size = proc_units()
+    ppid = int(fields[1])
+    cpu_s = (int(fields[11]) + int(fields[12])) / clock_ticks
+    threads = int(fields[17])
+    rss_bytes = int(fields[21]) * page_size
+    return ppid, cpu_s, threads, rss_bytes
+
+
+def read_io(pid: int) -> tuple[int, int]:
+    values = {}
+    try:
+        for line in Path(f"/proc/{pid}/io").read_text().splitlines():
+            key, _, value = line.partition(":")
+            values[key] = int(value)
+    except (OSError, ValueError):
+        return 0, 0
+    return values.get("read_bytes", 0), values.get("write_bytes", 0)
+
+
+def process_tree(root_pid: int) -> list[int]:
+    children: dict[int, list[int]] = {}
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        stat = read_stat(int(entry.name))
+        if stat:
+            children.setdefault(stat[0], []).append(int(entry.name))
+    tree = [root_pid]
+    for pid in tree:
+        tree.extend(children.get(pid, []))
+    return tree
+
+
+def sample_tree(root_pid: int) -> Sample | None:
+    sample = Sample(time.time(), 0.0, 0, 0, 0, 0)
+    seen = False
+    for pid in process_tree(root_pid):
+        stat = read_stat(pid)
+        if stat is None:
+            continue
+        seen = True
+        _, cpu_s, threads, rss_bytes = stat
+        read_bytes, write_bytes = read_io(pid)
+        sample.cpu_s += cpu_s
+        sample.threads += threads
+        sample.rss_bytes += rss_bytes
+        sample.read_bytes += read_bytes
+        sample.write_bytes += write_bytes
+    return sample if seen else None
+
+
+class ProcessMonitor:
+    def __init__(self, pid: int, interval: float = 0.5) -> None:
+        self.pid = pid
+        self.interval = interval
+        self.samples: list[Sample] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "ProcessMonitor":
+        self._thread.start()
+        return self
+
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def stop(self) -> list[Sample]:
+        self._stop.set()
+        self._thread.join()
+        return self.samples
+
+    def _run(self) -> None:
+        while True:
+            sample = sample_tree(self.pid)
+            if sample is None:
+                return
+            self.samples.append(sample)
+            if self._stop.wait(self.interval):
+                return
+
+
+def write_samples(samples: list[Sample], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(SAMPLE_FIELDS)
+        for s in samples:
+            writer.writerow(
+                [
+                    f"{s.time:.3f}",
+                    f"{s.cpu_s:.2f}",
+                    s.rss_bytes,
+                    s.threads,
+                    s.read_bytes,
+                    s.write_bytes,
+                ]
+            )
+
+
+def read_marks(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    with path.open() as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def summarize_window(
+    samples: list[Sample], times: list[float], start: float, end: float
+) -> dict:
+    # Baseline is the last sample at or before start;
+    # close is the first at or after end.
+    first = max(bisect.bisect_right(times, start) - 1, 0)
+    last = min(bisect.bisect_left(times, end), len(samples) - 1)
+    window = samples[first : last + 1]
+    base, close = window[0], window[-1]
+    return {
+        "duration_s": round(end - start, 3),
+        "cpu_s": round(close.cpu_s - base.cpu_s, 2),
+        "rss_start_bytes": base.rss_bytes,
+        "rss_end_bytes": close.rss_bytes,
+        "rss_peak_bytes": max(s.rss_bytes for s in window),
+        "rss_delta_bytes": close.rss_bytes - base.rss_bytes,
+        "threads_peak": max(s.threads for s in window),
+        "read_bytes": close.read_bytes - base.read_bytes,
+        "write_bytes": close.write_bytes - base.write_bytes,
+    }
+
+
+def summarize(samples: list[Sample], marks: list[dict]) -> dict:
+    if not samples:
+        return {"samples": 0, "tests": {}}
+    times = [s.time for s in samples]
+    summary = summarize_window(samples, times, times[0], times[-1])
+    summary["samples"] = len(samples)
+    summary["tests"] = {
+        mark["nodeid"]: summarize_window(samples, times, mark["start"], mark["end"])
+        for mark in marks
+    }
+    return summary
+
+
+def write_report(samples: list[Sample], marks_path: Path, output_dir: Path) -> dict:
+    write_samples(samples, output_dir / "samples.csv")
+    summary = summarize(samples, read_marks(marks_path))
+    (output_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+    return summary
+
+
+def format_top_growth(summary: dict, limit: int = 5) -> str:
+    tests = sorted(
+        summary["tests"].items(),
+        key=lambda item: item[1]["rss_delta_bytes"],
+        reverse=True,
+    )[:limit]
+    lines = [
+        f"Unreal RSS peak {summary.get('rss_peak_bytes', 0) / 1048576:.1f} MiB, "
+        f"CPU {summary.get('cpu_s', 0):.1f}s over {summary['samples']} samples."
+    ]
+    for nodeid, stats in tests:
+        lines.append(
+            f"  {stats['rss_delta_bytes'] / 1048576:+8.1f} MiB "
+            f"{stats['cpu_s']:7.2f}s cpu  {nodeid}"
+        )
+    return "\n".join(lines)
+
+
+# pytest plugin: load with `-p ue_monitor` to record test boundaries for the monitor.
+
+_test_starts: dict[str, float] = {}
+
+
+def pytest_runtest_logstart(nodeid, location):
+    _test_starts[nodeid] = time.time()
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    marks_path = os.environ.get(MARKS_ENV)
+    start = _test_starts.pop(nodeid, None)
+    if not marks_path or start is None:
+        return
+    with open(marks_path, "a") as handle:
+        handle.write(
+            json.dumps({"nodeid": nodeid, "start": start, "end": time.time()}) + "\n"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Sample CPU, RSS, threads and I/O of a process tree from /proc."
+    )
+    parser.add_argument("--pid", type=int, required=True, help="Root process id.")
+    parser.add_argument("--interval", type=float, default=0.5, help="Sample period.")
+    parser.add_argument("--output", default="monitor", help="Output directory.")
+    parser.add_argument(
+        "--marks", help="NDJSON test boundaries written by the pytest plugin."
+    )
+    args = parser.parse_args()
+
+    monitor = ProcessMonitor(args.pid, args.interval).start()
+    try:
+        while monitor.running():
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    samples = monitor.stop()
+
+    output_dir = Path(args.output)
+    marks_path = Path(args.marks) if args.marks else output_dir / "marks.ndjson"
+    summary = write_report(samples, marks_path, output_dir)
+    print(format_top_growth(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())